@@ -0,0 +1,3 @@
+"""
+Benchmarks module - Mesures de performance (rendu, simulation, commandes)
+"""
@@ -0,0 +1,143 @@
+"""
+Microbenchmarks d'OrderManager - Débit et mémoire selon la taille de la file
+✅ ops/s de add_order, assign_order_to_chef, add_ingredient_to_chef,
+   complete_chef_order, get_status_summary, cancel_order et expire_orders
+✅ Mémoire par commande en file (tracemalloc)
+✅ Files de 1e3 à 1e6 commandes : la courbe révèle les coûts O(n)
+
+Usage:
+    python -m benchmarks.orders --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import contextlib
+import time
+import tracemalloc
+
+from config import competition_recipes
+from entities.order_manager import OrderManager
+from game.simulation import NullOutput
+
+CHEF_OPERATIONS = 1000  # commandes assignées/préparées/livrées par taille de file
+SUMMARY_CALLS = 200
+
+
+def fill_queue(order_manager, size):
+    """Remplit la file avec size commandes (recettes en rotation) et retourne leurs ids"""
+    recipe_names = sorted(competition_recipes)
+    order_ids = []
+    for i in range(size):
+        name = recipe_names[i % len(recipe_names)]
+        order_ids.append(order_manager.add_order(name, competition_recipes[name]))
+    return order_ids
+
+
+def measure_memory_per_order(size):
+    """Octets alloués par commande en file"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        order_manager = OrderManager()
+        fill_queue(order_manager, size)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / size
+
+
+def rate(operations, start):
+    """ops/s depuis start (perf_counter), None si aucune opération n'a été faite"""
+    if not operations:
+        return None
+    return operations / (time.perf_counter() - start)
+
+
+def benchmark_orders(size):
+    """
+    Mesure chaque opération d'OrderManager avec une file de size commandes
+
+    Returns:
+        dict: {opération: ops/s (None si non mesurable), 'bytes_per_order': octets}
+    """
+    results = {}
+    with contextlib.redirect_stdout(NullOutput()):
+        order_manager = OrderManager()
+
+        start = time.perf_counter()
+        order_ids = fill_queue(order_manager, size)
+        results["add_order"] = rate(size, start)
+
+        # Au plus la moitié de la file est assignée : cancel/expire mesurent des commandes encore en file
+        chefs = range(min(size // 2, CHEF_OPERATIONS))
+
+        start = time.perf_counter()
+        for bot_id in chefs:
+            order_manager.assign_order_to_chef(bot_id, f"Chef {bot_id}")
+        results["assign_order_to_chef"] = rate(len(chefs), start)
+
+        ingredient_calls = 0
+        start = time.perf_counter()
+        for bot_id in chefs:
+            for ingredient in order_manager.chef_orders[bot_id]['order_data']['ingredients']:
+                order_manager.add_ingredient_to_chef(bot_id, ingredient)
+                ingredient_calls += 1
+        results["add_ingredient_to_chef"] = rate(ingredient_calls, start)
+
+        start = time.perf_counter()
+        for _ in range(SUMMARY_CALLS):
+            order_manager.get_status_summary()
+        results["get_status_summary"] = rate(SUMMARY_CALLS, start)
+
+        start = time.perf_counter()
+        for bot_id in chefs:
+            order_manager.complete_chef_order(bot_id)
+        results["complete_chef_order"] = rate(len(chefs), start)
+
+        # Annulation des dernières commandes arrivées, en laissant la moitié de la file à expirer
+        cancel_count = min(len(chefs), order_manager.get_available_count() // 2)
+        cancelled = order_ids[len(order_ids) - cancel_count:]
+        start = time.perf_counter()
+        for order_id in cancelled:
+            order_manager.cancel_order(order_id)
+        results["cancel_order"] = rate(len(cancelled), start)
+
+        # Tout le reste de la file expire d'un coup
+        remaining = order_manager.get_available_count()
+        start = time.perf_counter()
+        order_manager.expire_orders(now=float("inf"))
+        results["expire_orders"] = rate(remaining, start)
+
+        results["bytes_per_order"] = measure_memory_per_order(size)
+
+    return results
+
+
+def format_rate(rate):
+    """Colonne ops/s, "n/a" quand l'opération n'a rien eu à traiter"""
+    return "n/a".rjust(14) if rate is None else f"{rate:14,.0f}"
+
+
+def print_results(results):
+    """Affiche ops/s et mémoire par taille de file"""
+    sizes = list(results)
+    operations = ["add_order", "assign_order_to_chef", "add_ingredient_to_chef",
+                  "complete_chef_order", "get_status_summary", "cancel_order", "expire_orders"]
+    width = max(len(name) for name in operations) + 2
+
+    print("=" * (width + 14 * len(sizes)))
+    print("MINI OVERCOOKED - MICROBENCHMARKS ORDERMANAGER (ops/s)")
+    print(f"({CHEF_OPERATIONS} chefs actifs, get_status_summary avec ces chefs)")
+    print("=" * (width + 14 * len(sizes)))
+    print("file".ljust(width) + "".join(f"{size:,}".rjust(14) for size in sizes))
+    for name in operations:
+        print(name.ljust(width) + "".join(format_rate(results[size][name]) for size in sizes))
+    print("-" * (width + 14 * len(sizes)))
+    print("octets/commande".ljust(width) + "".join(f"{results[size]['bytes_per_order']:14.0f}" for size in sizes))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmarks d'OrderManager")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                        help="Tailles de la file de commandes")
+    args = parser.parse_args()
+
+    print_results({size: benchmark_orders(size) for size in args.sizes})
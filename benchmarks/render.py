@@ -0,0 +1,156 @@
+"""
+Benchmark du rendu - Coût de chaque étape de dessin par frame
+✅ Surface hors écran avec le driver SDL "dummy" (aucune fenêtre)
+✅ ms/frame par étape et FPS non plafonné (sans clock.tick(60))
+✅ Cuisine vivante : la simulation avance d'un tick entre deux frames
+✅ Taux de succès du cache de texte partagé
+
+Usage:
+    python -m benchmarks.render --frames 300 --chefs 2 10 50
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import game_state
+from config import WIDTH, HEIGHT, competition_recipes
+from game.simulation import KitchenSimulation
+from utils.text_cache import text_cache
+
+WARMUP_TICKS = 300  # chefs en pleine activité avant de mesurer
+
+
+def build_scenario(chef_count):
+    """Scénario avec chef_count chefs et une file de commandes saturée"""
+    spacing = 400 / max(1, chef_count)
+    chefs = [{"name": f"Chef {i + 1}", "x": 300 + i * spacing, "y": 400, "color_variant": i % 2}
+             for i in range(chef_count)]
+    recipe_names = sorted(competition_recipes)
+    orders = [recipe_names[i % len(recipe_names)] for i in range(chef_count * 10)]
+    return {"chefs": chefs, "orders": orders}
+
+
+def build_stages(screen, kitchen_renderer, ui_renderer, asset_manager, simulation):
+    """Étapes du rendu de main(), dans le même ordre"""
+    from main import draw_competition_hud
+
+    frame = {}
+
+    def capture():
+        # Ce que main() dessine : le snapshot publié par la simulation
+        frame["snapshot"] = simulation.snapshot()
+        kitchen_renderer.set_snapshot(frame["snapshot"])
+
+    def draw_chefs():
+        for chef in frame["snapshot"].chefs:
+            kitchen_renderer.draw_chef_enhanced(chef, asset_manager)
+
+    def render_ui():
+        snapshot = frame["snapshot"]
+        primary_chef = snapshot.chefs[0] if snapshot.chefs else None
+        ui_renderer.render_full_ui(snapshot.score, snapshot.timer, snapshot.combo,
+                                   primary_chef, game_state.user_input, None, [],
+                                   asset_manager, plated_dish=None)
+
+    return [
+        ("snapshot", capture),
+        ("draw_background", kitchen_renderer.draw_background),
+        ("draw_individual_ingredient_stations",
+         lambda: kitchen_renderer.draw_individual_ingredient_stations(asset_manager)),
+        ("draw_work_station", lambda: kitchen_renderer.draw_work_station(asset_manager)),
+        ("draw_plating_station", lambda: kitchen_renderer.draw_plating_station(asset_manager)),
+        ("draw_service_station", kitchen_renderer.draw_service_station),
+        ("draw_chef_enhanced", draw_chefs),
+        ("draw_chef_status", lambda: kitchen_renderer.draw_chef_status(frame["snapshot"].chefs[0])),
+        ("render_full_ui", render_ui),
+        ("hud (main.py)", lambda: draw_competition_hud(screen, frame["snapshot"]))
+    ]
+
+
+def benchmark_render(chef_count, frames):
+    """
+    Mesure le coût de chaque étape de rendu pour chef_count chefs
+
+    Returns:
+        dict: {'stages': {nom: ms/frame}, 'frame_ms', 'fps', 'sim_ms', 'text_cache'}
+    """
+    from graphics.assets import AssetManager
+    from graphics.kitchen import KitchenRenderer
+    from graphics.ui import UIRenderer
+
+    previous_clock = game_state.clock
+    try:
+        simulation = KitchenSimulation(build_scenario(chef_count))
+        screen = pygame.Surface((WIDTH, HEIGHT))
+        kitchen_renderer = KitchenRenderer(screen)
+        ui_renderer = UIRenderer(screen)
+        asset_manager = AssetManager()
+
+        zones = kitchen_renderer.get_interaction_zones()
+        for bot in simulation.bot_manager.bots:
+            bot.update_interaction_zones(zones)
+        simulation.run(WARMUP_TICKS)
+
+        stages = build_stages(screen, kitchen_renderer, ui_renderer, asset_manager, simulation)
+        text_cache.clear()
+        totals = {name: 0.0 for name, _ in stages}
+        sim_total = 0.0
+
+        for _ in range(frames):
+            start = time.perf_counter()
+            simulation.step()
+            sim_total += time.perf_counter() - start
+
+            for name, stage in stages:
+                start = time.perf_counter()
+                stage()
+                totals[name] += time.perf_counter() - start
+    finally:
+        game_state.set_clock(previous_clock)
+
+    stage_ms = {name: total * 1000 / frames for name, total in totals.items()}
+    frame_ms = sum(stage_ms.values())
+    return {
+        "stages": stage_ms,
+        "frame_ms": frame_ms,
+        "fps": 1000 / frame_ms if frame_ms > 0 else 0,
+        "sim_ms": sim_total * 1000 / frames,
+        "text_cache": text_cache.get_stats()
+    }
+
+
+def print_results(results):
+    """Affiche un tableau ms/frame par étape et par nombre de chefs"""
+    chef_counts = list(results)
+    stage_names = list(results[chef_counts[0]]["stages"])
+    width = max(len(name) for name in stage_names) + 2
+
+    print("=" * (width + 12 * len(chef_counts)))
+    print("MINI OVERCOOKED - BENCHMARK DU RENDU (ms/frame)")
+    print("=" * (width + 12 * len(chef_counts)))
+    print("étape".ljust(width) + "".join(f"{count} chefs".rjust(12) for count in chef_counts))
+    for name in stage_names:
+        print(name.ljust(width) + "".join(f"{results[count]['stages'][name]:12.3f}" for count in chef_counts))
+    print("-" * (width + 12 * len(chef_counts)))
+    print("total rendu".ljust(width) + "".join(f"{results[count]['frame_ms']:12.3f}" for count in chef_counts))
+    print("simulation (1 tick)".ljust(width) + "".join(f"{results[count]['sim_ms']:12.3f}" for count in chef_counts))
+    print("FPS non plafonné".ljust(width) + "".join(f"{results[count]['fps']:12.1f}" for count in chef_counts))
+    print("cache texte (succès)".ljust(width) + "".join(f"{results[count]['text_cache']['hit_rate']:12.1%}" for count in chef_counts))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark du rendu de Mini Overcooked")
+    parser.add_argument("--frames", type=int, default=300, help="Frames mesurées par configuration")
+    parser.add_argument("--chefs", type=int, nargs="+", default=[2, 10, 50], help="Nombres de chefs")
+    args = parser.parse_args()
+
+    pygame.init()
+    try:
+        print_results({count: benchmark_render(count, args.frames) for count in args.chefs})
+    finally:
+        pygame.quit()
@@ -0,0 +1,130 @@
+"""
+Benchmark de la simulation - Montée en charge selon le nombre de chefs
+✅ Ticks/seconde de BotManager.update() avec une file de commandes saturée
+✅ Coût par appel des méthodes chaudes (get_chef_progress, is_available, try_claim_order)
+✅ µs par chef et par tick : montre où le polling par bot devient superlinéaire
+
+Usage:
+    python -m benchmarks.scaling --chefs 2 10 100 1000 --ticks 300
+"""
+import argparse
+import time
+
+import game_state
+from config import competition_recipes
+from game.simulation import KitchenSimulation
+
+WARMUP_TICKS = 60
+
+
+def build_scenario(chef_count):
+    """Scénario avec chef_count chefs et une file de commandes qui ne se vide jamais"""
+    spacing = 400 / max(1, chef_count)
+    chefs = [{"name": f"Chef {i + 1}", "x": 300 + i * spacing, "y": 400, "color_variant": i % 2}
+             for i in range(chef_count)]
+    recipe_names = sorted(competition_recipes)
+    orders = [recipe_names[i % len(recipe_names)] for i in range(chef_count * 10)]
+    return {"chefs": chefs, "orders": orders}
+
+
+def time_per_call(function, items, repeat=3):
+    """Meilleur temps moyen (µs) d'un appel de function sur chaque élément"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / max(1, len(items))
+
+
+def benchmark_claims(chef_count):
+    """
+    Coût de try_claim_order : prise d'une nouvelle commande puis appel
+    par un chef déjà occupé (chemin le plus fréquent en régime établi)
+    """
+    simulation = KitchenSimulation(build_scenario(chef_count))
+    bots = simulation.bot_manager.bots
+    simulation.step()  # ajoute les commandes du tick 0 ; les chefs les prennent
+
+    # Libérer tous les chefs (la file reste pleine) pour mesurer la prise de commande
+    with simulation.output:
+        for bot in bots:
+            simulation.order_manager.chef_orders.pop(bot.bot_id, None)
+
+        start = time.perf_counter()
+        for bot in bots:
+            simulation.bot_manager.try_claim_order(bot)
+        claim_us = (time.perf_counter() - start) * 1e6 / chef_count
+
+        busy_us = time_per_call(simulation.bot_manager.try_claim_order, bots)
+    return claim_us, busy_us
+
+
+def benchmark_scaling(chef_count, ticks):
+    """
+    Mesure la simulation complète et les méthodes chaudes pour chef_count chefs
+
+    Returns:
+        dict: ticks/s, ms/tick, µs par chef et par tick, µs par appel
+    """
+    previous_clock = game_state.clock
+    try:
+        simulation = KitchenSimulation(build_scenario(chef_count))
+        simulation.run(WARMUP_TICKS)
+
+        start = time.perf_counter()
+        for _ in range(ticks):
+            simulation.step()
+        elapsed = time.perf_counter() - start
+
+        bots = simulation.bot_manager.bots
+        order_manager = simulation.order_manager
+        with simulation.output:
+            progress_us = time_per_call(lambda bot: order_manager.get_chef_progress(bot.bot_id), bots)
+            available_us = time_per_call(lambda bot: bot.is_available(), bots)
+            claim_us, busy_us = benchmark_claims(chef_count)
+    finally:
+        game_state.set_clock(previous_clock)
+
+    tick_ms = elapsed * 1000 / ticks
+    return {
+        "ticks_per_second": ticks / elapsed,
+        "tick_ms": tick_ms,
+        "us_per_chef": tick_ms * 1000 / chef_count,
+        "get_chef_progress": progress_us,
+        "is_available": available_us,
+        "try_claim_order (prise)": claim_us,
+        "try_claim_order (occupé)": busy_us
+    }
+
+
+def print_results(results):
+    """Affiche la courbe de montée en charge"""
+    rows = [
+        ("ticks/s", "ticks_per_second", "{:14.1f}"),
+        ("ms/tick", "tick_ms", "{:14.3f}"),
+        ("µs/chef/tick", "us_per_chef", "{:14.2f}"),
+        ("get_chef_progress (µs)", "get_chef_progress", "{:14.3f}"),
+        ("is_available (µs)", "is_available", "{:14.3f}"),
+        ("try_claim_order prise (µs)", "try_claim_order (prise)", "{:14.3f}"),
+        ("try_claim_order occupé (µs)", "try_claim_order (occupé)", "{:14.3f}")
+    ]
+    chef_counts = list(results)
+    width = max(len(label) for label, _, _ in rows) + 2
+
+    print("=" * (width + 14 * len(chef_counts)))
+    print("MINI OVERCOOKED - MONTÉE EN CHARGE DE LA SIMULATION")
+    print("=" * (width + 14 * len(chef_counts)))
+    print("".ljust(width) + "".join(f"{count} chefs".rjust(14) for count in chef_counts))
+    for label, key, fmt in rows:
+        print(label.ljust(width) + "".join(fmt.format(results[count][key]) for count in chef_counts))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Montée en charge de la simulation Mini Overcooked")
+    parser.add_argument("--chefs", type=int, nargs="+", default=[2, 10, 100, 1000], help="Nombres de chefs")
+    parser.add_argument("--ticks", type=int, default=300, help="Ticks mesurés par configuration")
+    args = parser.parse_args()
+
+    print_results({count: benchmark_scaling(count, args.ticks) for count in args.chefs})
@@ -0,0 +1,112 @@
+"""
+Benchmark simulation / rendu - Thread unique contre processus séparés
+✅ La simulation tourne en continu (vitesse x time_scale) pendant que le rendu dessine chaque frame
+✅ Mode "thread" : simulation et rendu se partagent un cœur (GIL)
+✅ Mode "process" : simulation dans son propre processus, état lu en mémoire partagée
+✅ Ticks/s atteints (la cible est TICK_RATE x vitesse) et FPS non plafonné du rendu
+
+Usage:
+    python -m benchmarks.split --chefs 2 100 300 --seconds 3 --speed 8
+"""
+import argparse
+import contextlib
+import os
+import time
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import game_state
+from benchmarks.render import build_scenario, build_stages
+from config import WIDTH, HEIGHT, TICK_RATE, competition_recipes
+from game.runner import SimulationRunner, SimulationProcess
+from game.simulation import KitchenSimulation, NullOutput
+
+MODES = ("thread", "process")
+
+
+def start_runner(mode, scenario, time_scale):
+    """Simulation lancée dans le mode demandé (thread ou processus)"""
+    if mode == "process":
+        runner = SimulationProcess(scenario, time_scale=time_scale, verbose=False)
+    else:
+        simulation = KitchenSimulation(scenario)
+        runner = SimulationRunner(simulation.bot_manager, simulation.order_manager, simulation.game_logic,
+                                  simulation.clock, time_scale=time_scale)
+    runner.start()
+    return runner
+
+
+def benchmark_split(mode, chef_count, seconds, time_scale):
+    """
+    Rendu continu pendant seconds secondes, simulation dans le mode donné
+
+    Returns:
+        dict: {'ticks_per_second', 'fps'}
+    """
+    from graphics.assets import AssetManager
+    from graphics.kitchen import KitchenRenderer
+    from graphics.ui import UIRenderer
+
+    scenario = build_scenario(chef_count)
+    orders = scenario.pop("orders")
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    kitchen_renderer = KitchenRenderer(screen)
+    ui_renderer = UIRenderer(screen)
+    asset_manager = AssetManager()
+
+    previous_clock = game_state.clock
+    # Les logs des chefs (thread ou processus) ne comptent pas dans la mesure
+    with contextlib.redirect_stdout(NullOutput()):
+        runner = start_runner(mode, scenario, time_scale)
+        try:
+            for order_name in orders:
+                runner.submit("add_order", order_name, competition_recipes[order_name])
+            source = types.SimpleNamespace(snapshot=runner.render_snapshot)
+            stages = build_stages(screen, kitchen_renderer, ui_renderer, asset_manager, source)
+
+            first_tick = runner.render_snapshot().tick
+            frames = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                for _, stage in stages:
+                    stage()
+                frames += 1
+            elapsed = time.perf_counter() - start
+            ticks = runner.render_snapshot().tick - first_tick
+        finally:
+            runner.final_stats()
+            game_state.set_clock(previous_clock)
+
+    return {"ticks_per_second": ticks / elapsed, "fps": frames / elapsed}
+
+
+def print_results(results, time_scale):
+    """Affiche ticks/s et FPS par mode et par nombre de chefs"""
+    chef_counts = list(results)
+    width = 22
+    print("=" * (width + 14 * len(chef_counts)))
+    print(f"MINI OVERCOOKED - SIMULATION / RENDU (vitesse x{time_scale}, cible {TICK_RATE * time_scale} ticks/s)")
+    print("=" * (width + 14 * len(chef_counts)))
+    print("".ljust(width) + "".join(f"{count} chefs".rjust(14) for count in chef_counts))
+    for mode in MODES:
+        print(f"{mode} - ticks/s".ljust(width)
+              + "".join(f"{results[count][mode]['ticks_per_second']:14.1f}" for count in chef_counts))
+        print(f"{mode} - FPS".ljust(width)
+              + "".join(f"{results[count][mode]['fps']:14.1f}" for count in chef_counts))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulation et rendu : thread contre processus")
+    parser.add_argument("--chefs", type=int, nargs="+", default=[2, 100, 300], help="Nombres de chefs")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Durée de mesure par configuration")
+    parser.add_argument("--speed", type=int, default=8, help="Vitesse de jeu (x TICK_RATE ticks/s)")
+    args = parser.parse_args()
+
+    pygame.init()
+    results = {count: {mode: benchmark_split(mode, count, args.seconds, args.speed) for mode in MODES}
+               for count in args.chefs}
+    print_results(results, args.speed)
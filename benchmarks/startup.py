@@ -0,0 +1,114 @@
+"""
+Benchmark du démarrage - Du lancement de l'interpréteur au premier tick / à la première frame
+✅ Chaque scénario tourne dans un processus neuf (imports à froid, aucun cache en mémoire)
+✅ Temps total du processus et temps des imports + init mesuré dans le processus
+✅ Vérifie que le cœur de la simulation ne charge ni pygame ni les modules graphiques
+
+Usage:
+    python -m benchmarks.startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code exécuté dans chaque processus, entre le début et la fin du chronomètre
+SCENARIOS = {
+    "config + game_state": "import config, game_state",
+    "commandes + logique": "import entities.order_manager, game.logic",
+    "simulation (1er tick)": (
+        "from game.simulation import KitchenSimulation\n"
+        "KitchenSimulation({'orders': ['salade']}).step()"
+    ),
+    "batch (import)": "import game.batch",
+    "jeu graphique (1re frame)": (
+        "import pygame\n"
+        "pygame.init()\n"
+        "screen = pygame.display.set_mode((900, 650))\n"
+        "from benchmarks.render import build_scenario, build_stages\n"
+        "from game.simulation import KitchenSimulation\n"
+        "from graphics.assets import AssetManager\n"
+        "from graphics.kitchen import KitchenRenderer\n"
+        "from graphics.ui import UIRenderer\n"
+        "from utils.fonts import fonts\n"
+        "fonts.warm_up()\n"
+        "simulation = KitchenSimulation(build_scenario(2))\n"
+        "simulation.step()\n"
+        "for name, stage in build_stages(screen, KitchenRenderer(screen), UIRenderer(screen), AssetManager(), simulation):\n"
+        "    stage()"
+    )
+}
+
+WRAPPER = """
+import time
+_start = time.perf_counter()
+{code}
+_elapsed = (time.perf_counter() - _start) * 1000
+import json, sys
+print(json.dumps({{"ms": _elapsed,
+                  "pygame": "pygame" in sys.modules,
+                  "numpy": "numpy" in sys.modules,
+                  "graphics": any(name.startswith("graphics") for name in sys.modules)}}))
+"""
+
+
+def run_scenario(code):
+    """Lance code dans un nouvel interpréteur et retourne (ms processus, mesures internes)"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", WRAPPER.format(code=code)], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    process_ms = (time.perf_counter() - start) * 1000
+    return process_ms, json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark_startup(runs):
+    """
+    Médiane de runs lancements pour chaque scénario
+
+    Returns:
+        dict: {scénario: {'process_ms', 'import_ms', 'pygame', 'numpy', 'graphics'}}
+    """
+    results = {}
+    for name, code in SCENARIOS.items():
+        samples = [run_scenario(code) for _ in range(runs)]
+        measures = samples[-1][1]
+        results[name] = {
+            "process_ms": statistics.median(process_ms for process_ms, _ in samples),
+            "import_ms": statistics.median(inner["ms"] for _, inner in samples),
+            "pygame": measures["pygame"],
+            "numpy": measures["numpy"],
+            "graphics": measures["graphics"]
+        }
+    return results
+
+
+def print_results(results):
+    """Affiche un tableau : temps du processus, imports + init, modules chargés"""
+    width = max(len(name) for name in results) + 2
+    print("=" * (width + 44))
+    print("MINI OVERCOOKED - BENCHMARK DU DÉMARRAGE (ms, médiane)")
+    print("=" * (width + 44))
+    print("scénario".ljust(width) + "processus".rjust(11) + "imports+init".rjust(14)
+          + "pygame".rjust(8) + "numpy".rjust(7) + "graph.".rjust(8))
+    for name, result in results.items():
+        print(name.ljust(width)
+              + f"{result['process_ms']:11.1f}"
+              + f"{result['import_ms']:14.1f}"
+              + ("oui" if result["pygame"] else "non").rjust(8)
+              + ("oui" if result["numpy"] else "non").rjust(7)
+              + ("oui" if result["graphics"] else "non").rjust(8))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage de Mini Overcooked")
+    parser.add_argument("--runs", type=int, default=5, help="Lancements par scénario")
+    args = parser.parse_args()
+
+    print_results(benchmark_startup(args.runs))
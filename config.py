@@ -1,6 +1,7 @@
 """
 Configuration et constantes du jeu Mini Overcooked
 """
+import os
 
 # Configuration de l'écran
 WIDTH, HEIGHT = 900, 650
@@ -37,11 +38,38 @@ recipes = {
     "steak_salade": ["H", "L", "T"]
 }
 
+# Recettes de la compétition multi-agents (noms d'ingrédients complets)
+competition_recipes = {
+    "salade": ["laitue", "tomate"],
+    "burger": ["pain", "steak", "laitue", "tomate"],
+    "sandwich": ["pain", "fromage", "tomate"],
+    "salade_complete": ["laitue", "tomate", "fromage"],
+    "burger_deluxe": ["pain", "steak", "laitue", "tomate", "fromage"]
+}
+
 # Temps de préparation pour chaque ingrédient
 prep_times = {"L": 1.5, "T": 1.0, "B": 2.0, "C": 1.2, "H": 2.5}
 
 # Configuration du jeu
 GAME_DURATION = 60  # secondes
-BOT_SPEED = 3
+BOT_SPEED = 180  # px/seconde (vitesse de base d'un chef)
+TICK_RATE = 60  # pas de simulation par seconde (pas de temps fixe)
+RENDER_FPS = 60  # frames affichées par seconde (indépendant de TICK_RATE)
+MAX_FRAME_TIME = 0.25  # au-delà, une frame lente ne rattrape pas tout son retard
+SIMULATION_MODE = "thread"  # "loop", "thread" ou "process" (simulation dans un autre processus, mémoire partagée)
 PARTICLE_COUNT = 6
+MAX_PARTICLES = 2000  # capacité du pool de particules
+PARTICLE_FRAME_BUDGET = 300  # nouvelles particules max par frame
 RESTOCK_INTERVAL = 4  # secondes
+ORDER_LIFETIME = 45  # secondes en file avant expiration d'une commande (None : jamais)
+TIME_SCALES = [1, 2, 8, 64]  # vitesses de jeu disponibles (F7)
+DIRTY_RECT_RENDERING = True  # n'envoyer à l'écran que les régions modifiées (F8)
+TEXT_CACHE_SIZE = 512  # surfaces de texte gardées en cache (LRU)
+FONT_SIZES = [16, 18, 20, 24, 28, 32, 36, 48]  # tailles chargées au démarrage
+INGREDIENT_IMAGE_SIZES = [16, 30, 32, 36, 40, 60]  # tailles pré-calculées des images d'ingrédients
+GLOW_PHASES = 32  # phases pré-rendues par halo animé
+ATLAS_WIDTH = 512  # largeur de l'atlas des images
+ASSET_DISK_CACHE = True  # garder les surfaces générées sur disque entre deux lancements
+ASSET_CACHE_VERSION = 1  # à incrémenter pour invalider tout le cache disque
+ASSET_CACHE_DIR = os.environ.get("MINI_OVERCOOKED_CACHE_DIR",
+                                 os.path.join(os.path.expanduser("~"), ".cache", "mini_overcooked"))
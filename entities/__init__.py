@@ -1,9 +1,24 @@
 """
 Entities module - Contient toutes les entités du jeu
+✅ Exports chargés à la demande : importer entities.order_manager ne charge
+   ni les chefs (NumPy) ni les particules
 """
+import importlib
 
-from .bot import Bot
-from .ingredient import IngredientManager
-from .particle import Particle, ParticleSystem
+_EXPORTS = {
+    'Bot': '.bot',
+    'IngredientManager': '.ingredient',
+    'Particle': '.particle',
+    'ParticleSystem': '.particle'
+}
 
-__all__ = ['Bot', 'IngredientManager', 'Particle', 'ParticleSystem']
\ No newline at end of file
+__all__ = ['Bot', 'IngredientManager', 'Particle', 'ParticleSystem']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,10 +4,14 @@ Bot entity - Système multi-agents VRAIMENT COMPÉTITIF
 ✅ Travail simultané - AUCUNE attente
 ✅ Va DIRECTEMENT au bac de l'ingrédient spécifique 🎯
 ✅ Utilise OrderManager pour gérer les commandes multiples
+✅ Pas de temps fixe : BotManager.update(dt), vitesses en px/seconde
 """
-import time
 import math
 import game_state
+from config import BOT_SPEED, TICK_RATE
+from entities.movement import MovementArrays
+from utils.text_cache import text_cache
+from utils.fonts import fonts
 
 class BotManager:
     """Gestionnaire pour coordonner les bots EN VRAIE COMPÉTITION"""
@@ -18,6 +22,9 @@ class BotManager:
         self.competition_mode = True
         self.frame_counter = 0
         
+        # Positions, cibles et vitesses de TOUS les chefs (tableaux NumPy)
+        self.movement = MovementArrays()
+        
     def add_bot(self, bot):
         """Ajoute un bot à la compétition"""
         self.bots.append(bot)
@@ -29,6 +36,7 @@ class BotManager:
             "efficiency": 0
         }
         bot.bot_id = id(bot)
+        bot.attach_movement(self.movement)
         
     def try_claim_order(self, bot):
         """Un bot essaie de prendre une commande de la file"""
@@ -76,18 +84,33 @@ class BotManager:
         
         return 0
     
-    def update(self):
-        """Met à jour tous les bots - CHACUN travaille sur SA commande"""
+    def update(self, dt=1.0 / TICK_RATE):
+        """
+        Avance tous les bots d'un pas de simulation - CHACUN travaille sur SA commande
+
+        Args:
+            dt: Durée du pas en secondes (pas fixe : 1 / TICK_RATE)
+        """
         self.frame_counter += 1
         
+        # Commandes restées trop longtemps en file : retirées avant que les chefs se servent
+        if hasattr(game_state, 'order_manager'):
+            game_state.order_manager.expire_orders()
+        
         # IMPORTANT: Tous les bots essaient de prendre une commande s'ils sont libres
         for bot in self.bots:
             if bot.is_available():
                 self.try_claim_order(bot)
         
-        # Mettre à jour tous les bots
+        # Logique de chaque bot, puis UN SEUL pas de mouvement vectorisé pour tous
         for bot in self.bots:
-            bot.update()
+            bot.update_logic()
+        
+        self.movement.step(dt)
+        
+        at_target = self.movement.at_target().tolist()
+        for bot, arrived in zip(self.bots, at_target):
+            bot.handle_interactions(arrived)
         
         # Debug périodique
         if self.frame_counter % 120 == 0:
@@ -110,6 +133,10 @@ class BotManager:
                         print(f"      - Commande: {progress['order_name']}")
                         print(f"      - Progression: {progress['prepared']}/{progress['required']}")
     
+    def interpolate(self, alpha):
+        """Positions affichées des chefs entre les deux derniers pas (alpha dans [0, 1])"""
+        self.movement.interpolate(alpha)
+    
     def draw_all(self, screen):
         """Dessine tous les bots"""
         for bot in self.bots:
@@ -129,6 +156,10 @@ class BotManager:
 
 class Bot:
     def __init__(self, x=350, y=400, chef_name="Chef", color_variant=0):
+        # Position/cible/vitesse stockées dans des tableaux (partagés une fois dans un BotManager)
+        self.movement = MovementArrays(capacity=1)
+        self.movement_index = self.movement.add(x, y, x, y, BOT_SPEED + color_variant * 30, 100)
+        
         self.x = x
         self.y = y
         self.inv = None
@@ -141,13 +172,12 @@ class Bot:
         self.state = "idle"
         self.animation_time = 0
         self.bot_id = None
-        self.frame_debug_counter = 0
         
         self.my_order = None  # Référence à MA commande
         self.motivation = 100
         self.competitiveness = 0.5 + (color_variant * 0.3)
         
-        self.BOT_SPEED = 3 + (color_variant * 0.5)
+        self.BOT_SPEED = BOT_SPEED + color_variant * 30  # px/seconde
         self.prep_times = {
             "laitue": 1.0,
             "tomate": 1.2,
@@ -197,6 +227,96 @@ class Bot:
         self.chef_pants_color = variant["pants"]
         self.chef_skin_color = variant["skin"]
 
+    @property
+    def x(self):
+        return float(self.movement.positions[self.movement_index, 0])
+    
+    @x.setter
+    def x(self, value):
+        self.movement.positions[self.movement_index, 0] = value
+        self.movement.teleport(self.movement_index)
+    
+    @property
+    def y(self):
+        return float(self.movement.positions[self.movement_index, 1])
+    
+    @y.setter
+    def y(self, value):
+        self.movement.positions[self.movement_index, 1] = value
+        self.movement.teleport(self.movement_index)
+    
+    @property
+    def display_x(self):
+        """Abscisse affichée (interpolée entre deux pas de simulation)"""
+        return float(self.movement.display[self.movement_index, 0])
+    
+    @property
+    def display_y(self):
+        """Ordonnée affichée (interpolée entre deux pas de simulation)"""
+        return float(self.movement.display[self.movement_index, 1])
+    
+    @property
+    def target_x(self):
+        return float(self.movement.targets[self.movement_index, 0])
+    
+    @target_x.setter
+    def target_x(self, value):
+        self.movement.targets[self.movement_index, 0] = value
+    
+    @property
+    def target_y(self):
+        return float(self.movement.targets[self.movement_index, 1])
+    
+    @target_y.setter
+    def target_y(self, value):
+        self.movement.targets[self.movement_index, 1] = value
+    
+    @property
+    def BOT_SPEED(self):
+        return float(self.movement.base_speeds[self.movement_index])
+    
+    @BOT_SPEED.setter
+    def BOT_SPEED(self, value):
+        self.movement.base_speeds[self.movement_index] = value
+    
+    @property
+    def motivation(self):
+        return float(self.movement.motivations[self.movement_index])
+    
+    @motivation.setter
+    def motivation(self, value):
+        self.movement.motivations[self.movement_index] = value
+    
+    @property
+    def animation_time(self):
+        return float(self.movement.animation_times[self.movement_index])
+    
+    @animation_time.setter
+    def animation_time(self, value):
+        self.movement.animation_times[self.movement_index] = value
+
+    @property
+    def score(self):
+        """Score du chef dans la compétition (None hors BotManager)"""
+        if hasattr(game_state, 'bot_manager'):
+            return game_state.bot_manager.bot_scores.get(self.bot_id)
+        return None
+    
+    @property
+    def has_order(self):
+        """Le chef a-t-il une commande en cours ?"""
+        return self.get_my_order() is not None
+
+    def attach_movement(self, movement):
+        """Transfère l'état de mouvement du chef dans les tableaux d'un BotManager"""
+        old, index = self.movement, self.movement_index
+        self.movement_index = movement.add(
+            old.positions[index, 0], old.positions[index, 1],
+            old.targets[index, 0], old.targets[index, 1],
+            old.base_speeds[index], old.motivations[index], old.animation_times[index]
+        )
+        self.movement = movement
+
     def update_interaction_zones(self, zones):
         """Met à jour les zones d'interaction"""
         self.interaction_zones = zones
@@ -277,7 +397,7 @@ class Bot:
             prep_time = self.prep_times.get(self.preparing, 1.5)
             prep_time *= (1.0 - (self.motivation / 200))
             
-            if time.time() - self.prep_time >= prep_time:
+            if game_state.clock.time() - self.prep_time >= prep_time:
                 # Ajouter à MA commande
                 if hasattr(game_state, 'order_manager'):
                     game_state.order_manager.add_ingredient_to_chef(self.bot_id, self.preparing)
@@ -296,7 +416,7 @@ class Bot:
             self.state = "plating"
             self.target_x, self.target_y = self.interaction_zones['plating_station']
             
-            if time.time() - self.plate_time >= self.PLATING_TIME:
+            if game_state.clock.time() - self.plate_time >= self.PLATING_TIME:
                 # Marquer comme platté
                 if hasattr(game_state, 'order_manager'):
                     game_state.order_manager.set_chef_plated(self.bot_id, True)
@@ -340,8 +460,10 @@ class Bot:
             elif self.are_all_ingredients_ready():
                 self.state = "ready_to_plate"
 
-    def handle_interactions(self):
-        if not self.is_at_target():
+    def handle_interactions(self, at_target=None):
+        if at_target is None:
+            at_target = self.is_at_target()
+        if not at_target:
             return
         
         # 🎯 GESTION DES BACS D'INGRÉDIENTS SPÉCIFIQUES
@@ -362,7 +484,7 @@ class Bot:
         
         elif self.state == "going_to_board" and self.inv and self.inv != "plated_dish":
             self.preparing = self.inv
-            self.prep_time = time.time()
+            self.prep_time = game_state.clock.time()
             print(f"👨‍🍳 {self.chef_name} prépare: {self.preparing}")
             self.inv = None
             self.state = "cutting"
@@ -370,7 +492,7 @@ class Bot:
         elif self.state == "going_to_plating" and not self.plating:
             if self.are_all_ingredients_ready():
                 self.plating = True
-                self.plate_time = time.time()
+                self.plate_time = game_state.clock.time()
                 print(f"🍽️ {self.chef_name} assemble!")
                 self.state = "plating"
         
@@ -385,29 +507,13 @@ class Bot:
             self.state = "idle"
             self.motivation = min(100, self.motivation + 10)
 
-    def update_movement(self):
-        """Met à jour le mouvement"""
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-        
-        speed = self.BOT_SPEED * (0.8 + self.motivation / 500)
-        
-        if distance > 5:
-            if distance > 0:
-                move_x = (dx / distance) * speed
-                move_y = (dy / distance) * speed
-                self.x += move_x
-                self.y += move_y
-        
-        self.x = max(60, min(740, self.x))
-        self.y = max(120, min(540, self.y))
-        self.animation_time += 0.04
-        self.frame_debug_counter += 1
+    def update_movement(self, dt=1.0 / TICK_RATE):
+        """Met à jour le mouvement (BotManager déplace tous les chefs d'un coup)"""
+        self.movement.step_one(self.movement_index, dt)
 
-    def update(self, dt=0):
+    def update(self, dt=1.0 / TICK_RATE):
         self.update_logic()
-        self.update_movement()
+        self.update_movement(dt)
         self.handle_interactions()
 
     def get_state_color(self):
@@ -445,34 +551,41 @@ class Bot:
         }
         return state_texts.get(self.state, self.state)
 
-    def draw_chef(self, screen):
-        """Dessine le chef cuisinier"""
+    def draw_chef(self, screen, position=None):
+        """
+        Dessine le chef cuisinier et retourne le rectangle de son étiquette
+
+        Args:
+            position: (x, y) où dessiner ; par défaut la position interpolée
+        """
         import pygame
         
+        x, y = position if position is not None else (self.display_x, self.display_y)
+        
         alpha = int(150 + (self.motivation * 1.05))
         
-        body_rect = pygame.Rect(self.x - 12, self.y - 15, 24, 30)
+        body_rect = pygame.Rect(x - 12, y - 15, 24, 30)
         pygame.draw.rect(screen, self.chef_body_color, body_rect)
         pygame.draw.rect(screen, (200, 200, 200), body_rect, 2)
         
-        pants_rect = pygame.Rect(self.x - 10, self.y + 10, 20, 15)
+        pants_rect = pygame.Rect(x - 10, y + 10, 20, 15)
         pygame.draw.rect(screen, self.chef_pants_color, pants_rect)
         
-        pygame.draw.circle(screen, self.chef_skin_color, (int(self.x), int(self.y - 25)), 10)
-        pygame.draw.circle(screen, (0, 0, 0), (int(self.x), int(self.y - 25)), 10, 2)
+        pygame.draw.circle(screen, self.chef_skin_color, (int(x), int(y - 25)), 10)
+        pygame.draw.circle(screen, (0, 0, 0), (int(x), int(y - 25)), 10, 2)
         
-        hat_rect = pygame.Rect(self.x - 8, self.y - 45, 16, self.chef_hat_height)
+        hat_rect = pygame.Rect(x - 8, y - 45, 16, self.chef_hat_height)
         pygame.draw.rect(screen, self.chef_hat_color, hat_rect)
         pygame.draw.rect(screen, (180, 180, 180), hat_rect, 2)
         
-        pygame.draw.circle(screen, (0, 0, 0), (int(self.x - 3), int(self.y - 27)), 2)
-        pygame.draw.circle(screen, (0, 0, 0), (int(self.x + 3), int(self.y - 27)), 2)
+        pygame.draw.circle(screen, (0, 0, 0), (int(x - 3), int(y - 27)), 2)
+        pygame.draw.circle(screen, (0, 0, 0), (int(x + 3), int(y - 27)), 2)
         
         if self.state == "cutting" and self.preparing:
             arm_offset = int(math.sin(self.animation_time * 8) * 3)
             pygame.draw.line(screen, self.chef_skin_color, 
-                           (int(self.x + 12), int(self.y - 10)), 
-                           (int(self.x + 18), int(self.y - 5 + arm_offset)), 3)
+                           (int(x + 12), int(y - 10)), 
+                           (int(x + 18), int(y - 5 + arm_offset)), 3)
         
         # ✅ INGRÉDIENTS PLUS VISIBLES
         if self.inv and self.inv != "plated_dish":
@@ -491,37 +604,34 @@ class Bot:
             # Ombre portée
             shadow_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
             pygame.draw.circle(shadow_surf, (0, 0, 0, 100), (10, 10), 9)
-            screen.blit(shadow_surf, (int(self.x + 12), int(self.y - 8 + bob)))
+            screen.blit(shadow_surf, (int(x + 12), int(y - 8 + bob)))
             
             # Ingrédient avec bordure épaisse
-            pygame.draw.circle(screen, color, (int(self.x + 20), int(self.y - 10 + bob)), 8)
-            pygame.draw.circle(screen, (0, 0, 0), (int(self.x + 20), int(self.y - 10 + bob)), 8, 2)
+            pygame.draw.circle(screen, color, (int(x + 20), int(y - 10 + bob)), 8)
+            pygame.draw.circle(screen, (0, 0, 0), (int(x + 20), int(y - 10 + bob)), 8, 2)
             
             # Effet de brillance
             glow_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (255, 255, 255, 150), (4, 4), 3)
-            screen.blit(glow_surf, (int(self.x + 13), int(self.y - 17 + bob)))
+            screen.blit(glow_surf, (int(x + 13), int(y - 17 + bob)))
         
         elif self.inv == "plated_dish":
             glow = int(abs(math.sin(self.animation_time * 4)) * 50)
-            pygame.draw.circle(screen, (240, 240, 240), (int(self.x + 15), int(self.y - 5)), 8)
-            pygame.draw.circle(screen, (200 + glow, 200 + glow, 200), (int(self.x + 15), int(self.y - 5)), 8, 2)
-            pygame.draw.circle(screen, (150, 100, 50), (int(self.x + 15), int(self.y - 5)), 5)
+            pygame.draw.circle(screen, (240, 240, 240), (int(x + 15), int(y - 5)), 8)
+            pygame.draw.circle(screen, (200 + glow, 200 + glow, 200), (int(x + 15), int(y - 5)), 8, 2)
+            pygame.draw.circle(screen, (150, 100, 50), (int(x + 15), int(y - 5)), 5)
         
-        import pygame.font
-        font = pygame.font.Font(None, 16)
+        font = fonts.get(16)
         
         name_text = self.chef_name
-        if hasattr(game_state, 'bot_manager') and self.bot_id in game_state.bot_manager.bot_scores:
-            score = game_state.bot_manager.bot_scores[self.bot_id]
-            name_text = f"{self.chef_name} ({score})"
+        if self.score is not None:
+            name_text = f"{self.chef_name} ({self.score})"
         
-        name_surf = font.render(name_text, True, (255, 255, 255))
-        name_rect = name_surf.get_rect(center=(int(self.x), int(self.y + 35)))
+        name_surf = text_cache.render(font, name_text, True, (255, 255, 255))
+        name_rect = name_surf.get_rect(center=(int(x), int(y + 35)))
         
         # Couleur selon s'il a une commande
-        my_order = self.get_my_order()
-        if my_order:
+        if self.has_order:
             bg_color = (0, 100, 0, 180)  # Vert = travaille
         else:
             bg_color = (100, 100, 0, 180)  # Jaune = cherche commande
@@ -531,6 +641,7 @@ class Bot:
         bg_surf.fill(bg_color)
         screen.blit(bg_surf, bg_rect)
         screen.blit(name_surf, name_rect)
+        return bg_rect
 
     def get_debug_info(self):
         return {
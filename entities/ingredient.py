@@ -1,17 +1,25 @@
 """
 Ingredient management - Gère les ingrédients et les recettes
 """
-import time
 from config import fridge, RESTOCK_INTERVAL
 import game_state
 
 class IngredientManager:
+    # Couleurs associées à chaque type d'ingrédient
+    INGREDIENT_COLORS = {
+        "T": [(255, 69, 69), (255, 140, 0)],      # Tomate
+        "L": [(50, 205, 50), (34, 139, 34)],      # Salade
+        "B": [(222, 184, 135), (205, 133, 63)],   # Pain
+        "C": [(255, 255, 0), (255, 215, 0)],      # Fromage
+        "H": [(139, 69, 19), (160, 82, 45)]       # Steak
+    }
+
     def __init__(self):
         self.last_restock = 0
 
     def restock_fridge(self):
         """Réapprovisionne le frigo si nécessaire"""
-        current_time = time.time()
+        current_time = game_state.clock.time()
         if current_time - self.last_restock < RESTOCK_INTERVAL:
             return
         
@@ -39,14 +47,7 @@ class IngredientManager:
 
     def get_ingredient_colors(self, ingredient_type):
         """Retourne les couleurs associées à un type d'ingrédient"""
-        colors = {
-            "T": [(255, 69, 69), (255, 140, 0)],      # Tomate
-            "L": [(50, 205, 50), (34, 139, 34)],      # Salade
-            "B": [(222, 184, 135), (205, 133, 63)],   # Pain
-            "C": [(255, 255, 0), (255, 215, 0)],      # Fromage
-            "H": [(139, 69, 19), (160, 82, 45)]       # Steak
-        }
-        return colors.get(ingredient_type, [(255, 255, 255)])
+        return self.INGREDIENT_COLORS.get(ingredient_type, [(255, 255, 255)])
 
     def get_ingredient_name(self, ingredient_type):
         """Retourne le nom lisible d'un ingrédient"""
@@ -0,0 +1,116 @@
+"""
+Movement arrays - Positions, cibles et vitesses des chefs en structure de tableaux
+✅ Un seul pas vectorisé NumPy pour TOUS les chefs (plus de boucle math.sqrt par Bot)
+✅ Bot.x / Bot.y / target_x / target_y lisent et écrivent directement ces tableaux
+✅ Vitesses en px/seconde : step(dt) avance d'un pas de temps fixe
+✅ Positions affichées interpolées entre les deux derniers pas (rendu découplé)
+"""
+import numpy as np
+
+
+class MovementArrays:
+    """Tableaux contigus de l'état de déplacement d'un groupe de chefs"""
+
+    # Limites de la zone de circulation
+    MIN_X, MAX_X = 60, 740
+    MIN_Y, MAX_Y = 120, 540
+
+    ARRIVAL_DISTANCE = 5  # en dessous, le chef ne bouge plus
+    TARGET_DISTANCE = 50  # en dessous, le chef est "à destination"
+    ANIMATION_SPEED = 2.4  # unités d'animation par seconde
+
+    def __init__(self, capacity=4):
+        self.count = 0
+        self.positions = np.zeros((capacity, 2))
+        self.previous = np.zeros((capacity, 2))  # positions avant le dernier pas
+        self.display = np.zeros((capacity, 2))  # positions interpolées pour le rendu
+        self.targets = np.zeros((capacity, 2))
+        self.base_speeds = np.zeros(capacity)
+        self.motivations = np.zeros(capacity)
+        self.animation_times = np.zeros(capacity)
+
+    def _grow(self):
+        """Double la capacité des tableaux"""
+        capacity = max(4, len(self.base_speeds) * 2)
+        for name in ("positions", "previous", "display", "targets", "base_speeds", "motivations", "animation_times"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:])
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, x, y, target_x, target_y, base_speed, motivation, animation_time=0.0):
+        """Ajoute un chef et retourne son index"""
+        if self.count == len(self.base_speeds):
+            self._grow()
+        index = self.count
+        self.positions[index] = (x, y)
+        self.previous[index] = (x, y)
+        self.display[index] = (x, y)
+        self.targets[index] = (target_x, target_y)
+        self.base_speeds[index] = base_speed
+        self.motivations[index] = motivation
+        self.animation_times[index] = animation_time
+        self.count += 1
+        return index
+
+    def step(self, dt):
+        """
+        Avance tous les chefs d'un pas de dt secondes vers leur cible (pas vectorisé)
+
+        base_speeds est en px/seconde : la distance parcourue ne dépend que
+        du temps simulé, pas du nombre de frames affichées.
+        """
+        n = self.count
+        positions = self.positions[:n]
+        self.previous[:n] = positions
+        delta = self.targets[:n] - positions
+        distances = np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2)
+        steps = self.base_speeds[:n] * (0.8 + self.motivations[:n] / 500) * dt
+
+        moving = distances > self.ARRIVAL_DISTANCE
+        positions[moving] += delta[moving] / distances[moving, None] * steps[moving, None]
+
+        np.clip(positions[:, 0], self.MIN_X, self.MAX_X, out=positions[:, 0])
+        np.clip(positions[:, 1], self.MIN_Y, self.MAX_Y, out=positions[:, 1])
+        self.display[:n] = positions  # sans interpolate(), on affiche le dernier pas
+        self.animation_times[:n] += self.ANIMATION_SPEED * dt
+
+    def step_one(self, index, dt):
+        """Avance un seul chef de dt secondes (même calcul que step())"""
+        x, y = self.positions[index]
+        self.previous[index] = (x, y)
+        dx = self.targets[index, 0] - x
+        dy = self.targets[index, 1] - y
+        distance = (dx ** 2 + dy ** 2) ** 0.5
+        step = self.base_speeds[index] * (0.8 + self.motivations[index] / 500) * dt
+
+        if distance > self.ARRIVAL_DISTANCE:
+            x += dx / distance * step
+            y += dy / distance * step
+
+        self.positions[index, 0] = max(self.MIN_X, min(self.MAX_X, x))
+        self.positions[index, 1] = max(self.MIN_Y, min(self.MAX_Y, y))
+        self.display[index] = self.positions[index]
+        self.animation_times[index] += self.ANIMATION_SPEED * dt
+
+    def interpolate(self, alpha):
+        """
+        Calcule les positions affichées entre le pas précédent et le pas courant
+
+        Args:
+            alpha: Fraction du pas suivant déjà écoulée (0 = pas précédent, 1 = pas courant)
+        """
+        n = self.count
+        previous = self.previous[:n]
+        np.add(previous, (self.positions[:n] - previous) * alpha, out=self.display[:n])
+
+    def teleport(self, index):
+        """Supprime l'interpolation d'un chef déplacé directement (pas de traînée)"""
+        self.previous[index] = self.positions[index]
+        self.display[index] = self.positions[index]
+
+    def at_target(self):
+        """Tableau booléen : chaque chef est-il à moins de TARGET_DISTANCE de sa cible ?"""
+        n = self.count
+        delta = self.targets[:n] - self.positions[:n]
+        return (delta[:, 0] ** 2 + delta[:, 1] ** 2) < self.TARGET_DISTANCE ** 2
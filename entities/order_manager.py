@@ -1,8 +1,18 @@
 """
 Gestionnaire de commandes pour le système multi-agents compétitif
 Permet à chaque chef d'avoir SA PROPRE commande simultanément
+✅ File à priorité (OrderQueue) : chaque chef prend la commande la plus urgente
+✅ Échéances : une commande restée ORDER_LIFETIME secondes en file expire
+✅ Progression incrémentale : ingrédients restants comptés (Counter), vue mise en cache
 """
-import time
+import itertools
+import math
+from collections import Counter
+from types import MappingProxyType
+
+import game_state
+from config import ORDER_LIFETIME
+from entities.order_queue import OrderQueue
 
 
 class OrderManager:
@@ -13,39 +23,83 @@ class OrderManager:
     """
     
     def __init__(self):
-        # File de commandes disponibles (en attente d'être prises)
-        self.available_orders = []
+        # File de commandes disponibles (en attente d'être prises), par urgence
+        self.available_orders = OrderQueue()
+        self.order_ids = itertools.count(1)
         
         # Commandes actives (assignées aux chefs)
         # Format: {bot_id: order_info}
         self.chef_orders = {}
         
-        # Historique des commandes complétées
+        # Historique des commandes complétées / expirées sans avoir été prises
         self.completed_orders = []
+        self.expired_orders = []
         
         print("✅ OrderManager initialisé - Système de commandes multiples prêt!")
     
-    def add_order(self, order_name, ingredients):
+    def add_order(self, order_name, ingredients, deadline=None, value=0):
         """
         Ajoute une nouvelle commande à la file des commandes disponibles
         
         Args:
             order_name: Nom du plat (ex: "burger", "salade")
             ingredients: Liste des ingrédients nécessaires
+            deadline: Instant (horloge du jeu) où la commande expire si personne ne l'a prise
+                      (défaut: maintenant + ORDER_LIFETIME)
+            value: Priorité entre deux commandes de même échéance (la plus haute d'abord)
+            
+        Returns:
+            int: Id de la commande (pour cancel_order)
         """
+        now = game_state.clock.time()
+        if deadline is None:
+            deadline = now + ORDER_LIFETIME if ORDER_LIFETIME is not None else math.inf
         order = {
+            'id': next(self.order_ids),
             'name': order_name,
             'ingredients': ingredients.copy(),
-            'added_time': time.time()
+            'added_time': now,
+            'deadline': deadline,
+            'value': value
         }
         
-        self.available_orders.append(order)
+        self.available_orders.push(order)
         print(f"📋 Nouvelle commande disponible: {order_name} ({len(ingredients)} ingrédients)")
-        return True
+        return order['id']
+    
+    def cancel_order(self, order_id):
+        """
+        Retire une commande de la file avant qu'un chef la prenne
+        
+        Returns:
+            dict ou None: La commande annulée
+        """
+        order = self.available_orders.cancel(order_id)
+        if order:
+            print(f"❌ Commande annulée: {order['name']}")
+        return order
+    
+    def expire_orders(self, now=None):
+        """
+        Retire les commandes dont l'échéance est passée (appelé à chaque tick)
+        
+        Returns:
+            list: Commandes expirées
+        """
+        now = game_state.clock.time() if now is None else now
+        expired = self.available_orders.expire(now)
+        for order in expired:
+            self.expired_orders.append(order)
+            print(f"⌛ Commande expirée sans être prise: {order['name']}")
+        return expired
+    
+    def peek_orders(self, count):
+        """Les count prochaines commandes, dans l'ordre où elles seront prises"""
+        return self.available_orders.peek(count)
     
     def assign_order_to_chef(self, bot_id, chef_name):
         """
-        Assigne la première commande disponible à un chef
+        Assigne la commande la plus urgente à un chef (échéance la plus proche)
         
         Args:
             bot_id: ID unique du bot
@@ -62,8 +116,8 @@ class OrderManager:
         if bot_id in self.chef_orders:
             return self.chef_orders[bot_id]
         
-        # Prendre la première commande de la file
-        order_data = self.available_orders.pop(0)
+        # Prendre la commande la plus urgente de la file
+        order_data = self.available_orders.pop()
         
         # Créer l'assignation
         order_info = {
@@ -71,9 +125,12 @@ class OrderManager:
             'chef_name': chef_name,
             'bot_id': bot_id,
             'prepared_ingredients': [],
+            'remaining': Counter(order_data['ingredients']),  # multiset : doublons comptés
             'plated': False,
-            'start_time': time.time()
+            'start_time': game_state.clock.time(),
+            'queue_time': game_state.clock.time() - order_data['added_time']
         }
+        self._refresh_progress(order_info)
         
         self.chef_orders[bot_id] = order_info
         
@@ -98,21 +155,26 @@ class OrderManager:
             return False
         
         order_info = self.chef_orders[bot_id]
-        required = order_info['order_data']['ingredients']
-        prepared = order_info['prepared_ingredients']
+        remaining = order_info['remaining']
         
-        # Vérifier si l'ingrédient est nécessaire et pas encore ajouté
-        if ingredient in required and ingredient not in prepared:
-            prepared.append(ingredient)
-            print(f"✓ {order_info['chef_name']}: {ingredient} ajouté ({len(prepared)}/{len(required)})")
-            return True
+        # Vérifier si l'ingrédient manque encore (O(1), un exemplaire par occurrence dans la recette)
+        if not remaining.get(ingredient):
+            return False
         
-        return False
+        remaining[ingredient] -= 1
+        if not remaining[ingredient]:
+            del remaining[ingredient]
+        prepared = order_info['prepared_ingredients']
+        prepared.append(ingredient)
+        self._refresh_progress(order_info)
+        print(f"✓ {order_info['chef_name']}: {ingredient} ajouté ({len(prepared)}/{len(order_info['order_data']['ingredients'])})")
+        return True
     
     def set_chef_plated(self, bot_id, plated=True):
         """Marque que le chef a platté son plat"""
         if bot_id in self.chef_orders:
             self.chef_orders[bot_id]['plated'] = plated
+            self._refresh_progress(self.chef_orders[bot_id])
             if plated:
                 print(f"🍽️ {self.chef_orders[bot_id]['chef_name']}: Plat platté!")
     
@@ -133,8 +195,9 @@ class OrderManager:
             'order_name': order_info['order_data']['name'],
             'chef_name': order_info['chef_name'],
             'bot_id': bot_id,
-            'completion_time': time.time(),
-            'duration': time.time() - order_info['start_time']
+            'completion_time': game_state.clock.time(),
+            'duration': game_state.clock.time() - order_info['start_time'],
+            'queue_time': order_info['queue_time']
         }
         
         self.completed_orders.append(completion_data)
@@ -148,27 +211,29 @@ class OrderManager:
         """
         Retourne la progression d'un chef sur sa commande
         
+        Vue en lecture seule, recalculée seulement quand la commande change
+        (ingrédient ajouté, plat dressé) : appelable à chaque frame sans coût.
+        
         Returns:
-            dict: {order_name, prepared, required, ingredients_needed, is_ready}
+            mapping: {order_name, prepared, required, ingredients_needed, is_ready, plated}
         """
-        if bot_id not in self.chef_orders:
+        order_info = self.chef_orders.get(bot_id)
+        if order_info is None:
             return None
-        
-        order_info = self.chef_orders[bot_id]
-        required = order_info['order_data']['ingredients']
-        prepared = order_info['prepared_ingredients']
-        
-        # Ingrédients manquants
-        needed = [ing for ing in required if ing not in prepared]
-        
-        return {
+        return order_info['progress']
+    
+    def _refresh_progress(self, order_info):
+        """Reconstruit la vue de progression d'une commande après un changement"""
+        # Ingrédients manquants, dans l'ordre de la recette (doublons regroupés)
+        needed = tuple(order_info['remaining'].elements())
+        order_info['progress'] = MappingProxyType({
             'order_name': order_info['order_data']['name'],
-            'prepared': len(prepared),
-            'required': len(required),
+            'prepared': len(order_info['prepared_ingredients']),
+            'required': len(order_info['order_data']['ingredients']),
             'ingredients_needed': needed,
-            'is_ready': len(needed) == 0,
+            'is_ready': not needed,
             'plated': order_info['plated']
-        }
+        })
     
     def get_available_count(self):
         """Nombre de commandes disponibles"""
@@ -202,6 +267,7 @@ class OrderManager:
             'available_orders': len(self.available_orders),
             'active_orders': len(self.chef_orders),
             'completed_orders': len(self.completed_orders),
+            'expired_orders': len(self.expired_orders),
             'chefs_working': chefs_working
         }
     
@@ -210,4 +276,5 @@ class OrderManager:
         self.available_orders.clear()
         self.chef_orders.clear()
         self.completed_orders.clear()
+        self.expired_orders.clear()
         print("🔄 OrderManager réinitialisé")
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Order queue - File de commandes à priorité avec échéances
+✅ Tas binaire (heapq) : la commande la plus urgente sort en O(log n) (plus de pop(0) en O(n))
+✅ Priorité = échéance la plus proche, puis valeur la plus haute, puis ordre d'arrivée
+✅ Second tas trié par échéance : chaque commande périmée expire en O(log n)
+✅ Annulation par id en O(1) : l'entrée est marquée supprimée et ignorée par le tas
+"""
+import heapq
+import itertools
+import math
+
+
+class OrderQueue:
+    """
+    Commandes en attente, indexées par id
+
+    Chaque commande est un dict avec au moins 'id', 'deadline' (math.inf :
+    jamais périmée) et 'value'. Les entrées annulées ou déjà prises restent
+    dans les tas jusqu'à ce qu'elles remontent au sommet ; compact() les
+    retire quand elles deviennent majoritaires (coût amorti O(1)).
+    """
+
+    def __init__(self):
+        self.heap = []  # [deadline, -value, arrivée, id, commande] (commande None : annulée)
+        self.deadlines = []  # (deadline, arrivée, id) des commandes périssables
+        self.entries = {}  # id -> entrée du tas, commandes encore en file
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, order_id):
+        return order_id in self.entries
+
+    def push(self, order):
+        """Ajoute une commande à la file"""
+        arrival = next(self.counter)
+        entry = [order['deadline'], -order['value'], arrival, order['id'], order]
+        self.entries[order['id']] = entry
+        heapq.heappush(self.heap, entry)
+        if order['deadline'] != math.inf:
+            heapq.heappush(self.deadlines, (order['deadline'], arrival, order['id']))
+            if len(self.deadlines) > 2 * len(self.entries) + 64:
+                self.compact()  # échéances de commandes déjà prises
+
+    def pop(self):
+        """Retire et retourne la commande la plus urgente (None si la file est vide)"""
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            order = entry[-1]
+            if order is not None:
+                del self.entries[entry[3]]
+                return order
+        return None
+
+    def cancel(self, order_id):
+        """Retire la commande order_id de la file et la retourne (None si absente)"""
+        entry = self.entries.pop(order_id, None)
+        if entry is None:
+            return None
+        order = entry[-1]
+        entry[-1] = None
+        if len(self.heap) > 2 * len(self.entries) + 64:
+            self.compact()
+        return order
+
+    def expire(self, now):
+        """
+        Retire les commandes dont l'échéance est passée
+
+        Returns:
+            list: Commandes expirées, de la plus ancienne échéance à la plus récente
+        """
+        expired = []
+        while self.deadlines and self.deadlines[0][0] <= now:  # cancel() peut compacter
+            _, _, order_id = heapq.heappop(self.deadlines)
+            order = self.cancel(order_id)  # déjà prise ou annulée : rien à faire
+            if order is not None:
+                expired.append(order)
+        return expired
+
+    def peek(self, count):
+        """
+        Les count commandes les plus urgentes, sans les retirer
+
+        Parcours du tas par le haut : O(count log count), quelle que soit la
+        taille de la file.
+        """
+        heap = self.heap
+        orders = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(orders) < count:
+            entry, index = heapq.heappop(frontier)
+            if entry[-1] is not None:
+                orders.append(entry[-1])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return orders
+
+    def compact(self):
+        """Reconstruit les tas sans les entrées annulées, prises ou périmées (O(n))"""
+        self.heap = [entry for entry in self.heap if entry[-1] is not None]
+        heapq.heapify(self.heap)
+        self.deadlines = [item for item in self.deadlines if item[2] in self.entries]
+        heapq.heapify(self.deadlines)
+
+    def clear(self):
+        self.heap.clear()
+        self.deadlines.clear()
+        self.entries.clear()
@@ -1,9 +1,46 @@
 """
 Particle system - Gère les effets visuels de particules
+✅ ParticleSystem stocke ses particules dans des tableaux NumPy
+✅ Un seul pas vectorisé (gravité, friction, vie) + compaction des mortes
+✅ Pool à capacité fixe + budget de particules par frame
 """
 import random
-import pygame
-from config import COLORS, PARTICLE_COUNT
+import numpy as np
+from config import COLORS, PARTICLE_COUNT, MAX_PARTICLES, PARTICLE_FRAME_BUDGET
+from entities.ingredient import IngredientManager
+
+
+class ParticleSpriteCache:
+    """
+    Sprites de particules pré-rendus, construits à la demande
+    Clé: (couleur, rayon, alpha quantifié) - dessiner une particule = un blit
+    """
+    ALPHA_STEP = 16
+
+    def __init__(self):
+        self.sprites = {}
+
+    def get(self, color, size, alpha):
+        """Retourne le sprite (cercle de rayon size) pour cette couleur et cet alpha"""
+        alpha = min(255, (alpha + self.ALPHA_STEP // 2) // self.ALPHA_STEP * self.ALPHA_STEP)
+        key = (color[:3], size, alpha)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            import pygame
+            
+            sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color[:3], alpha), (size, size), size)
+            self.sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        """Vide le cache (ex: après changement de mode vidéo)"""
+        self.sprites.clear()
+
+
+# Cache partagé par toutes les particules
+sprite_cache = ParticleSpriteCache()
+
 
 class Particle:
     def __init__(self, x, y, color, velocity, life):
@@ -28,75 +65,165 @@ class Particle:
         if self.life > 0:
             alpha = int((self.life / self.max_life) * 255)
             size = max(1, int(self.size * (self.life / self.max_life)))
-            color = (*self.color[:3], min(255, alpha))
             
-            temp_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf, color, (size, size), size)
-            screen.blit(temp_surf, (int(self.x-size), int(self.y-size)))
+            sprite = sprite_cache.get(tuple(self.color), size, min(255, alpha))
+            screen.blit(sprite, (int(self.x-size), int(self.y-size)))
 
     def is_alive(self):
         """Vérifie si la particule est encore vivante"""
         return self.life > 0
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    """
+    Pool de particules à capacité fixe (tableaux pré-alloués)
+    La compaction regroupe les slots libres en fin de tableau : ils sont
+    réutilisés par les émetteurs, sans aucune allocation pendant le jeu.
+    Quand le pool ou le budget de la frame est épuisé, les émetteurs
+    émettent moins de particules (les autres sont abandonnées).
+    """
+    GRAVITY = 0.2
+    FRICTION = 0.98
+
+    def __init__(self, capacity=MAX_PARTICLES, frame_budget=PARTICLE_FRAME_BUDGET):
+        self.capacity = capacity
+        self.frame_budget = frame_budget
+        self.spawned_this_frame = 0
+        self.dropped = 0
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.max_life = np.ones(capacity)
+        self.size = np.zeros(capacity)
+        self.color_index = np.zeros(capacity, dtype=np.int32)
+        
+        # Palette des couleurs utilisées (index -> couleur)
+        self.palette = []
+        self.palette_lookup = {}
+        
+        self.ingredient_manager = IngredientManager()
+
+    def _arrays(self):
+        return ("x", "y", "vx", "vy", "life", "max_life", "size", "color_index")
+
+    def reserve(self, requested):
+        """
+        Nombre de particules qu'un émetteur peut créer maintenant
+
+        Limité par les slots libres du pool et par le budget de la frame ;
+        le surplus est compté dans self.dropped.
+        """
+        allowed = min(requested,
+                      self.capacity - self.count,
+                      self.frame_budget - self.spawned_this_frame)
+        allowed = max(0, allowed)
+        self.dropped += requested - allowed
+        return allowed
+
+    def _color_index(self, color):
+        """Index de la couleur dans la palette (ajoutée si nouvelle)"""
+        color = tuple(color[:3])
+        index = self.palette_lookup.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.palette_lookup[color] = index
+        return index
+
+    def add_particle(self, x, y, color, velocity, life):
+        """Ajoute une particule dans un slot libre (même tirage de taille que Particle)"""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i], self.vy[i] = velocity
+        self.life[i] = life
+        self.max_life[i] = life
+        self.size[i] = random.randint(2, 6)
+        self.color_index[i] = self._color_index(color)
+        self.count += 1
+        self.spawned_this_frame += 1
+        return True
 
     def add_cutting_particles(self, x, y, ingredient_type):
         """Ajoute des particules lors de la découpe"""
-        from entities.ingredient import IngredientManager
-        ingredient_manager = IngredientManager()
-        colors = ingredient_manager.get_ingredient_colors(ingredient_type)
+        colors = self.ingredient_manager.get_ingredient_colors(ingredient_type)
         
-        for _ in range(PARTICLE_COUNT):
+        for _ in range(self.reserve(PARTICLE_COUNT)):
             color = random.choice(colors)
             velocity = (random.uniform(-2, 2), random.uniform(-3, -1))
-            particle = Particle(
+            self.add_particle(
                 x + random.randint(-8, 8), 
                 y + random.randint(-8, 8),
                 color, velocity, random.randint(15, 30)
             )
-            self.particles.append(particle)
 
     def add_sparkle_particles(self, x, y):
         """Ajoute des particules dorées (succès)"""
-        for _ in range(4):
+        for _ in range(self.reserve(4)):
             velocity = (random.uniform(-1.5, 1.5), random.uniform(-3, -1))
-            particle = Particle(
+            self.add_particle(
                 x + random.randint(-4, 4), 
                 y + random.randint(-4, 4),
                 COLORS['gold'], velocity, random.randint(12, 25)
             )
-            self.particles.append(particle)
 
     def add_delivery_particles(self, x, y):
         """Ajoute des particules lors de la livraison"""
-        for _ in range(12):
+        for _ in range(self.reserve(12)):
             velocity = (random.uniform(-3, 3), random.uniform(-5, -2))
-            particle = Particle(
+            self.add_particle(
                 x + random.randint(-10, 10),
                 y + random.randint(-10, 10),
                 COLORS['gold'], velocity, random.randint(25, 50)
             )
-            self.particles.append(particle)
 
     def update(self):
-        """Met à jour toutes les particules"""
-        # Mettre à jour les particules existantes
-        for particle in self.particles[:]:
-            particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        """Met à jour toutes les particules en un pas vectorisé"""
+        self.spawned_this_frame = 0
+        
+        n = self.count
+        if n == 0:
+            return
+        
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.GRAVITY
+        self.life[:n] -= 1
+        self.vx[:n] *= self.FRICTION
+        
+        # Compaction : les particules vivantes restent au début des tableaux
+        alive = np.flatnonzero(self.life[:n] > 0)
+        if len(alive) < n:
+            for name in self._arrays():
+                array = getattr(self, name)
+                array[:len(alive)] = array[alive]
+            self.count = len(alive)
 
     def draw(self, screen):
-        """Dessine toutes les particules"""
-        for particle in self.particles:
-            particle.draw(screen)
+        """Dessine toutes les particules (sprites en cache, un seul appel blits)"""
+        n = self.count
+        ratio = self.life[:n] / self.max_life[:n]
+        alphas = np.minimum(255, (ratio * 255).astype(int)).tolist()
+        sizes = np.maximum(1, (self.size[:n] * ratio).astype(int)).tolist()
+        xs = self.x[:n].tolist()
+        ys = self.y[:n].tolist()
+        
+        palette = self.palette
+        screen.blits([
+            (sprite_cache.get(palette[color_index], sizes[i], alphas[i]),
+             (int(xs[i] - sizes[i]), int(ys[i] - sizes[i])))
+            for i, color_index in enumerate(self.color_index[:n].tolist())
+        ], doreturn=False)
 
     def clear(self):
         """Supprime toutes les particules"""
-        self.particles.clear()
+        self.count = 0
 
     def get_count(self):
         """Retourne le nombre de particules actives"""
-        return len(self.particles)
\ No newline at end of file
+        return self.count
@@ -1,8 +1,30 @@
 """
 Game logic module
+✅ Exports chargés à la demande : importer game.logic ne charge pas la simulation
 """
+import importlib
 
-from .logic import GameLogic
-from .input_handler import InputHandler
+_EXPORTS = {
+    'GameLogic': '.logic',
+    'InputHandler': '.input_handler',
+    'KitchenSimulation': '.simulation',
+    'simulate': '.simulation',
+    'KitchenSnapshot': '.snapshot',
+    'SnapshotBuffer': '.snapshot',
+    'SimulationRunner': '.runner',
+    'SimulationProcess': '.runner',
+    'SharedKitchenState': '.shared_state'
+}
 
-__all__ = ['GameLogic', 'InputHandler']
\ No newline at end of file
+__all__ = ['GameLogic', 'InputHandler', 'KitchenSimulation', 'simulate',
+           'KitchenSnapshot', 'SnapshotBuffer', 'SimulationRunner', 'SimulationProcess',
+           'SharedKitchenState']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,183 @@
+"""
+Batch Monte Carlo - Lance N parties simulées en parallèle (ProcessPoolExecutor)
+✅ Chaque partie a sa graine, son flux de commandes et ses chefs
+✅ Rapport agrégé par configuration (scores, classement, durées des commandes)
+
+Usage:
+    python -m game.batch --games 200 --workers 8
+"""
+import argparse
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from game.simulation import simulate, random_order_stream, TICK_RATE
+
+# Configurations comparées par défaut
+DEFAULT_CONFIGURATIONS = [
+    {"name": "base", "chefs": 2},
+    {"name": "rapides", "chefs": 2, "overrides": {"BOT_SPEED": 300}},
+    {"name": "dressage_rapide", "chefs": 2, "overrides": {"PLATING_TIME": 1.0}},
+    {"name": "brigade", "chefs": 4}
+]
+
+
+def build_scenario(configuration, seed):
+    """
+    Construit le scénario d'une partie à partir d'une configuration
+
+    Args:
+        configuration: dict avec les clés optionnelles
+            - 'chefs': nombre de chefs
+            - 'color_variants': color_variant de chaque chef
+            - 'overrides': attributs du Bot à remplacer (BOT_SPEED en px/seconde, PLATING_TIME...)
+            - 'order_interval': secondes entre deux arrivées de commandes
+            - 'orders_per_batch': commandes par arrivée
+        seed: Graine du flux de commandes
+
+    Returns:
+        dict: Scénario utilisable par simulate()
+    """
+    chef_count = configuration.get("chefs", 2)
+    color_variants = configuration.get("color_variants", [i % 2 for i in range(chef_count)])
+    spacing = 400 / max(1, chef_count)
+
+    chefs = []
+    for i in range(chef_count):
+        chefs.append({
+            "name": f"Chef {i + 1}",
+            "x": 300 + i * spacing,
+            "y": 400,
+            "color_variant": color_variants[i % len(color_variants)],
+            "overrides": configuration.get("overrides", {})
+        })
+
+    return {
+        "chefs": chefs,
+        "orders": random_order_stream(
+            seed,
+            interval=configuration.get("order_interval", 4.0),
+            batch=configuration.get("orders_per_batch", 1)
+        ),
+        "tick_rate": TICK_RATE
+    }
+
+
+def run_game(job):
+    """Exécute une partie dans un processus du pool"""
+    configuration, seed, ticks = job
+    result = simulate(build_scenario(configuration, seed), ticks)
+    result["configuration"] = configuration.get("name", "sans_nom")
+    result["seed"] = seed
+    return result
+
+
+def describe(values):
+    """Statistiques descriptives d'une série de valeurs"""
+    if not values:
+        return {"count": 0, "mean": 0, "stdev": 0, "min": 0, "median": 0, "p90": 0, "max": 0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        "max": ordered[-1]
+    }
+
+
+def aggregate(results):
+    """
+    Agrège les résultats de plusieurs parties par configuration
+
+    Returns:
+        dict: {configuration: {games, score, completed, expired, durations, queue_times, chefs}}
+    """
+    grouped = {}
+    for result in results:
+        grouped.setdefault(result["configuration"], []).append(result)
+
+    report = {}
+    for name, games in grouped.items():
+        chefs = {}
+        for game in games:
+            winner = game["leaderboard"][0]["name"] if game["leaderboard"] else None
+            for entry in game["leaderboard"]:
+                chef = chefs.setdefault(entry["name"], {"scores": [], "dishes": [], "wins": 0})
+                chef["scores"].append(entry["score"])
+                chef["dishes"].append(entry["stats"]["dishes_delivered"])
+                if entry["name"] == winner and entry["score"] > 0:
+                    chef["wins"] += 1
+
+        report[name] = {
+            "games": len(games),
+            "score": describe([game["score"] for game in games]),
+            "completed": describe([len(game["completed_orders"]) for game in games]),
+            "expired": describe([game["expired_orders"] for game in games]),
+            "durations": describe([order["duration"] for game in games
+                                   for order in game["completed_orders"]]),
+            "queue_times": describe([order["queue_time"] for game in games
+                                     for order in game["completed_orders"]]),
+            "chefs": {
+                chef_name: {
+                    "score": describe(chef["scores"]),
+                    "dishes_mean": statistics.fmean(chef["dishes"]),
+                    "wins": chef["wins"]
+                }
+                for chef_name, chef in chefs.items()
+            }
+        }
+    return report
+
+
+def run_batch(configurations=None, games=100, base_seed=0, ticks=None, workers=None):
+    """
+    Lance games parties par configuration sur un pool de processus
+
+    Les configurations partagent les mêmes graines (base_seed + i) : chaque
+    configuration voit exactement les mêmes flux de commandes.
+
+    Returns:
+        dict: Rapport agrégé (voir aggregate())
+    """
+    configurations = configurations or DEFAULT_CONFIGURATIONS
+    jobs = [(configuration, base_seed + i, ticks)
+            for configuration in configurations
+            for i in range(games)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_game, jobs, chunksize=max(1, len(jobs) // 64)))
+
+    return aggregate(results)
+
+
+def print_report(report):
+    """Affiche le rapport agrégé dans la console"""
+    print("=" * 60)
+    print("MINI OVERCOOKED - RAPPORT MONTE CARLO")
+    print("=" * 60)
+    for name, data in report.items():
+        score = data["score"]
+        durations = data["durations"]
+        print(f"\n⚙️ {name} ({data['games']} parties)")
+        print(f"  Score: {score['mean']:.1f} ± {score['stdev']:.1f} "
+              f"(min {score['min']}, médiane {score['median']}, max {score['max']})")
+        print(f"  Commandes complétées/partie: {data['completed']['mean']:.1f} "
+              f"(expirées en file: {data['expired']['mean']:.1f})")
+        print(f"  Durée des commandes: {durations['mean']:.1f}s "
+              f"(médiane {durations['median']:.1f}s, p90 {durations['p90']:.1f}s)")
+        print(f"  Attente en file: {data['queue_times']['mean']:.1f}s (p90 {data['queue_times']['p90']:.1f}s)")
+        for chef_name, chef in sorted(data["chefs"].items()):
+            print(f"  👨‍🍳 {chef_name}: {chef['score']['mean']:.1f} pts, "
+                  f"{chef['dishes_mean']:.1f} plats, {chef['wins']} victoires")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parties Mini Overcooked simulées en parallèle")
+    parser.add_argument("--games", type=int, default=100, help="Parties par configuration")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de base")
+    parser.add_argument("--workers", type=int, default=None, help="Processus (défaut: tous les cœurs)")
+    args = parser.parse_args()
+
+    print_report(run_batch(games=args.games, base_seed=args.seed, workers=args.workers))
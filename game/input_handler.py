@@ -1,7 +1,6 @@
 """
 Input handling - Gère les entrées clavier et événements
 """
-import pygame
 from config import recipes
 import game_state
 
@@ -11,6 +10,8 @@ class InputHandler:
 
     def handle_events(self, events, bot, particle_system):
         """Gère tous les événements pygame"""
+        import pygame
+        
         for event in events:
             if event.type == pygame.QUIT:
                 return False
@@ -54,6 +55,8 @@ class InputHandler:
 
     def wait_for_exit_input(self):
         """Attend l'input pour quitter (écran de fin)"""
+        import pygame
+        
         waiting = True
         while waiting:
             for event in pygame.event.get():
@@ -3,7 +3,6 @@ Game logic - Gère la logique principale du jeu
 ✅ AVEC SYSTÈME DE COMMANDES MULTIPLES INTÉGRÉ
 Chaque chef peut avoir sa propre commande simultanément
 """
-import time
 from config import GAME_DURATION
 import game_state
 
@@ -26,8 +25,8 @@ class OrderManager:
         order = {
             'name': order_name,
             'ingredients': ingredients_required.copy(),
-            'timestamp': time.time(),
-            'id': f"{order_name}_{int(time.time() * 1000)}"
+            'timestamp': game_state.clock.time(),
+            'id': f"{order_name}_{int(game_state.clock.time() * 1000)}"
         }
         self.available_orders.append(order)
         print(f"📋 Nouvelle commande disponible: {order_name}")
@@ -52,7 +51,7 @@ class OrderManager:
             'chef_name': chef_name,
             'prepared_ingredients': [],
             'plated': False,
-            'claim_time': time.time()
+            'claim_time': game_state.clock.time()
         }
         
         self.chef_orders[bot_id] = chef_order
@@ -111,14 +110,14 @@ class OrderManager:
             return None
         
         # Calculer le temps de préparation
-        prep_time = time.time() - chef_order['claim_time']
+        prep_time = game_state.clock.time() - chef_order['claim_time']
         
         # Archiver la commande
         completed = {
             'order_name': chef_order['order_data']['name'],
             'chef_name': chef_order['chef_name'],
             'prep_time': prep_time,
-            'completion_time': time.time()
+            'completion_time': game_state.clock.time()
         }
         self.completed_orders.append(completed)
         
@@ -185,7 +184,7 @@ class OrderManager:
 
 class GameLogic:
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = game_state.clock.time()
         self.running = True
         
         # ⭐ Créer le gestionnaire de commandes
@@ -194,7 +193,7 @@ class GameLogic:
     
     def update_timer(self):
         """Met à jour le timer du jeu"""
-        current_time = time.time()
+        current_time = game_state.clock.time()
         game_state.timer = GAME_DURATION - (current_time - self.start_time)
         
         if game_state.timer <= 0:
@@ -202,13 +201,13 @@ class GameLogic:
     
     def reduce_combo_over_time(self):
         """Réduit le combo s'il n'y a pas d'activité"""
-        current_time = time.time()
+        current_time = game_state.clock.time()
         if game_state.combo > 0 and current_time % 15 < 0.1:
             game_state.combo = max(0, game_state.combo - 1)
     
     def calculate_final_stats(self):
         """Calcule les statistiques finales"""
-        current_time = time.time()
+        current_time = game_state.clock.time()
         plates_delivered = len([p for p in game_state.delivered_plates
                               if current_time - p["time"] < GAME_DURATION])
         
@@ -268,7 +267,7 @@ class GameLogic:
     
     def reset(self):
         """Réinitialise la logique du jeu"""
-        self.start_time = time.time()
+        self.start_time = game_state.clock.time()
         self.running = True
         self.order_manager.reset()
         print("🔄 GameLogic réinitialisé")
\ No newline at end of file
@@ -0,0 +1,360 @@
+"""
+Simulation runner - Fait avancer la cuisine à pas fixe, dans la boucle de rendu, un thread ou un processus
+✅ Accumulateur : TICK_RATE pas par seconde de jeu, quel que soit le FPS du rendu
+✅ Publie un KitchenSnapshot immuable après chaque série de pas (SnapshotBuffer)
+✅ Actions du joueur (commandes, reset, vitesse) appliquées entre deux ticks, dans la simulation
+✅ En mode thread, une frame lente ne retarde plus le traitement des commandes
+✅ En mode processus, la simulation a son propre cœur et publie en mémoire partagée
+"""
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+
+import game_state
+from config import TICK_RATE, MAX_FRAME_TIME
+from game.snapshot import KitchenSnapshot, SnapshotBuffer
+
+
+class SimulationRunner:
+    """
+    Propriétaire unique de BotManager / OrderManager / GameLogic pendant la partie
+
+    Les autres threads ne touchent plus l'état vivant : ils envoient des actions
+    avec submit() et lisent le dernier snapshot avec render_snapshot().
+    Une action est le nom d'une méthode de ACTIONS et ses arguments : elle
+    traverse aussi bien une file de thread qu'une file entre processus.
+    """
+
+    ACTIONS = ("add_order", "reset_competition", "set_time_scale", "stop",
+               "print_interaction_zones", "print_chef_details", "print_leaderboard", "print_order_system")
+
+    def __init__(self, bot_manager, order_manager, game_logic, clock, tick_rate=TICK_RATE, time_scale=1,
+                 actions=None):
+        """
+        Args:
+            clock: Horloge manuelle de game_state, avancée d'un pas à chaque tick
+            time_scale: Secondes de jeu par seconde réelle (F7)
+            actions: File des actions à exécuter (par défaut une file locale)
+        """
+        self.bot_manager = bot_manager
+        self.order_manager = order_manager
+        self.game_logic = game_logic
+        self.clock = clock
+        self.tick_dt = 1.0 / tick_rate
+        self.time_scale = time_scale
+        self.accumulator = 0.0
+        self.tick = 0
+
+        self.actions = queue.SimpleQueue() if actions is None else actions
+        self.buffer = SnapshotBuffer()
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.publish()
+
+    def submit(self, action, *args):
+        """Exécute la méthode action(*args) dans la simulation, juste avant le prochain tick"""
+        if action not in self.ACTIONS:
+            raise ValueError(f"Action inconnue: {action}")
+        self.actions.put((action, args))
+
+    def run_actions(self):
+        """Applique les actions reçues depuis le dernier appel"""
+        while True:
+            try:
+                action, args = self.actions.get_nowait()
+            except queue.Empty:
+                return
+            if action in self.ACTIONS:
+                getattr(self, action)(*args)
+
+    def is_running(self):
+        """La partie est-elle encore en cours ?"""
+        return self.game_logic.is_running() and not self.stop_event.is_set()
+
+    def step(self):
+        """Un tick de simulation (même ordre que KitchenSimulation.step)"""
+        self.game_logic.update_timer()
+        self.game_logic.reduce_combo_over_time()
+        self.bot_manager.update(self.tick_dt)
+        self.clock.advance(self.tick_dt)
+        self.tick += 1
+
+    def advance(self, dt):
+        """
+        Avance de dt secondes réelles : exécute tous les ticks entiers qu'elles contiennent
+
+        Returns:
+            int: Nombre de ticks exécutés
+        """
+        self.run_actions()
+        # Temps plafonné : une pause ne déclenche pas une avalanche de ticks
+        self.accumulator += min(dt, MAX_FRAME_TIME) * self.time_scale
+        ticks = 0
+        while self.accumulator >= self.tick_dt and self.game_logic.is_running():
+            self.step()
+            self.accumulator -= self.tick_dt
+            ticks += 1
+        if ticks or not self.game_logic.is_running():
+            self.publish()
+        return ticks
+
+    def publish(self):
+        """Fige l'état courant et le rend visible au rendu"""
+        snapshot = KitchenSnapshot.capture(self.tick, self.tick_dt, self.bot_manager,
+                                           self.order_manager, self.game_logic.is_running())
+        self.buffer.publish(snapshot, time.perf_counter(), self.accumulator)
+
+    def render_snapshot(self, now=None):
+        """
+        Snapshot à afficher maintenant, interpolé entre les deux derniers ticks
+
+        Le temps de jeu écoulé depuis le dernier tick est le reste de l'accumulateur
+        au moment de la publication, plus le temps réel écoulé depuis.
+        """
+        snapshot, published_at, remainder = self.buffer.latest()
+        now = time.perf_counter() if now is None else now
+        elapsed = remainder + (now - published_at) * self.time_scale
+        return snapshot.interpolated(elapsed / self.tick_dt)
+
+    def start(self):
+        """Lance la simulation dans son propre thread"""
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def run(self):
+        """Boucle du thread de simulation : avance puis dort jusqu'au prochain tick"""
+        last = time.perf_counter()
+        while not self.stop_event.is_set():
+            now = time.perf_counter()
+            try:
+                self.advance(now - last)
+            except Exception as e:
+                print(f"⚠ Erreur mise à jour multi-agents: {e}")
+                traceback.print_exc()
+            last = now
+            if not self.game_logic.is_running():
+                return
+            self.stop_event.wait(max(0.0, (self.tick_dt - self.accumulator) / self.time_scale))
+
+    def stop(self):
+        """Arrête le thread de simulation et attend sa fin"""
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+            self.thread = None
+
+    def final_stats(self):
+        """Arrête la simulation et retourne les statistiques de fin de partie"""
+        self.stop()
+        self.game_logic.stop()
+        stats = self.game_logic.calculate_final_stats()
+        stats['score'] = game_state.score
+        stats['total_chefs'] = len(self.bot_manager.bots)
+        stats['leaderboard'] = self.bot_manager.get_leaderboard()
+        return stats
+
+    # Actions du joueur (exécutées par la simulation, entre deux ticks)
+
+    def add_order(self, order_name, ingredients):
+        """Entrée / F1 - Ajoute une commande à la file"""
+        self.order_manager.add_order(order_name, ingredients)
+
+    def set_time_scale(self, time_scale):
+        """F7 - Vitesse de jeu"""
+        self.time_scale = time_scale
+
+    def reset_competition(self):
+        """F2 - Vide les commandes et remet les chefs au repos"""
+        self.order_manager.reset()
+        for bot in self.bot_manager.bots:
+            bot.state = "idle"
+            bot.inv = None
+            bot.preparing = None
+            bot.plating = False
+        print("🔧 DEBUG: Système complètement réinialisé")
+
+    def print_interaction_zones(self):
+        """F3 - Zones d'interaction des chefs"""
+        print("\n🗺️ ZONES D'INTERACTION:")
+        if self.bot_manager.bots:
+            for name, coords in self.bot_manager.bots[0].interaction_zones.items():
+                print(f"   - {name}: {coords}")
+
+    def print_chef_details(self):
+        """F4 - Info détaillée des chefs"""
+        print("\n👨‍🍳 INFO DÉTAILLÉE DES CHEFS:")
+        for i, bot in enumerate(self.bot_manager.bots, 1):
+            info = bot.get_debug_info()
+            print(f"\nChef {i} - {info['name']}:")
+            print(f"  Position: {info['position']}")
+            print(f"  État: {bot.get_state_text()}")
+            print(f"  Inventaire: {info['inventory']}")
+            print(f"  En préparation: {info['preparing']}")
+            print(f"  A une commande: {info['has_order']}")
+            print(f"  Motivation: {info['motivation']}")
+            
+            progress = self.order_manager.get_chef_progress(bot.bot_id)
+            if progress:
+                print(f"  🍽️ Commande actuelle: {progress['order_name']}")
+                print(f"     Progression: {progress['prepared']}/{progress['required']}")
+                print(f"     Manquants: {list(progress['ingredients_needed'])}")
+
+    def print_leaderboard(self):
+        """F5 - Classement des chefs"""
+        print("\n🏆 CLASSEMENT DES CHEFS:")
+        for i, entry in enumerate(self.bot_manager.get_leaderboard(), 1):
+            print(f"{i}. {entry['name']}: {entry['score']} points")
+            print(f"   - Plats livrés: {entry['stats']['dishes_delivered']}")
+
+    def print_order_system(self):
+        """F6 - Système de commandes"""
+        print("\n📋 SYSTÈME DE COMMANDES:")
+        status = self.order_manager.get_status_summary()
+        print(f"  Disponibles: {status['available_orders']}")
+        print(f"  Actives: {status['active_orders']}")
+        print(f"  Complétées: {status['completed_orders']}")
+        print(f"  Expirées: {status['expired_orders']}")
+        
+        if status['chefs_working']:
+            print("\n  👨‍🍳 Chefs en action:")
+            for chef_info in status['chefs_working']:
+                print(f"    - {chef_info['chef']}: {chef_info['order']} ({chef_info['progress']})")
+        
+        if self.order_manager.available_orders:
+            print("\n  📋 File d'attente (par urgence):")
+            now = game_state.clock.time()
+            for i, order in enumerate(self.order_manager.peek_orders(5), 1):
+                print(f"    {i}. {order['name']} (expire dans {order['deadline'] - now:.0f}s)")
+
+
+class SharedSimulationRunner(SimulationRunner):
+    """SimulationRunner du processus de simulation : publie dans un SharedKitchenState"""
+
+    def __init__(self, shared, *args, **kwargs):
+        self.shared = shared
+        super().__init__(*args, **kwargs)
+
+    def publish(self):
+        """Écrit l'état courant dans la mémoire partagée (instants en time.monotonic, communs aux processus)"""
+        self.shared.publish(self.tick, self.tick_dt, self.bot_manager, self.order_manager,
+                            self.game_logic.is_running(), time.monotonic(), self.accumulator, self.time_scale)
+
+
+def run_simulation_process(shared_name, capacity, scenario, tick_rate, time_scale, actions, results, verbose=True):
+    """Point d'entrée du processus de simulation (mode SIMULATION_MODE = "process")"""
+    from game.shared_state import SharedKitchenState
+    from game.simulation import KitchenSimulation
+
+    shared = SharedKitchenState.attach(shared_name, capacity)
+    try:
+        simulation = KitchenSimulation(scenario, verbose=verbose)
+        with simulation.output:
+            runner = SharedSimulationRunner(shared, simulation.bot_manager, simulation.order_manager,
+                                            simulation.game_logic, simulation.clock, tick_rate, time_scale,
+                                            actions=actions)
+            runner.run()
+            results.put(runner.final_stats())
+    finally:
+        shared.close()
+
+
+class SimulationProcess:
+    """
+    La simulation dans un processus séparé, vue comme un SimulationRunner
+
+    Même interface pour la boucle de rendu : submit(), render_snapshot(),
+    time_scale / set_time_scale(), start(), final_stats(). Le processus est
+    lancé en "spawn" (il n'hérite pas de SDL) et ne charge pas pygame.
+    """
+
+    ACTIONS = SimulationRunner.ACTIONS
+
+    def __init__(self, scenario=None, tick_rate=TICK_RATE, time_scale=1, capacity=None, verbose=True):
+        """
+        Args:
+            scenario: Scénario de KitchenSimulation (clé 'chefs') ; par défaut les chefs du jeu
+            capacity: Nombre max de chefs publiés (par défaut ceux du scénario)
+            verbose: Si False, les logs de la simulation sont ignorés
+        """
+        from game.shared_state import SharedKitchenState
+        from game.simulation import DEFAULT_CHEFS
+
+        self.scenario = dict(scenario or {})
+        self.time_scale = time_scale
+        capacity = capacity or len(self.scenario.get('chefs', DEFAULT_CHEFS))
+        self.shared = SharedKitchenState.create(capacity)
+
+        context = multiprocessing.get_context("spawn")
+        self.actions = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(
+            target=run_simulation_process, name="simulation", daemon=True,
+            args=(self.shared.name, capacity, self.scenario, tick_rate, time_scale, self.actions, self.results,
+                  verbose)
+        )
+        self.last_snapshot = None
+
+    def start(self):
+        """Lance le processus (sans attendre : son démarrage recouvre le reste de l'initialisation)"""
+        self.process.start()
+        return self.process
+
+    def wait_ready(self, timeout=10.0):
+        """Attend le premier état publié par le processus de simulation"""
+        deadline = time.monotonic() + timeout
+        while not self.shared.ready():
+            if not self.process.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Le processus de simulation n'a pas démarré")
+            time.sleep(0.005)
+
+    def submit(self, action, *args):
+        """Envoie une action au processus de simulation"""
+        if action not in self.ACTIONS:
+            raise ValueError(f"Action inconnue: {action}")
+        self.actions.put((action, args))
+
+    def set_time_scale(self, time_scale):
+        """F7 - Vitesse de jeu"""
+        self.time_scale = time_scale
+        self.submit("set_time_scale", time_scale)
+
+    def render_snapshot(self, now=None):
+        """Snapshot à afficher maintenant, lu en mémoire partagée et interpolé"""
+        if self.last_snapshot is None:
+            self.wait_ready()
+        snapshot, published_at, remainder = self.shared.latest()
+        now = time.monotonic() if now is None else now
+        elapsed = remainder + (now - published_at) * self.shared.time_scale()
+        snapshot = snapshot.interpolated(elapsed / snapshot.tick_dt)
+        if not self.process.is_alive():
+            snapshot = snapshot._replace(running=False)  # processus arrêté : plus rien n'avancera
+        self.last_snapshot = snapshot
+        return snapshot
+
+    def stop(self, timeout=5.0):
+        """Arrête le processus de simulation"""
+        if self.process.is_alive():
+            self.submit("stop")
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+    def final_stats(self, timeout=5.0):
+        """Arrête la simulation, récupère ses statistiques de fin et libère la mémoire partagée"""
+        if self.process.is_alive():
+            self.submit("stop")
+        try:
+            stats = self.results.get(timeout=timeout)
+        except queue.Empty:
+            # Processus mort en route : statistiques du dernier état publié
+            snapshot = self.last_snapshot or self.render_snapshot()
+            stats = {'score': snapshot.score, 'total_chefs': len(snapshot.chefs),
+                     'leaderboard': list(snapshot.leaderboard)}
+        self.stop()
+        self.shared.close()
+        self.shared.unlink()
+        return stats
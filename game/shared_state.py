@@ -0,0 +1,309 @@
+"""
+Shared kitchen state - État de la cuisine en mémoire partagée entre deux processus
+✅ Tableaux NumPy à disposition fixe (positions, codes d'état, inventaires, scores) dans un bloc shared_memory
+✅ Le processus de simulation y écrit après chaque série de ticks : ni pickle ni file de messages
+✅ Le processus de rendu lit les mêmes tableaux sur place et en fait un KitchenSnapshot
+✅ Compteur de séquence (seqlock) : une lecture croisant une écriture est simplement recommencée
+"""
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from game.snapshot import ChefSnapshot, KitchenSnapshot, SnapshotClock
+
+# Colonnes des tableaux (un nom = un index)
+HEADER_INTS = ("sequence", "tick", "running", "chef_count", "score", "combo",
+               "available_orders", "active_orders", "completed_orders", "expired_orders", "working_count",
+               "ingredient_count", "prepared_count", "plated_dish", "current_order_name", "queue_count")
+HEADER_FLOATS = ("clock", "timer", "tick_dt", "published_at", "remainder", "time_scale")
+CHEF_INTS = ("bot_id", "chef_name", "state", "inv", "preparing", "state_text", "plating",
+             "score", "has_order", "dishes_delivered", "chef_hat_height")
+CHEF_FLOATS = ("prep_time", "plate_time", "prep_duration", "PLATING_TIME", "motivation", "animation_time")
+CHEF_COLORS = ("chef_body_color", "chef_hat_color", "chef_pants_color", "chef_skin_color", "state_color")
+INGREDIENT_FIELDS = ("x", "y", "type", "taken", "spawn_time")
+WORKING_FIELDS = ("chef", "order", "progress")
+
+H = {name: index for index, name in enumerate(HEADER_INTS)}
+F = {name: index for index, name in enumerate(HEADER_FLOATS)}
+
+INGREDIENT_CAPACITY = 256
+PREPARED_CAPACITY = 32
+STRING_CAPACITY = 4096
+STRING_WIDTH = 96  # octets UTF-8 par chaîne (au-delà, tronquée)
+
+
+def build_layout(capacity):
+    """(nom, dtype, forme) de chaque tableau du bloc, dans l'ordre"""
+    return [
+        ("header_ints", np.int64, (len(HEADER_INTS),)),
+        ("header_floats", np.float64, (len(HEADER_FLOATS),)),
+        ("positions", np.float64, (capacity, 2)),
+        ("previous", np.float64, (capacity, 2)),
+        ("targets", np.float64, (capacity, 2)),
+        ("chef_ints", np.int64, (capacity, len(CHEF_INTS))),
+        ("chef_floats", np.float64, (capacity, len(CHEF_FLOATS))),
+        ("chef_colors", np.uint8, (capacity, len(CHEF_COLORS), 3)),
+        ("working", np.int64, (capacity, len(WORKING_FIELDS))),
+        ("ingredients", np.float64, (INGREDIENT_CAPACITY, len(INGREDIENT_FIELDS))),
+        ("prepared", np.int64, (PREPARED_CAPACITY,)),
+        ("queue_head", np.int64, (KitchenSnapshot.QUEUE_HEAD,)),
+        ("string_count", np.int64, (1,)),
+        ("strings", np.uint8, (STRING_CAPACITY, STRING_WIDTH))
+    ]
+
+
+def layout_size(capacity):
+    """Taille du bloc en octets (chaque tableau aligné sur 8 octets)"""
+    size = 0
+    for _, dtype, shape in build_layout(capacity):
+        size += -size % 8
+        size += int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return size
+
+
+class SharedStrings:
+    """
+    Table de chaînes en ajout seul, stockée dans le bloc partagé
+
+    Les tableaux ne contiennent que des ids (-1 = None). Une chaîne est écrite
+    avant que son id apparaisse dans un tableau, et n'est jamais modifiée :
+    le lecteur garde ses décodages d'une lecture à l'autre.
+    """
+
+    def __init__(self, count, slots):
+        self.count = count
+        self.slots = slots
+        self.ids = {}
+        self.names = []
+
+    def intern(self, text):
+        """Id de text, ajouté à la table si nécessaire (écrivain seulement)"""
+        if text is None:
+            return -1
+        index = self.ids.get(text)
+        if index is None:
+            index = int(self.count[0])
+            if index >= len(self.slots):
+                return -1  # table pleine : la chaîne s'affichera comme absente
+            encoded = str(text).encode()[:STRING_WIDTH]
+            self.slots[index] = 0
+            self.slots[index, :len(encoded)] = np.frombuffer(encoded, np.uint8)
+            self.count[0] = index + 1
+            self.ids[text] = index
+        return index
+
+    def decoded(self, count):
+        """
+        Chaînes d'id 0..count-1 (lecteur), suivies de None
+
+        L'id -1 désigne ainsi None par simple indexation : names[index].
+        """
+        names = self.names
+        if names:
+            names.pop()
+        while len(names) < count:
+            names.append(self.slots[len(names)].tobytes().rstrip(b"\0").decode(errors="ignore"))
+        names.append(None)
+        return names
+
+
+class SharedKitchenState:
+    """
+    Bloc shared_memory contenant l'état publié de la cuisine
+
+    Même rôle que SnapshotBuffer, entre processus : publish() côté simulation,
+    latest() côté rendu. Le créateur (create) possède le bloc et le détruit avec
+    unlink() ; l'autre processus s'y rattache avec attach().
+    """
+
+    def __init__(self, memory, capacity, owner):
+        self.memory = memory
+        self.capacity = capacity
+        self.owner = owner
+        self.name = memory.name
+
+        offset = 0
+        for name, dtype, shape in build_layout(capacity):
+            offset += -offset % 8
+            array = np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+            setattr(self, name, array)
+            offset += array.nbytes
+        self.string_table = SharedStrings(self.string_count, self.strings)
+
+    @classmethod
+    def create(cls, capacity):
+        """Nouveau bloc pour capacity chefs (mis à zéro)"""
+        memory = shared_memory.SharedMemory(create=True, size=layout_size(capacity))
+        memory.buf[:] = bytes(memory.size)
+        return cls(memory, capacity, owner=True)
+
+    @classmethod
+    def attach(cls, name, capacity):
+        """
+        Rattache un processus au bloc créé par un autre
+
+        Prévu pour un processus lancé par le créateur (multiprocessing) : ils
+        partagent le même resource_tracker, qui ne détruit le bloc qu'avec unlink().
+        """
+        return cls(shared_memory.SharedMemory(name=name), capacity, owner=False)
+
+    def publish(self, tick, tick_dt, bot_manager, order_manager, running, published_at, remainder, time_scale):
+        """Écrit l'état courant (processus de simulation, entre deux ticks)"""
+        import game_state
+
+        strings = self.string_table.intern
+        bots = bot_manager.bots[:self.capacity]
+        n = len(bots)
+        status = order_manager.get_status_summary()
+        working = status['chefs_working'][:self.capacity]
+        ingredients = game_state.ingredients[:INGREDIENT_CAPACITY]
+        prepared = list(game_state.prepared_ingredients)[:PREPARED_CAPACITY]
+        queue_head = order_manager.peek_orders(KitchenSnapshot.QUEUE_HEAD)
+
+        # Tout est converti avant d'ouvrir l'écriture : la fenêtre du seqlock reste courte
+        chef_ints = [
+            (bot.bot_id, strings(bot.chef_name), strings(bot.state), strings(bot.inv), strings(bot.preparing),
+             strings(bot.get_state_text()), bot.plating, bot_manager.bot_scores.get(bot.bot_id, 0),
+             bot.has_order, bot_manager.bot_stats[bot.bot_id]["dishes_delivered"], bot.chef_hat_height)
+            for bot in bots
+        ]
+        chef_floats = [
+            (bot.prep_time, bot.plate_time, bot.prep_times.get(bot.preparing, 1.5), bot.PLATING_TIME,
+             bot.motivation, bot.animation_time)
+            for bot in bots
+        ]
+        chef_colors = [
+            (bot.chef_body_color, bot.chef_hat_color, bot.chef_pants_color, bot.chef_skin_color,
+             bot.get_state_color())
+            for bot in bots
+        ]
+        working_rows = [(strings(info['chef']), strings(info['order']), strings(info['progress']))
+                        for info in working]
+        ingredient_rows = [(ing["x"], ing["y"], strings(ing["type"]), ing["taken"], ing.get("spawn_time", 0))
+                           for ing in ingredients]
+        prepared_ids = [strings(name) for name in prepared]
+        queue_ids = [strings(order["name"]) for order in queue_head]
+        header = {
+            "tick": tick, "running": running, "chef_count": n, "score": game_state.score,
+            "combo": getattr(game_state, "combo", 0),
+            "available_orders": status['available_orders'], "active_orders": status['active_orders'],
+            "completed_orders": status['completed_orders'], "expired_orders": status['expired_orders'],
+            "working_count": len(working_rows),
+            "ingredient_count": len(ingredient_rows), "prepared_count": len(prepared_ids),
+            "plated_dish": strings(getattr(game_state, "plated_dish", None)),
+            "current_order_name": strings(game_state.current_order_name), "queue_count": len(queue_ids)
+        }
+        indices = [bot.movement_index for bot in bots]
+
+        sequence = self.header_ints[H["sequence"]]
+        self.header_ints[H["sequence"]] = sequence + 1  # impair : écriture en cours
+        if n:
+            movement = bots[0].movement
+            self.positions[:n] = movement.positions[indices]
+            self.previous[:n] = movement.previous[indices]
+            self.targets[:n] = movement.targets[indices]
+            self.chef_ints[:n] = chef_ints
+            self.chef_floats[:n] = chef_floats
+            self.chef_colors[:n] = chef_colors
+        if working_rows:
+            self.working[:len(working_rows)] = working_rows
+        if ingredient_rows:
+            self.ingredients[:len(ingredient_rows)] = ingredient_rows
+        self.prepared[:len(prepared_ids)] = prepared_ids
+        self.queue_head[:len(queue_ids)] = queue_ids
+        for name, value in header.items():
+            self.header_ints[H[name]] = value
+        self.header_floats[:] = (game_state.clock.time(), game_state.timer, tick_dt,
+                                 published_at, remainder, time_scale)
+        self.header_ints[H["sequence"]] = sequence + 2  # pair : état complet
+
+    def ready(self):
+        """Un premier état a-t-il été publié ?"""
+        return self.header_ints[H["sequence"]] >= 2
+
+    def read(self):
+        """Copie cohérente des tableaux utiles (recommencée si une écriture l'a croisée)"""
+        while True:
+            sequence = int(self.header_ints[H["sequence"]])
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            header = self.header_ints.tolist()
+            floats = self.header_floats.tolist()
+            n = header[H["chef_count"]]
+            raw = (header, floats, int(self.string_count[0]),
+                   self.positions[:n].tolist(), self.previous[:n].tolist(), self.targets[:n].tolist(),
+                   self.chef_ints[:n].tolist(), self.chef_floats[:n].tolist(), self.chef_colors[:n].tolist(),
+                   self.working[:header[H["working_count"]]].tolist(),
+                   self.ingredients[:header[H["ingredient_count"]]].tolist(),
+                   self.prepared[:header[H["prepared_count"]]].tolist(),
+                   self.queue_head[:header[H["queue_count"]]].tolist())
+            if int(self.header_ints[H["sequence"]]) == sequence:
+                return raw
+
+    def latest(self):
+        """
+        Dernier état publié, comme SnapshotBuffer.latest()
+
+        Returns:
+            tuple: (KitchenSnapshot, instant de publication (time.monotonic), reste de l'accumulateur)
+        """
+        (header, floats, string_count, positions, previous, targets, chef_ints, chef_floats, chef_colors,
+         working, ingredients, prepared, queue_head) = self.read()
+        names = self.string_table.decoded(string_count)
+
+        chefs = []
+        leaderboard = []
+        for (x, y), (previous_x, previous_y), (target_x, target_y), ints, reals, colors in zip(
+                positions, previous, targets, chef_ints, chef_floats, chef_colors):
+            (bot_id, chef_name, state, inv, preparing, state_text, plating,
+             score, has_order, dishes_delivered, hat_height) = ints
+            prep_time, plate_time, prep_duration, plating_time, motivation, animation_time = reals
+            preparing = names[preparing]
+            chefs.append(ChefSnapshot(
+                bot_id, names[chef_name], x, y, previous_x, previous_y, 1.0, target_x, target_y,
+                names[state], names[inv], preparing, bool(plating), prep_time, plate_time,
+                {preparing: prep_duration} if preparing else {}, plating_time, motivation, animation_time,
+                *(tuple(color) for color in colors[:4]), hat_height,
+                names[state_text], tuple(colors[4]), score, bool(has_order)
+            ))
+            leaderboard.append({"name": names[chef_name], "score": score,
+                                "stats": {"dishes_delivered": dishes_delivered}})
+        leaderboard.sort(key=lambda entry: entry["score"], reverse=True)
+        order_status = {
+            'available_orders': header[H["available_orders"]],
+            'active_orders': header[H["active_orders"]],
+            'completed_orders': header[H["completed_orders"]],
+            'expired_orders': header[H["expired_orders"]],
+            'chefs_working': [{'chef': names[chef], 'order': names[order], 'progress': names[progress]}
+                              for chef, order, progress in working]
+        }
+        snapshot = KitchenSnapshot(
+            header[H["tick"]], floats[F["tick_dt"]], SnapshotClock(floats[F["clock"]]), bool(header[H["running"]]),
+            tuple(chefs),
+            tuple({"x": x, "y": y, "type": names[int(kind)], "taken": bool(taken), "spawn_time": spawn_time}
+                  for x, y, kind, taken, spawn_time in ingredients),
+            tuple(names[ingredient] for ingredient in prepared), names[header[H["plated_dish"]]],
+            names[header[H["current_order_name"]]],
+            header[H["score"]], floats[F["timer"]], header[H["combo"]],
+            tuple(leaderboard), order_status, tuple(names[order] for order in queue_head)
+        )
+        return snapshot, floats[F["published_at"]], floats[F["remainder"]]
+
+    def time_scale(self):
+        """Vitesse de jeu appliquée par la simulation"""
+        return float(self.header_floats[F["time_scale"]])
+
+    def close(self):
+        """Détache ce processus du bloc"""
+        # Les vues NumPy doivent disparaître avant de fermer le mapping
+        for name, _, _ in build_layout(self.capacity):
+            setattr(self, name, None)
+        self.string_table = None
+        self.memory.close()
+
+    def unlink(self):
+        """Détruit le bloc (créateur seulement, après close)"""
+        if self.owner:
+            self.memory.unlink()
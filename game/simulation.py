@@ -0,0 +1,203 @@
+"""
+Simulation headless - Fait tourner la cuisine sans affichage ni pygame
+✅ Pas de temps fixe (TICK_RATE ticks par seconde simulée)
+✅ Aussi vite que le CPU le permet - aucune attente réelle
+✅ Mêmes BotManager / OrderManager / GameLogic que le jeu interactif
+"""
+import contextlib
+import random
+
+import game_state
+from config import GAME_DURATION, TICK_RATE, competition_recipes
+from entities.bot import Bot, BotManager
+from entities.order_manager import OrderManager
+from game.logic import GameLogic
+from utils.clock import ManualClock
+
+# Zones d'interaction (identiques à KitchenRenderer.get_interaction_zones())
+DEFAULT_INTERACTION_ZONES = {
+    'fridge_access': (170, 460),
+    'cutting_board': (410, 300),
+    'plating_station': (670, 300),
+    'delivery': (770, 330)
+}
+
+# Chefs du jeu interactif
+DEFAULT_CHEFS = [
+    {"name": "Chef Marcel", "x": 300, "y": 400, "color_variant": 0},
+    {"name": "Chef Sophie", "x": 500, "y": 400, "color_variant": 1}
+]
+
+
+class NullOutput:
+    """Sortie qui ignore tout (logs des bots en simulation silencieuse)"""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def build_order_schedule(orders):
+    """
+    Convertit la liste de commandes d'un scénario en planning par tick
+
+    Args:
+        orders: Liste de noms de recettes (ajoutées au tick 0)
+                ou de tuples (tick, nom_recette)
+
+    Returns:
+        dict: {tick: [noms de recettes]}
+    """
+    schedule = {}
+    for order in orders:
+        if isinstance(order, str):
+            tick, order_name = 0, order
+        else:
+            tick, order_name = order
+        schedule.setdefault(int(tick), []).append(order_name)
+    return schedule
+
+
+def random_order_stream(seed, interval=4.0, batch=1, recipes=None,
+                        tick_rate=TICK_RATE, duration=GAME_DURATION):
+    """
+    Génère un flux de commandes aléatoire reproductible
+
+    Args:
+        seed: Graine du générateur (même graine = même flux)
+        interval: Secondes simulées entre deux arrivées de commandes
+        batch: Nombre de commandes par arrivée
+        recipes: {recette: [ingrédients]} parmi lesquelles tirer
+
+    Returns:
+        list: [(tick, nom_recette)] utilisable comme scenario['orders']
+    """
+    rng = random.Random(seed)
+    recipe_names = sorted(recipes or competition_recipes)
+    orders = []
+    arrival = 0.0
+    while arrival < duration:
+        tick = int(arrival * tick_rate)
+        for _ in range(batch):
+            orders.append((tick, rng.choice(recipe_names)))
+        arrival += interval
+    return orders
+
+
+class KitchenSimulation:
+    """
+    Cuisine simulée pas à pas, sans affichage
+    Installe une horloge manuelle dans game_state et l'avance d'un tick par step()
+    """
+
+    def __init__(self, scenario=None, verbose=False):
+        """
+        Args:
+            scenario: dict avec les clés optionnelles
+                - 'chefs': liste de {name, x, y, color_variant, overrides}
+                  (overrides: attributs du Bot à remplacer, ex: BOT_SPEED en px/seconde)
+                - 'orders': liste de recettes ou de (tick, recette)
+                - 'recipes': {recette: [ingrédients]}
+                - 'tick_rate': ticks par seconde simulée
+            verbose: Si False, les logs des bots sont ignorés
+        """
+        scenario = scenario or {}
+        self.tick_rate = scenario.get('tick_rate', TICK_RATE)
+        self.dt = 1.0 / self.tick_rate
+        self.recipes = scenario.get('recipes', competition_recipes)
+        self.schedule = build_order_schedule(scenario.get('orders', []))
+        self.output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(NullOutput())
+        self.tick = 0
+
+        self.clock = ManualClock()
+        game_state.set_clock(self.clock)
+
+        with self.output:
+            game_state.initialize_game()
+            game_state.available_ingredients = self.recipes
+
+            self.order_manager = OrderManager()
+            game_state.order_manager = self.order_manager
+
+            self.bot_manager = BotManager()
+            game_state.bot_manager = self.bot_manager
+
+            for chef in scenario.get('chefs', DEFAULT_CHEFS):
+                bot = Bot(x=chef.get("x", 350), y=chef.get("y", 400),
+                          chef_name=chef.get("name", "Chef"),
+                          color_variant=chef.get("color_variant", 0))
+                for attribute, value in chef.get("overrides", {}).items():
+                    setattr(bot, attribute, value)
+                bot.update_interaction_zones(dict(DEFAULT_INTERACTION_ZONES))
+                self.bot_manager.add_bot(bot)
+
+            self.game_logic = GameLogic()
+
+    def is_running(self):
+        """Vérifie si la partie simulée est encore en cours"""
+        return self.game_logic.is_running()
+
+    def step(self):
+        """Avance la simulation d'un tick"""
+        with self.output:
+            for order_name in self.schedule.get(self.tick, ()):
+                self.order_manager.add_order(order_name, self.recipes[order_name])
+
+            self.game_logic.update_timer()
+            self.game_logic.reduce_combo_over_time()
+            self.bot_manager.update(self.dt)
+
+        self.clock.advance(self.dt)
+        self.tick += 1
+
+    def run(self, ticks):
+        """Avance jusqu'au tick donné ou jusqu'à la fin de la partie"""
+        while self.tick < ticks and self.is_running():
+            self.step()
+
+    def snapshot(self):
+        """État figé au tick courant (KitchenSnapshot), tel que le rendu le lit"""
+        from game.snapshot import KitchenSnapshot
+        return KitchenSnapshot.capture(self.tick, self.dt, self.bot_manager, self.order_manager,
+                                       self.is_running())
+
+    def get_results(self):
+        """Scores finaux, classement et commandes complétées"""
+        return {
+            'ticks': self.tick,
+            'sim_time': self.clock.time(),
+            'score': game_state.score,
+            'scores': {bot.chef_name: self.bot_manager.bot_scores[bot.bot_id]
+                       for bot in self.bot_manager.bots},
+            'leaderboard': self.bot_manager.get_leaderboard(),
+            'completed_orders': list(self.order_manager.completed_orders),
+            'expired_orders': len(self.order_manager.expired_orders),
+            'available_orders': self.order_manager.get_available_count(),
+            'active_orders': self.order_manager.get_active_count()
+        }
+
+
+def simulate(scenario=None, ticks=None, verbose=False):
+    """
+    Simule une partie complète sans affichage
+
+    Args:
+        scenario: Voir KitchenSimulation
+        ticks: Nombre maximum de ticks (par défaut: toute la partie)
+        verbose: Si False, les logs des bots sont ignorés
+
+    Returns:
+        dict: scores finaux, classement et commandes complétées
+    """
+    previous_clock = game_state.clock
+    try:
+        simulation = KitchenSimulation(scenario, verbose)
+        if ticks is None:
+            ticks = int(GAME_DURATION * simulation.tick_rate)
+        simulation.run(ticks)
+    finally:
+        game_state.set_clock(previous_clock)
+
+    return simulation.get_results()
@@ -0,0 +1,145 @@
+"""
+Snapshots - État figé de la cuisine à la fin d'un tick de simulation
+✅ Le rendu lit un snapshot, plus BotManager / OrderManager / game_state en direct
+✅ Immuables (namedtuples, tuples) : publiés par la simulation, partagés sans copie
+✅ SnapshotBuffer : double tampon entre le thread de simulation et le thread de rendu
+"""
+import threading
+from collections import namedtuple
+
+import game_state
+from entities.bot import Bot
+
+
+class SnapshotClock(namedtuple("SnapshotClock", "current")):
+    """Horloge figée : même interface que game_state.clock pour les renderers"""
+    __slots__ = ()
+
+    def time(self):
+        return self.current
+
+
+class ChefSnapshot(namedtuple("ChefSnapshot", [
+        "bot_id", "chef_name", "x", "y", "previous_x", "previous_y", "alpha",
+        "target_x", "target_y", "state", "inv", "preparing", "plating",
+        "prep_time", "plate_time", "prep_times", "PLATING_TIME", "motivation", "animation_time",
+        "chef_body_color", "chef_hat_color", "chef_pants_color", "chef_skin_color", "chef_hat_height",
+        "state_text", "state_color", "score", "has_order"])):
+    """
+    Un chef vu par le rendu : mêmes attributs que Bot pour les renderers
+
+    alpha place la position affichée entre le tick précédent et ce tick.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def capture(cls, bot):
+        """Fige l'état d'un Bot (appelé par la simulation, entre deux ticks)"""
+        index = bot.movement_index
+        previous = bot.movement.previous[index]
+        return cls(
+            bot.bot_id, bot.chef_name, bot.x, bot.y, float(previous[0]), float(previous[1]), 1.0,
+            bot.target_x, bot.target_y, bot.state, bot.inv, bot.preparing, bot.plating,
+            bot.prep_time, bot.plate_time, bot.prep_times, bot.PLATING_TIME, bot.motivation, bot.animation_time,
+            bot.chef_body_color, bot.chef_hat_color, bot.chef_pants_color, bot.chef_skin_color, bot.chef_hat_height,
+            bot.get_state_text(), bot.get_state_color(), bot.score, bot.has_order
+        )
+
+    @property
+    def display_x(self):
+        return self.previous_x + (self.x - self.previous_x) * self.alpha
+
+    @property
+    def display_y(self):
+        return self.previous_y + (self.y - self.previous_y) * self.alpha
+
+    def get_state_text(self):
+        return self.state_text
+
+    def get_state_color(self):
+        return self.state_color
+
+    def draw_chef(self, screen, position=None):
+        """Même dessin que Bot.draw_chef, à partir de l'état figé"""
+        return Bot.draw_chef(self, screen, position)
+
+
+class KitchenSnapshot(namedtuple("KitchenSnapshot", [
+        "tick", "tick_dt", "clock", "running", "chefs", "ingredients",
+        "prepared_ingredients", "plated_dish", "current_order_name",
+        "score", "timer", "combo", "leaderboard", "order_status", "queue_head"])):
+    """
+    Toute la cuisine à la fin d'un tick
+
+    Expose les noms de game_state lus par les renderers (clock, ingredients,
+    prepared_ingredients, plated_dish, current_order_name) : un renderer peut
+    lire indifféremment game_state ou un snapshot.
+    """
+    __slots__ = ()
+
+    QUEUE_HEAD = 3  # commandes en file affichées par le HUD
+
+    @classmethod
+    def capture(cls, tick, tick_dt, bot_manager, order_manager, running=True):
+        """Fige l'état courant (appelé par la simulation, entre deux ticks)"""
+        leaderboard = tuple(dict(entry, stats=dict(entry["stats"])) for entry in bot_manager.get_leaderboard())
+        return cls(
+            tick, tick_dt, SnapshotClock(game_state.clock.time()), running,
+            tuple(ChefSnapshot.capture(bot) for bot in bot_manager.bots),
+            tuple(dict(ingredient) for ingredient in game_state.ingredients),
+            tuple(game_state.prepared_ingredients), getattr(game_state, "plated_dish", None),
+            game_state.current_order_name,
+            game_state.score, game_state.timer, getattr(game_state, "combo", 0),
+            leaderboard, order_manager.get_status_summary(),
+            tuple(order["name"] for order in order_manager.peek_orders(cls.QUEUE_HEAD))
+        )
+
+    def interpolated(self, alpha):
+        """
+        Snapshot affiché une fraction alpha du tick suivant après celui-ci
+
+        Les chefs sont placés entre leur position précédente et leur position
+        courante ; l'horloge des animations avance de alpha * tick_dt.
+        """
+        alpha = min(1.0, max(0.0, alpha))
+        return self._replace(
+            clock=SnapshotClock(self.clock.current + alpha * self.tick_dt),
+            chefs=tuple(chef._replace(alpha=alpha) for chef in self.chefs)
+        )
+
+
+class SnapshotBuffer:
+    """
+    Double tampon de snapshots
+
+    La simulation construit le snapshot suivant (tampon arrière) pendant que
+    le rendu dessine le dernier publié (tampon avant) ; publish() échange les
+    deux sous verrou. Les snapshots étant immuables, l'échange est un simple
+    changement de référence : le rendu ne voit jamais un tick à moitié écrit.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.front = None
+        self.published_at = 0.0
+        self.remainder = 0.0
+        self.version = 0
+
+    def publish(self, snapshot, published_at, remainder=0.0):
+        """
+        Rend snapshot visible au rendu
+
+        Args:
+            published_at: Instant de publication (perf_counter)
+            remainder: Temps de jeu déjà écoulé vers le tick suivant (reste de l'accumulateur)
+        """
+        with self.lock:
+            self.front = snapshot
+            self.published_at = published_at
+            self.remainder = remainder
+            self.version += 1
+
+    def latest(self):
+        """Dernier snapshot publié, son instant de publication et le reste de l'accumulateur"""
+        with self.lock:
+            return self.front, self.published_at, self.remainder
@@ -1,8 +1,8 @@
 """
 État global du jeu Mini Overcooked
 """
-import time
 from config import fridge, recipes, delivery_counter
+from utils.clock import WallClock
 
 # Variables globales de l'état du jeu
 score = 0
@@ -22,6 +22,15 @@ ingredients = []
 # Particules pour effets visuels
 particles = []
 
+# Horloge de la partie (remplaçable par une horloge simulée)
+clock = WallClock()
+
+def set_clock(new_clock):
+    """Remplace l'horloge utilisée par la logique du jeu"""
+    global clock
+    clock = new_clock
+    return clock
+
 def initialize_ingredients():
     """Initialise les ingrédients dans le frigo"""
     global ingredients
@@ -33,7 +42,7 @@ def initialize_ingredients():
                 "y": fridge["y"] + 10 + ((i + ord(t)) % 6) * 18, 
                 "type": t,
                 "taken": False,
-                "spawn_time": time.time()
+                "spawn_time": clock.time()
             })
 
 def reset_order():
@@ -71,7 +80,7 @@ def complete_order():
                 "points": total_points,
                 "x": delivery_counter["x"],
                 "y": delivery_counter["y"],
-                "time": time.time(),
+                "time": clock.time(),
                 "ingredients": prepared_ingredients.copy()
             })
 
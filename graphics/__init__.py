@@ -1,9 +1,25 @@
 """
 Graphics module - Contient tout le code d'affichage
+✅ Exports chargés à la demande : importer graphics.dirty ne charge pas tous les renderers
 """
+import importlib
 
-from .assets import AssetManager
-from .ui import UIRenderer
-from .kitchen import KitchenRenderer
+_EXPORTS = {
+    'AssetManager': '.assets',
+    'UIRenderer': '.ui',
+    'KitchenRenderer': '.kitchen',
+    'DirtyRegions': '.dirty',
+    'GlowCache': '.glow',
+    'DiskSurfaceCache': '.disk_cache'
+}
 
-__all__ = ['AssetManager', 'UIRenderer', 'KitchenRenderer']
\ No newline at end of file
+__all__ = ['AssetManager', 'UIRenderer', 'KitchenRenderer', 'DirtyRegions', 'GlowCache', 'DiskSurfaceCache']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
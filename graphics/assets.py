@@ -1,16 +1,26 @@
 """
 Asset creation - Crée toutes les surfaces et images du jeu
+✅ Toutes les images (et leurs variantes redimensionnées) regroupées dans un atlas
+✅ get_sprite() retourne (atlas, zone) pour les blits groupés (Surface.blits)
+✅ Atlas relu depuis le cache disque : rien n'est dessiné au démarrage s'il est à jour
+✅ Les images séparées (joueur, couteau, tailles hors atlas) sont créées à la demande
 """
 import pygame
 import math
-from config import COLORS
+from config import COLORS, INGREDIENT_IMAGE_SIZES, ATLAS_WIDTH
+from graphics.disk_cache import disk_cache
+
+INGREDIENT_TYPES = ["T", "L", "B", "C", "H"]
 
 class AssetManager:
     def __init__(self):
         self.player_img = None
         self.knife_img = None
         self.ingredient_imgs = {}
-        self.create_all_assets()
+        self.scaled_ingredient_imgs = {}  # (type, taille) -> surface pré-redimensionnée
+        self.atlas = None
+        self.atlas_regions = {}  # clé -> pygame.Rect dans l'atlas
+        self.load_atlas()
 
     def create_player_surface(self):
         """Crée la surface du joueur/bot"""
@@ -73,22 +83,137 @@ class AssetManager:
         return surf
 
     def create_all_assets(self):
-        """Crée tous les assets du jeu"""
+        """Crée tous les assets du jeu et les range dans l'atlas"""
         self.player_img = self.create_player_surface()
         self.knife_img = self.create_knife_surface()
         
         # Créer toutes les images d'ingrédients
-        for ing_type in ["T", "L", "B", "C", "H"]:
+        for ing_type in INGREDIENT_TYPES:
             self.ingredient_imgs[ing_type] = self.create_ingredient_surface(ing_type)
+        
+        # Variantes aux tailles affichées par la cuisine
+        for ing_type, img in self.ingredient_imgs.items():
+            for size in INGREDIENT_IMAGE_SIZES:
+                self.scaled_ingredient_imgs[(ing_type, size)] = pygame.transform.smoothscale(img, (size, size))
+        
+        self.build_atlas()
+        return self.atlas
+
+    def atlas_sizes(self):
+        """Taille de chaque image de l'atlas, connue sans rien dessiner"""
+        sizes = {"player": (50, 50), "knife": (40, 40)}
+        for ing_type in INGREDIENT_TYPES:
+            sizes[(ing_type, None)] = (40, 40)
+            for size in INGREDIENT_IMAGE_SIZES:
+                sizes[(ing_type, size)] = (size, size)
+        return sizes
+
+    def pack_atlas(self, sizes):
+        """
+        Range les images en rangées de hauteur décroissante
+
+        Returns:
+            (zones, hauteur) : clé -> pygame.Rect, et hauteur totale de l'atlas
+        """
+        order = sorted(sizes, key=lambda key: sizes[key][1], reverse=True)
+        regions = {}
+        x = y = row_height = 0
+        for key in order:
+            width, height = sizes[key]
+            if x + width > ATLAS_WIDTH:
+                x, y = 0, y + row_height
+                row_height = 0
+            regions[key] = pygame.Rect(x, y, width, height)
+            x += width
+            row_height = max(row_height, height)
+        return regions, y + row_height
+
+    def build_atlas(self):
+        """
+        Range toutes les images dans une seule surface (rangées de hauteur décroissante)
+        Les clés sont 'player', 'knife' et (type, taille) ; taille None = image d'origine.
+        """
+        images = {"player": self.player_img, "knife": self.knife_img}
+        for ing_type, img in self.ingredient_imgs.items():
+            images[(ing_type, None)] = img
+        images.update(self.scaled_ingredient_imgs)
+        
+        # Même rangement que load_atlas() : les zones se recalculent sans l'atlas
+        regions, height = self.pack_atlas(self.atlas_sizes())
+        self.atlas = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)
+        for key, rect in regions.items():
+            # Copie exacte des pixels (l'atlas est transparent : ADD = copie)
+            self.atlas.blit(images[key], rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self.atlas_regions = regions
+
+    def load_atlas(self):
+        """
+        Atlas depuis le cache disque ; les images ne sont dessinées que s'il est absent
+        ou si le code de dessin a changé (la clé couvre ces méthodes)
+        """
+        sizes = self.atlas_sizes()
+        regions, height = self.pack_atlas(sizes)
+        atlas = disk_cache.get("atlas", (ATLAS_WIDTH, sizes, COLORS), self.create_all_assets,
+                               (self.create_player_surface, self.create_knife_surface,
+                                self.create_ingredient_surface, self.create_all_assets,
+                                self.pack_atlas, self.build_atlas))
+        if atlas.get_size() != (ATLAS_WIDTH, height):
+            atlas = self.create_all_assets()
+        self.atlas = atlas
+        self.atlas_regions = regions
 
     def get_player_image(self):
         """Retourne l'image du joueur"""
+        if self.player_img is None:
+            self.player_img = self.atlas.subsurface(self.atlas_regions["player"])
         return self.player_img
 
     def get_knife_image(self):
         """Retourne l'image du couteau"""
+        if self.knife_img is None:
+            self.knife_img = self.atlas.subsurface(self.atlas_regions["knife"])
         return self.knife_img
 
-    def get_ingredient_image(self, ingredient_type):
-        """Retourne l'image d'un ingrédient"""
-        return self.ingredient_imgs.get(ingredient_type)
\ No newline at end of file
+    def get_ingredient_image(self, ingredient_type, size=None):
+        """
+        Retourne l'image d'un ingrédient
+
+        Args:
+            ingredient_type: Type d'ingrédient
+            size: Côté en pixels ; None pour l'image d'origine (40x40).
+                  Les variantes hors atlas sont lissées (smoothscale) une seule fois puis réutilisées.
+        """
+        images = self.ingredient_imgs if size is None else self.scaled_ingredient_imgs
+        key = ingredient_type if size is None else (ingredient_type, size)
+        img = images.get(key)
+        if img is not None:
+            return img
+        
+        region = self.atlas_regions.get((ingredient_type, size))
+        if region is not None:
+            img = self.atlas.subsurface(region)
+        elif size is not None:
+            base = self.get_ingredient_image(ingredient_type)
+            if base is None:
+                return None
+            img = pygame.transform.smoothscale(base, (size, size))
+        else:
+            return None
+        images[key] = img
+        return img
+
+    def get_sprite(self, ingredient_type, size=None):
+        """
+        Image d'un ingrédient sous forme (surface, zone) pour Surface.blits()
+
+        Returns:
+            (atlas, Rect) si l'image est dans l'atlas, (image, None) pour une
+            taille hors atlas, None si l'ingrédient n'a pas d'image
+        """
+        region = self.atlas_regions.get((ingredient_type, size))
+        if region is not None:
+            return self.atlas, region
+        img = self.get_ingredient_image(ingredient_type, size)
+        if img is None:
+            return None
+        return img, None
\ No newline at end of file
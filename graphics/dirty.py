@@ -0,0 +1,99 @@
+"""
+Dirty rectangles - Régions de l'écran modifiées depuis la dernière présentation
+✅ Chaque renderer déclare ses régions (chefs, contenu des stations, HUD)
+✅ Une région n'est redessinée que si elle bouge, change d'état ou est animée
+✅ present() pousse seulement ces régions avec pygame.display.update(rects)
+"""
+import pygame
+
+
+class DirtyRegions:
+    """
+    Suivi des régions modifiées d'une frame à l'autre
+
+    Le back buffer est toujours recomposé en entier ; seules les régions
+    déclarées ici sont envoyées à l'écran. Une région est identifiée par une
+    clé : son ancienne position est rafraîchie quand elle bouge ou disparaît.
+    """
+
+    MERGE_MARGIN = 8  # fusionne les rectangles qui se touchent presque
+
+    def __init__(self):
+        self.rects = []
+        self.previous = {}  # clé -> (rect, état) de la frame précédente
+        self.seen = set()
+        self.full = True
+
+    def invalidate(self):
+        """Force une présentation complète à la prochaine frame"""
+        self.full = True
+
+    def add(self, rect):
+        """Marque une région comme modifiée pour cette frame"""
+        self.rects.append(pygame.Rect(rect))
+
+    def track(self, key, rect, state=None, animated=False):
+        """
+        Déclare la région d'un élément dessiné cette frame
+
+        Args:
+            key: Identifiant stable de l'élément
+            rect: Zone couverte par l'élément
+            state: Contenu affiché ; la région est marquée s'il change
+            animated: Marque la région à chaque frame (animation continue)
+        """
+        rect = pygame.Rect(rect)
+        last = self.previous.get(key)
+        if animated or last is None or last[0] != rect or last[1] != state:
+            self.rects.append(rect)
+            if last is not None and last[0] != rect:
+                self.rects.append(last[0])
+        self.previous[key] = (rect, state)
+        self.seen.add(key)
+
+    def collect(self, screen_rect):
+        """
+        Termine la frame et retourne les régions à présenter
+
+        Les éléments non redessinés cette frame libèrent leur ancienne région ;
+        les rectangles qui se chevauchent sont fusionnés.
+        """
+        for key in list(self.previous):
+            if key not in self.seen:
+                self.rects.append(self.previous.pop(key)[0])
+        self.seen = set()
+
+        merged = []
+        for rect in self.rects:
+            rect = rect.clip(screen_rect)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            grown = rect.inflate(self.MERGE_MARGIN, self.MERGE_MARGIN)
+            index = grown.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                grown = rect.inflate(self.MERGE_MARGIN, self.MERGE_MARGIN)
+                index = grown.collidelist(merged)
+            merged.append(rect)
+        self.rects = []
+        return merged
+
+    def present(self, screen, enabled=True):
+        """
+        Envoie la frame à l'écran
+
+        Args:
+            screen: Surface d'affichage
+            enabled: False pour revenir à un flip() complet
+
+        Returns:
+            int: Nombre de rectangles présentés (0 pour une frame complète)
+        """
+        rects = self.collect(screen.get_rect())
+        if self.full or not enabled:
+            self.full = False
+            pygame.display.flip()
+            return 0
+        if rects:
+            pygame.display.update(rects)
+        return len(rects)
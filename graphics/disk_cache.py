@@ -0,0 +1,133 @@
+"""
+Disk cache - Surfaces générées gardées sur disque entre deux lancements
+✅ Pixels bruts (pas de décodage PNG au démarrage)
+✅ Clé = hash de la version du cache, des paramètres et du bytecode qui dessine
+✅ Code ou paramètres modifiés : nouvelle clé, la surface est régénérée
+"""
+import hashlib
+import os
+import sys
+import types
+import pygame
+from config import ASSET_DISK_CACHE, ASSET_CACHE_VERSION, ASSET_CACHE_DIR
+
+
+class DiskSurfaceCache:
+    """
+    Surfaces procédurales (atlas, fond de cuisine, comptoir de service) sur disque
+
+    Fichier : <nom>-<hash>.raw, une ligne "largeur hauteur format" suivie des
+    pixels (RGB pour les surfaces opaques ; les surfaces transparentes sont
+    écrites dans l'ordre natif de pygame pour être relues sans conversion).
+    Le hash couvre le bytecode des fonctions de dessin passées dans sources
+    (pas leur texte : relire et analyser les fichiers source coûterait plus
+    cher que de redessiner) : modifier le dessin suffit à invalider l'entrée. Toute erreur
+    d'accès au disque est ignorée (le jeu redessine simplement la surface).
+    """
+
+    def __init__(self, directory=ASSET_CACHE_DIR, version=ASSET_CACHE_VERSION, enabled=ASSET_DISK_CACHE):
+        self.directory = directory
+        self.version = version
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, name, params, sources=()):
+        """Chemin du fichier de la surface name pour ces paramètres et ce code"""
+        digest = hashlib.sha1(f"{self.version}|{sys.version}|{pygame.version.ver}|{name}|{params!r}".encode())
+        for source in sources:
+            self.hash_code(digest, getattr(source, "__func__", source).__code__)
+        return os.path.join(self.directory, f"{name}-{digest.hexdigest()[:20]}.raw")
+
+    def hash_code(self, digest, code):
+        """Ajoute au hash le bytecode, les noms et les constantes (fonctions imbriquées comprises)"""
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                self.hash_code(digest, const)
+            else:
+                digest.update(repr(const).encode())
+
+    def load(self, name, params, sources=()):
+        """Surface lue sur disque, ou None si absente / illisible"""
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path(name, params, sources), "rb") as cache_file:
+                width, height, pixel_format = cache_file.readline().decode().split()
+                width, height = int(width), int(height)
+                pixels = cache_file.read()
+        except (OSError, AttributeError, ValueError):
+            self.misses += 1
+            return None
+        if pixel_format not in ("RGB", "RGBA", "BGRA") or len(pixels) != width * height * len(pixel_format):
+            self.misses += 1
+            return None
+        self.hits += 1
+        surface = pygame.image.frombytes(pixels, (width, height), pixel_format)
+        if pixel_format not in ("RGB", self.alpha_format()):
+            # Fichier écrit sur une autre plateforme : recopie au format natif,
+            # sinon chaque blit convertirait les pixels à chaque frame
+            native = pygame.Surface((width, height), pygame.SRCALPHA)
+            native.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            surface = native
+        return surface
+
+    def alpha_format(self):
+        """Ordre des octets des surfaces SRCALPHA de pygame (relues sans conversion)"""
+        masks = pygame.Surface((1, 1), pygame.SRCALPHA).get_masks()
+        return "BGRA" if masks == (0xFF0000, 0xFF00, 0xFF, 0xFF000000) else "RGBA"
+
+    def save(self, name, params, surface, sources=()):
+        """Écrit la surface (écriture atomique : fichier temporaire puis renommage)"""
+        if not self.enabled:
+            return
+        try:
+            path = self.path(name, params, sources)
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            pixel_format = self.alpha_format() if surface.get_flags() & pygame.SRCALPHA else "RGB"
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(b"%d %d %s\n" % (surface.get_size() + (pixel_format.encode(),)))
+                cache_file.write(pygame.image.tobytes(surface, pixel_format))
+            os.replace(temp_path, path)
+        except (OSError, AttributeError, ValueError):
+            pass
+
+    def get(self, name, params, create, sources=()):
+        """
+        Retourne la surface depuis le disque, ou la crée avec create() et l'enregistre
+
+        Args:
+            name: Nom de la surface (préfixe du fichier)
+            params: Tout ce dont dépend le dessin (tailles, couleurs, disposition)
+            create: Fonction sans argument qui dessine la surface
+            sources: Fonctions dont le code source entre dans la clé
+        """
+        surface = self.load(name, params, sources)
+        if surface is None:
+            surface = create()
+            self.save(name, params, surface, sources)
+        return surface
+
+    def get_stats(self):
+        """Compteurs du cache"""
+        return {"hits": self.hits, "misses": self.misses, "directory": self.directory}
+
+    def clear(self):
+        """Supprime tous les fichiers du cache"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for file_name in names:
+            if file_name.endswith(".raw"):
+                try:
+                    os.remove(os.path.join(self.directory, file_name))
+                except OSError:
+                    pass
+
+
+# Cache disque partagé par les renderers et l'AssetManager
+disk_cache = DiskSurfaceCache()
@@ -0,0 +1,78 @@
+"""
+Glow cache - Halos et lueurs animés pré-rendus
+✅ Chaque effet est rendu une fois à GLOW_PHASES phases de pulsation
+✅ À chaque frame : un seul blit de la phase courante (plus d'allocation)
+✅ Les effets fixes (ombres, voiles) sont une animation à une seule phase
+✅ Chaque phase n'est dessinée qu'à sa première utilisation (démarrage plus rapide)
+"""
+import math
+import pygame
+from config import GLOW_PHASES
+
+
+class GlowCache:
+    """
+    Sprites SRCALPHA dont l'alpha suit int(base + amplitude * sin(angle))
+
+    L'appelant passe l'angle qu'il donnait à math.sin (ex: current_time * 3 + idx) ;
+    la phase est quantifiée sur GLOW_PHASES images pré-rendues.
+    """
+
+    def __init__(self, phases=GLOW_PHASES):
+        self.phases = phases
+        self.frames = {}
+
+    def get(self, key, size, base, amplitude, angle, draw):
+        """
+        Retourne l'image de l'effet key pour la phase angle
+
+        Args:
+            key: Identifiant de l'effet (forme, couleur, taille...)
+            size: Taille des sprites
+            base, amplitude: alpha = int(base + amplitude * sin(phase))
+            angle: Argument du sinus à cette frame
+            draw: draw(surface, alpha) dessine l'effet sur une surface vide
+        """
+        cache_key = (key, base, amplitude)
+        frames = self.frames.get(cache_key)
+        if frames is None:
+            frames = [None] * (self.phases if amplitude else 1)
+            self.frames[cache_key] = frames
+
+        index = 0
+        if len(frames) > 1:
+            index = int(round(angle / (2 * math.pi) * len(frames))) % len(frames)
+        frame = frames[index]
+        if frame is None:
+            # Phase pas encore vue : dessinée maintenant, pas toutes à la première frame
+            alpha = int(base + amplitude * math.sin(2 * math.pi * index / len(frames)))
+            frame = pygame.Surface(size, pygame.SRCALPHA)
+            draw(frame, alpha)
+            frames[index] = frame
+        return frame
+
+    def circle(self, color, size, radius, base, amplitude=0, angle=0.0):
+        """Disque centré dans un carré size x size"""
+        rgb = tuple(color[:3])
+
+        def draw(surface, alpha):
+            pygame.draw.circle(surface, rgb + (alpha,), (size // 2, size // 2), radius)
+
+        return self.get(("circle", rgb, size, radius), (size, size), base, amplitude, angle, draw)
+
+    def rect(self, color, size, base, amplitude=0, angle=0.0, width=0):
+        """Rectangle plein (width=0) ou contour couvrant toute la surface"""
+        rgb = tuple(color[:3])
+        size = tuple(size)
+
+        def draw(surface, alpha):
+            pygame.draw.rect(surface, rgb + (alpha,), (0, 0) + size, width)
+
+        return self.get(("rect", rgb, size, width), size, base, amplitude, angle, draw)
+
+    def clear(self):
+        self.frames.clear()
+
+
+# Cache partagé par les renderers
+glow_cache = GlowCache()
@@ -1,24 +1,56 @@
 # kitchen.py - CODE COMPLET avec ingrédients bien visibles
 
 import pygame
-import time
 import math
+import numpy as np
+import game_state
 from config import COLORS, WIDTH, HEIGHT
+from utils.text_cache import text_cache
+from utils.fonts import fonts
+from graphics.glow import glow_cache
+from graphics.disk_cache import disk_cache
+
+class GradientCache:
+    """
+    Dégradés verticaux pré-rendus, clé (color1, color2, size)
+    Chaque surface est générée en une passe NumPy puis réutilisée à chaque frame
+    """
+
+    def __init__(self):
+        self.surfaces = {}
+
+    def get(self, color1, color2, size):
+        key = (tuple(color1), tuple(color2), tuple(size))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            width, height = key[2]
+            ratios = np.arange(height) / height
+            start = np.array(color1[:3], dtype=float)
+            end = np.array(color2[:3], dtype=float)
+            rows = (start * (1 - ratios)[:, None] + end * ratios[:, None]).astype(np.uint8)
+            surface = pygame.surfarray.make_surface(np.broadcast_to(rows, (width, height, 3)))
+            self.surfaces[key] = surface
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+gradient_cache = GradientCache()
+
 
 def draw_gradient_rect(surface, color1, color2, rect):
-    for i in range(rect.height):
-        ratio = i / rect.height
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (rect.x, rect.y + i), (rect.x + rect.width, rect.y + i))
+    # Largeur + 1 : l'ancien tracé ligne par ligne incluait le pixel de fin (x + width)
+    gradient = gradient_cache.get(color1, color2, (rect.width + 1, rect.height))
+    surface.blit(gradient, (rect.x, rect.y))
 
 class KitchenRenderer:
-    def __init__(self, screen):
+    def __init__(self, screen, dirty_regions=None):
         self.screen = screen
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 20)
+        self.dirty_regions = dirty_regions
+        self.font_large = fonts.get(36)
+        self.font_medium = fonts.get(28)
+        self.font_small = fonts.get(20)
         self.ingredient_config = {
             "laitue": {"color": (50, 200, 50), "icon": "🥬"},
             "tomate": {"color": (220, 50, 50), "icon": "🍅"},
@@ -28,28 +60,82 @@ class KitchenRenderer:
             "oignon": {"color": (200, 180, 140), "icon": "🧅"},
             "salade": {"color": (80, 180, 80), "icon": "🥗"}
         }
+        self.background = None
+        self.service_body = None
+        # État dessiné : game_state en direct, ou le snapshot d'un tick (set_snapshot)
+        self.state = game_state
         self.setup_kitchen_layout()
 
+    def set_snapshot(self, snapshot):
+        """Dessine les frames suivantes depuis ce snapshot (None : game_state en direct)"""
+        self.state = game_state if snapshot is None else snapshot
+
     def setup_kitchen_layout(self):
         self.storage_area = {'x': 30, 'y': 100, 'w': 280, 'h': 320, 'floor_x': 30, 'floor_y': 420, 'floor_w': 280, 'floor_h': 80}
         self.work_area = {'x': 350, 'y': 120, 'w': 200, 'h': 140, 'floor_x': 350, 'floor_y': 260, 'floor_w': 200, 'floor_h': 80}
         self.plating_area = {'x': 570, 'y': 120, 'w': 200, 'h': 140, 'floor_x': 570, 'floor_y': 260, 'floor_w': 200, 'floor_h': 80}
         self.service_area = {'x': 790, 'y': 120, 'w': 120, 'h': 300, 'floor_x': 720, 'floor_y': 240, 'floor_w': 100, 'floor_h': 180}
         self.circulation = {'x': 320, 'y': 450, 'w': 450, 'h': 100}
+        # La disposition a changé : le fond statique sera reconstruit
+        self.background = None
+
+    def build_background(self):
+        """
+        Pré-rend toute la géométrie non animée de la cuisine (sol, zones,
+        habillage des stations) dans une surface de fond.
+        Reconstruit seulement après setup_kitchen_layout() ou si la fenêtre change de taille ;
+        le rendu est relu depuis le cache disque quand la disposition n'a pas changé.
+        """
+        size = self.screen.get_size()
+        rendered = disk_cache.get("kitchen_background", self.layout_params(size),
+                                  lambda: self.render_background(size),
+                                  (self.render_background, self.draw_floor, self.draw_static_work_station,
+                                   self.draw_static_plating_station, draw_gradient_rect, GradientCache.get))
+        self.background = pygame.Surface(size, 0, self.screen)
+        self.background.blit(rendered, (0, 0))
+        self.service_body = disk_cache.get("service_body", self.layout_params(size), self.build_service_body,
+                                           (self.build_service_body, draw_gradient_rect, GradientCache.get))
+
+    def layout_params(self, size):
+        """Paramètres dont dépendent les surfaces statiques (clé du cache disque)"""
+        return (tuple(size), self.storage_area, self.work_area, self.plating_area,
+                self.service_area, self.circulation, self.font_small.get_height())
+
+    def render_background(self, size):
+        """Dessine le fond statique dans une nouvelle surface"""
+        background = pygame.Surface(size)
+        self.draw_floor(background)
+        self.draw_static_work_station(background)
+        self.draw_static_plating_station(background)
+
+        # Ombre du service dans le fond ; le halo animé passe entre le fond et le comptoir
+        shadow = pygame.Surface((self.service_area['w'] + 6, self.service_area['h'] + 6), pygame.SRCALPHA)
+        shadow.fill((0, 0, 0, 50))
+        background.blit(shadow, (self.service_area['x'] + 3, self.service_area['y'] + 3))
+        return background
+
+    def draw_background(self):
+        """Début de frame : un seul blit du fond statique"""
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self.build_background()
+            if self.dirty_regions is not None:
+                self.dirty_regions.invalidate()
+        self.screen.blit(self.background, (0, 0))
 
-    def draw_floor(self):
+    def draw_floor(self, surface):
         tile_size = 50
         brown_light = (181, 101, 29)
         brown_dark = (130, 71, 22)
-        for x in range(0, WIDTH, tile_size):
-            for y in range(0, HEIGHT, tile_size):
+        width, height = surface.get_size()
+        for x in range(0, width, tile_size):
+            for y in range(0, height, tile_size):
                 color = brown_light if (x // tile_size + y // tile_size) % 2 == 0 else brown_dark
                 tile_rect = pygame.Rect(x, y, tile_size, tile_size)
-                pygame.draw.rect(self.screen, color, tile_rect)
-                pygame.draw.line(self.screen, (160, 90, 25), (x, y), (x + tile_size, y), 1)
-                pygame.draw.line(self.screen, (160, 90, 25), (x, y), (x, y + tile_size), 1)
-                pygame.draw.line(self.screen, (110, 60, 15), (x + tile_size, y), (x + tile_size, y + tile_size), 1)
-                pygame.draw.line(self.screen, (110, 60, 15), (x, y + tile_size), (x + tile_size, y + tile_size), 1)
+                pygame.draw.rect(surface, color, tile_rect)
+                pygame.draw.line(surface, (160, 90, 25), (x, y), (x + tile_size, y), 1)
+                pygame.draw.line(surface, (160, 90, 25), (x, y), (x, y + tile_size), 1)
+                pygame.draw.line(surface, (110, 60, 15), (x + tile_size, y), (x + tile_size, y + tile_size), 1)
+                pygame.draw.line(surface, (110, 60, 15), (x, y + tile_size), (x + tile_size, y + tile_size), 1)
         for x, y, w, h in [
             (self.storage_area['floor_x'], self.storage_area['floor_y'], self.storage_area['floor_w'], self.storage_area['floor_h']),
             (self.work_area['floor_x'], self.work_area['floor_y'], self.work_area['floor_w'], self.work_area['floor_h']),
@@ -59,18 +145,29 @@ class KitchenRenderer:
         ]:
             overlay = pygame.Surface((w, h), pygame.SRCALPHA)
             overlay.fill((190, 160, 100, 50))
-            self.screen.blit(overlay, (x, y))
-            pygame.draw.rect(self.screen, (150, 120, 70), (x, y, w, h), 1)
+            surface.blit(overlay, (x, y))
+            pygame.draw.rect(surface, (150, 120, 70), (x, y, w, h), 1)
+
+    def get_ingredient_sprite(self, asset_manager, ingredient_type, size):
+        """(surface, zone) de l'image pré-redimensionnée pour Surface.blits(), ou None"""
+        if not asset_manager:
+            return None
+        return asset_manager.get_sprite(ingredient_type, size)
+
+    def flush_blits(self, blits):
+        """Envoie les blits en attente en un seul appel (avant un dessin direct)"""
+        if blits:
+            self.screen.blits(blits, doreturn=False)
+            blits.clear()
 
     def draw_individual_ingredient_stations(self, asset_manager):
-        import game_state
-        current_time = time.time()
+        current_time = self.state.clock.time()
         title_bg = pygame.Rect(self.storage_area['x'], self.storage_area['y'] - 35, self.storage_area['w'], 30)
         draw_gradient_rect(self.screen, (110, 70, 30), (90, 60, 20), title_bg)
-        title = self.font_medium.render("STOCKAGE DES INGRÉDIENTS", True, (255, 255, 255))
+        title = text_cache.render(self.font_medium, "STOCKAGE DES INGRÉDIENTS", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.storage_area['x'] + self.storage_area['w']//2, self.storage_area['y'] - 20))
         self.screen.blit(title, title_rect)
-        ingredient_types = list(set(ing["type"] for ing in game_state.ingredients))
+        ingredient_types = list(set(ing["type"] for ing in self.state.ingredients))
         if not ingredient_types:
             ingredient_types = ["laitue", "tomate", "pain", "steak", "fromage"]
         cols = 4
@@ -80,6 +177,14 @@ class KitchenRenderer:
         margin_y = 12
 
         self.ingredient_positions = {}
+        stations_area = None
+        stations_state = []
+        any_available = False
+
+        # 1er passage : corps des stations ; les images d'ingrédients sont regroupées
+        # en un seul Surface.blits() avant les étiquettes (qui restent au-dessus)
+        sprite_blits = []
+        labels = []
 
         for i, ingredient_type in enumerate(ingredient_types):
             col = i % cols
@@ -89,61 +194,62 @@ class KitchenRenderer:
             self.ingredient_positions[ingredient_type] = (station_x + station_width//2, station_y + station_height//2)
             station_rect = pygame.Rect(station_x, station_y, station_width, station_height)
 
-            shadow_surf = pygame.Surface((station_width + 2, station_height + 2), pygame.SRCALPHA)
-            shadow_surf.fill((0, 0, 0, 40))
+            shadow_surf = glow_cache.rect((0, 0, 0), (station_width + 2, station_height + 2), 40)
             self.screen.blit(shadow_surf, (station_x + 2, station_y + 2))
 
-            available_ingredients = [ing for ing in game_state.ingredients if ing["type"] == ingredient_type and not ing["taken"] and current_time >= ing.get("spawn_time", 0)]
+            available_ingredients = [ing for ing in self.state.ingredients if ing["type"] == ingredient_type and not ing["taken"] and current_time >= ing.get("spawn_time", 0)]
             is_available = len(available_ingredients) > 0
+            
+            station_area = station_rect.inflate(12, 12)
+            stations_area = station_area if stations_area is None else stations_area.union(station_area)
+            stations_state.append((ingredient_type, len(available_ingredients)))
+            any_available = any_available or is_available
 
             if is_available:
                 draw_gradient_rect(self.screen, (240, 220, 180), (210, 180, 140), station_rect)
                 border_color = (130, 90, 40)
                 status_color = (170, 130, 70)
-                glow_intensity = int(20 + 15 * math.sin(current_time * 3))
             else:
                 draw_gradient_rect(self.screen, (225, 210, 200), (195, 180, 170), station_rect)
                 border_color = (140, 120, 110)
                 status_color = (160, 140, 130)
-                glow_intensity = 0
 
             pygame.draw.rect(self.screen, border_color, station_rect, 2)
 
-            if glow_intensity > 0:
-                glow_surf = pygame.Surface((station_width + 10, station_height + 10), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (180, 140, 70, glow_intensity), (0, 0, station_width + 10, station_height + 10), 3)
+            if is_available:
+                glow_surf = glow_cache.rect((180, 140, 70), (station_width + 10, station_height + 10),
+                                            20, 15, current_time * 3, width=3)
                 self.screen.blit(glow_surf, (station_x - 5, station_y - 5))
 
+            ing_color = self.ingredient_config.get(ingredient_type, {"color": (150, 150, 150)})["color"]
             storage_inner = pygame.Rect(station_x + 7, station_y + 25, 52, 34)
-            pygame.draw.rect(self.screen, self.ingredient_config.get(ingredient_type, {"color": (150, 150, 150)})["color"], storage_inner)
+            pygame.draw.rect(self.screen, ing_color, storage_inner)
             pygame.draw.rect(self.screen, (100, 70, 30), storage_inner, 1)
 
             if is_available:
+                sprite = self.get_ingredient_sprite(asset_manager, ingredient_type, 16)
                 for j, ing in enumerate(available_ingredients[:4]):
                     ing_x = storage_inner.x + 14 + (j % 2) * 20
                     ing_y = storage_inner.y + 9 + (j // 2) * 16
                     ing["x"] = ing_x
                     ing["y"] = ing_y
                     float_y = ing_y + math.sin(current_time * 3 + j) * 1.5
-                    try:
-                        if asset_manager:
-                            img = asset_manager.get_ingredient_image(ingredient_type)
-                            if img:
-                                scaled_img = pygame.transform.scale(img, (16, 16))
-                                self.screen.blit(scaled_img, (ing_x - 8, float_y - 8))
-                            else:
-                                pygame.draw.circle(self.screen, self.ingredient_config.get(ingredient_type, {"color": (150, 150, 150)})["color"], (ing_x, int(float_y)), 7)
-                        else:
-                            pygame.draw.circle(self.screen, self.ingredient_config.get(ingredient_type, {"color": (150, 150, 150)})["color"], (ing_x, int(float_y)), 7)
-                    except:
-                        pygame.draw.circle(self.screen, self.ingredient_config.get(ingredient_type, {"color": (150, 150, 150)})["color"], (ing_x, int(float_y)), 7)
-
-            label_bg = pygame.Rect(station_x, station_y, station_width, 20)
-            overlay = pygame.Surface((station_width, 20), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 160))
+                    if sprite:
+                        sprite_blits.append((sprite[0], (ing_x - 8, float_y - 8), sprite[1]))
+                    else:
+                        pygame.draw.circle(self.screen, ing_color, (ing_x, int(float_y)), 7)
+
+            labels.append((ingredient_type, station_x, station_y, is_available, status_color, len(available_ingredients)))
+
+        if sprite_blits:
+            self.screen.blits(sprite_blits, doreturn=False)
+
+        # 2e passage : étiquettes, LED et badges de quantité
+        for ingredient_type, station_x, station_y, is_available, status_color, qty in labels:
+            overlay = glow_cache.rect((255, 255, 255), (station_width, 20), 160)
             self.screen.blit(overlay, (station_x, station_y))
 
-            label_text = self.font_small.render(ingredient_type.capitalize(), True, (50, 40, 20))
+            label_text = text_cache.render(self.font_small, ingredient_type.capitalize(), True, (50, 40, 20))
             label_rect = label_text.get_rect(center=(station_x + station_width // 2, station_y + 10))
             self.screen.blit(label_text, label_rect)
 
@@ -151,79 +257,102 @@ class KitchenRenderer:
             led_y = station_y + 8
 
             if is_available:
-                halo_surf = pygame.Surface((16, 16), pygame.SRCALPHA)
-                pygame.draw.circle(halo_surf, (status_color[0], status_color[1], status_color[2], 40), (8, 8), 7)
+                halo_surf = glow_cache.circle(status_color, 16, 7, 40)
                 self.screen.blit(halo_surf, (led_x - 8, led_y - 8))
             pygame.draw.circle(self.screen, status_color, (led_x, led_y), 4)
             pygame.draw.circle(self.screen, (255, 255, 255), (led_x, led_y), 4, 1)
             pygame.draw.circle(self.screen, (255, 255, 255), (led_x - 1, led_y - 1), 1)
             if is_available:
-                qty = len(available_ingredients)
                 badge_color = (110, 70, 30) if qty > 2 else (150, 115, 80)
                 pygame.draw.circle(self.screen, badge_color, (led_x, led_y + 18), 8)
                 pygame.draw.circle(self.screen, (255, 255, 255), (led_x, led_y + 18), 8, 1)
-                qty_text = self.font_small.render(str(qty), True, (255, 255, 255))
+                qty_text = text_cache.render(self.font_small, str(qty), True, (255, 255, 255))
                 qty_rect = qty_text.get_rect(center=(led_x, led_y + 18))
                 self.screen.blit(qty_text, qty_rect)
 
-    def draw_work_station(self, asset_manager):
+        if self.dirty_regions is not None and stations_area is not None:
+            # Halos et ingrédients flottants : animés dès qu'un ingrédient est disponible
+            self.dirty_regions.track("ingredient_stations", stations_area,
+                                     tuple(stations_state), animated=any_available)
+
+        # Les halos de la dernière colonne débordent sur le plan de travail :
+        # on recopie son habillage depuis le fond pour qu'il reste au-dessus
+        if self.background is not None:
+            for rect in (pygame.Rect(self.work_area['x'], self.work_area['y'] - 30, self.work_area['w'], 25),
+                         pygame.Rect(self.work_area['x'], self.work_area['y'], self.work_area['w'], self.work_area['h'])):
+                self.screen.blit(self.background, rect, rect)
+
+    def draw_static_work_station(self, surface):
+        """Habillage fixe du plan de travail (dessiné dans le fond)"""
         shadow = pygame.Surface((self.work_area['w'] + 6, self.work_area['h'] + 6), pygame.SRCALPHA)
         shadow.fill((0, 0, 0, 40))
-        self.screen.blit(shadow, (self.work_area['x'] + 3, self.work_area['y'] + 3))
+        surface.blit(shadow, (self.work_area['x'] + 3, self.work_area['y'] + 3))
         
         work_rect = pygame.Rect(self.work_area['x'], self.work_area['y'], 
                               self.work_area['w'], self.work_area['h'])
-        draw_gradient_rect(self.screen, (150, 90, 40), (110, 70, 20), work_rect)
-        pygame.draw.rect(self.screen, (90, 50, 10), work_rect, 3)
+        draw_gradient_rect(surface, (150, 90, 40), (110, 70, 20), work_rect)
+        pygame.draw.rect(surface, (90, 50, 10), work_rect, 3)
         
         title_bg = pygame.Rect(self.work_area['x'], self.work_area['y'] - 30, 
                               self.work_area['w'], 25)
-        draw_gradient_rect(self.screen, (90, 50, 10), (70, 40, 10), title_bg)
-        title = self.font_small.render("PLAN DE TRAVAIL", True, (255, 255, 255))
-        self.screen.blit(title, (self.work_area['x'] + 10, self.work_area['y'] - 25))
+        draw_gradient_rect(surface, (90, 50, 10), (70, 40, 10), title_bg)
+        title = text_cache.render(self.font_small, "PLAN DE TRAVAIL", True, (255, 255, 255))
+        surface.blit(title, (self.work_area['x'] + 10, self.work_area['y'] - 25))
         
         cutting_x = self.work_area['x'] + 15
         cutting_y = self.work_area['y'] + 20
-        cutting_w = 80
-        cutting_h = 70
         
-        cutting_rect = pygame.Rect(cutting_x, cutting_y, cutting_w, cutting_h)
-        draw_gradient_rect(self.screen, (190, 140, 80), (160, 110, 60), cutting_rect)
-        pygame.draw.rect(self.screen, (110, 70, 30), cutting_rect, 2)
+        cutting_rect = pygame.Rect(cutting_x, cutting_y, 80, 70)
+        draw_gradient_rect(surface, (190, 140, 80), (160, 110, 60), cutting_rect)
+        pygame.draw.rect(surface, (110, 70, 30), cutting_rect, 2)
         
         for i in range(5):
             line_x = cutting_x + 10 + i * 14
-            pygame.draw.line(self.screen, (140, 90, 40), 
+            pygame.draw.line(surface, (140, 90, 40), 
                              (line_x, cutting_y + 10), (line_x, cutting_y + 60), 1)
-            pygame.draw.line(self.screen, (160, 110, 50), 
+            pygame.draw.line(surface, (160, 110, 50), 
                              (line_x + 1, cutting_y + 10), (line_x + 1, cutting_y + 60), 1)
         
+        prepared_x = self.work_area['x'] + 105
+        prepared_y = self.work_area['y'] + 20
+        prepared_w = 80
+        
+        prepared_rect = pygame.Rect(prepared_x, prepared_y, prepared_w, 70)
+        draw_gradient_rect(surface, (250, 245, 230), (220, 215, 190), prepared_rect)
+        pygame.draw.rect(surface, (140, 130, 100), prepared_rect, 2)
+        
+        title_overlay = pygame.Surface((prepared_w, 16), pygame.SRCALPHA)
+        title_overlay.fill((130, 100, 70, 180))
+        surface.blit(title_overlay, (prepared_x, prepared_y - 16))
+        
+        title = text_cache.render(self.font_small, "PRÉPARÉS", True, (255, 255, 255))
+        surface.blit(title, (prepared_x + 5, prepared_y - 15))
+
+    def draw_work_station(self, asset_manager):
+        cutting_x = self.work_area['x'] + 15
+        cutting_y = self.work_area['y'] + 20
+        cutting_w = 80
+        cutting_h = 70
+        
         self.draw_prepared_area(asset_manager)
         
         self.cutting_position = (cutting_x + cutting_w//2, cutting_y + cutting_h//2)
 
     def draw_prepared_area(self, asset_manager):
-        import game_state
-        current_time = time.time()
+        current_time = self.state.clock.time()
         
         prepared_x = self.work_area['x'] + 105
         prepared_y = self.work_area['y'] + 20
-        prepared_w = 80
-        prepared_h = 70
-        
-        prepared_rect = pygame.Rect(prepared_x, prepared_y, prepared_w, prepared_h)
-        
-        draw_gradient_rect(self.screen, (250, 245, 230), (220, 215, 190), prepared_rect)
-        pygame.draw.rect(self.screen, (140, 130, 100), prepared_rect, 2)
-        
-        title_overlay = pygame.Surface((prepared_w, 16), pygame.SRCALPHA)
-        title_overlay.fill((130, 100, 70, 180))
-        self.screen.blit(title_overlay, (prepared_x, prepared_y - 16))
         
-        title = self.font_small.render("PRÉPARÉS", True, (255, 255, 255))
-        self.screen.blit(title, (prepared_x + 5, prepared_y - 15))
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("prepared_area", (prepared_x - 10, prepared_y - 10, 100, 90),
+                                     tuple(self.state.prepared_ingredients[:8]),
+                                     animated=bool(self.state.prepared_ingredients))
         
-        for idx, ingredient in enumerate(game_state.prepared_ingredients):
+        # Halos et images en un Surface.blits() ; les coches passent au-dessus, à la fin
+        blits = []
+        checks = []
+        for idx, ingredient in enumerate(self.state.prepared_ingredients):
             if idx >= 8:
                 break
                 
@@ -234,58 +363,43 @@ class KitchenRenderer:
             
             ing_config = self.ingredient_config.get(ingredient, {"color": (150, 150, 150)})
             
-            glow_pulse = int(50 + 25 * math.sin(current_time * 3 + idx))
-            glow_surf = pygame.Surface((38, 38), pygame.SRCALPHA)
-            glow_color = ing_config["color"]
-            pygame.draw.circle(glow_surf, (glow_color[0], glow_color[1], glow_color[2], glow_pulse), 
-                               (19, 19), 17)
-            self.screen.blit(glow_surf, (pos_x - 19, pos_y - 19 + float_offset))
-            
-            try:
-                if asset_manager:
-                    img = asset_manager.get_ingredient_image(ingredient)
-                    if img:
-                        scaled_img = pygame.transform.scale(img, (30, 30))
-                        self.screen.blit(scaled_img, (pos_x - 15, pos_y - 15 + float_offset))
-                    else:
-                        pygame.draw.circle(self.screen, ing_config["color"], 
-                                           (pos_x, int(pos_y + float_offset)), 13)
-                        pygame.draw.circle(self.screen, (255, 255, 255), 
-                                           (pos_x, int(pos_y + float_offset)), 13, 2)
-                else:
-                    pygame.draw.circle(self.screen, ing_config["color"], 
-                                       (pos_x, int(pos_y + float_offset)), 13)
-                    pygame.draw.circle(self.screen, (255, 255, 255), 
-                                       (pos_x, int(pos_y + float_offset)), 13, 2)
-            except:
+            glow_surf = glow_cache.circle(ing_config["color"], 38, 17, 50, 25, current_time * 3 + idx)
+            blits.append((glow_surf, (pos_x - 19, pos_y - 19 + float_offset)))
+            
+            sprite = self.get_ingredient_sprite(asset_manager, ingredient, 30)
+            if sprite:
+                blits.append((sprite[0], (pos_x - 15, pos_y - 15 + float_offset), sprite[1]))
+            else:
+                self.flush_blits(blits)
                 pygame.draw.circle(self.screen, ing_config["color"], 
                                    (pos_x, int(pos_y + float_offset)), 13)
                 pygame.draw.circle(self.screen, (255, 255, 255), 
                                    (pos_x, int(pos_y + float_offset)), 13, 2)
             
-            check_x, check_y = pos_x + 12, pos_y - 12
+            checks.append((pos_x + 12, pos_y - 12))
+        
+        self.flush_blits(blits)
+        for check_x, check_y in checks:
             pygame.draw.circle(self.screen, (120, 90, 40), (check_x, check_y), 7)
             pygame.draw.circle(self.screen, (255, 255, 255), (check_x, check_y), 7, 2)
             pygame.draw.circle(self.screen, (100, 255, 100), (check_x, check_y), 4)
 
-    def draw_plating_station(self, asset_manager):
-        import game_state
-        current_time = time.time()
-        
+    def draw_static_plating_station(self, surface):
+        """Habillage fixe de la station d'assemblage (dessiné dans le fond)"""
         shadow = pygame.Surface((self.plating_area['w'] + 6, self.plating_area['h'] + 6), pygame.SRCALPHA)
         shadow.fill((0, 0, 0, 40))
-        self.screen.blit(shadow, (self.plating_area['x'] + 3, self.plating_area['y'] + 3))
+        surface.blit(shadow, (self.plating_area['x'] + 3, self.plating_area['y'] + 3))
         
         plating_rect = pygame.Rect(self.plating_area['x'], self.plating_area['y'], 
                                   self.plating_area['w'], self.plating_area['h'])
-        draw_gradient_rect(self.screen, (230, 210, 180), (190, 170, 150), plating_rect)
-        pygame.draw.rect(self.screen, (160, 130, 100), plating_rect, 3)
+        draw_gradient_rect(surface, (230, 210, 180), (190, 170, 150), plating_rect)
+        pygame.draw.rect(surface, (160, 130, 100), plating_rect, 3)
         
         title_bg = pygame.Rect(self.plating_area['x'], self.plating_area['y'] - 30, 
                               self.plating_area['w'], 25)
-        draw_gradient_rect(self.screen, (160, 130, 100), (140, 110, 80), title_bg)
-        title = self.font_small.render("STATION D'ASSEMBLAGE", True, (255, 255, 255))
-        self.screen.blit(title, (self.plating_area['x'] + 10, self.plating_area['y'] - 25))
+        draw_gradient_rect(surface, (160, 130, 100), (140, 110, 80), title_bg)
+        title = text_cache.render(self.font_small, "STATION D'ASSEMBLAGE", True, (255, 255, 255))
+        surface.blit(title, (self.plating_area['x'] + 10, self.plating_area['y'] - 25))
         
         empty_plates_x = self.plating_area['x'] + 15
         empty_plates_y = self.plating_area['y'] + 20
@@ -293,18 +407,21 @@ class KitchenRenderer:
         empty_plates_h = 70
         
         empty_rect = pygame.Rect(empty_plates_x, empty_plates_y, empty_plates_w, empty_plates_h)
-        draw_gradient_rect(self.screen, (255, 255, 255), (245, 245, 230), empty_rect)
-        pygame.draw.rect(self.screen, (200, 200, 180), empty_rect, 2)
+        draw_gradient_rect(surface, (255, 255, 255), (245, 245, 230), empty_rect)
+        pygame.draw.rect(surface, (200, 200, 180), empty_rect, 2)
         
         for i in range(3):
             plate_y = empty_plates_y + 15 + i * 4
             plate_x = empty_plates_x + empty_plates_w//2
             
-            pygame.draw.circle(self.screen, (180, 180, 150), (plate_x + 2, plate_y + 2), 16)
-            pygame.draw.circle(self.screen, (255, 255, 255), (plate_x, plate_y), 16)
-            pygame.draw.circle(self.screen, (240, 245, 220), (plate_x, plate_y), 12)
-            pygame.draw.circle(self.screen, (200, 200, 160), (plate_x, plate_y), 16, 1)
-            pygame.draw.circle(self.screen, (255, 255, 255), (plate_x - 4, plate_y - 4), 4)
+            pygame.draw.circle(surface, (180, 180, 150), (plate_x + 2, plate_y + 2), 16)
+            pygame.draw.circle(surface, (255, 255, 255), (plate_x, plate_y), 16)
+            pygame.draw.circle(surface, (240, 245, 220), (plate_x, plate_y), 12)
+            pygame.draw.circle(surface, (200, 200, 160), (plate_x, plate_y), 16, 1)
+            pygame.draw.circle(surface, (255, 255, 255), (plate_x - 4, plate_y - 4), 4)
+
+    def draw_plating_station(self, asset_manager):
+        current_time = self.state.clock.time()
         
         assembly_x = self.plating_area['x'] + 85
         assembly_y = self.plating_area['y'] + 20
@@ -313,16 +430,21 @@ class KitchenRenderer:
         
         assembly_rect = pygame.Rect(assembly_x, assembly_y, assembly_w, assembly_h)
         
-        if hasattr(game_state, 'plated_dish') and game_state.plated_dish:
+        plated = bool(getattr(self.state, 'plated_dish', None))
+        if self.dirty_regions is not None:
+            # Halo, ingrédients en rotation et étoiles : jusqu'à ~60 px autour de l'assiette
+            self.dirty_regions.track("assembly", assembly_rect.inflate(54, 54),
+                                     (plated, tuple(self.state.prepared_ingredients)),
+                                     animated=plated or bool(self.state.prepared_ingredients))
+        
+        if hasattr(self.state, 'plated_dish') and self.state.plated_dish:
             draw_gradient_rect(self.screen, (255, 250, 220), (245, 235, 200), assembly_rect)
             pygame.draw.rect(self.screen, (220, 180, 100), assembly_rect, 2)
             
             plate_center_x = assembly_x + assembly_w//2
             plate_center_y = assembly_y + assembly_h//2
             
-            glow = int(30 + 20 * math.sin(current_time * 4))
-            glow_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (255, 255, 150, glow), (50, 50), 45)
+            glow_surf = glow_cache.circle((255, 255, 150), 100, 45, 30, 20, current_time * 4)
             self.screen.blit(glow_surf, (plate_center_x - 50, plate_center_y - 50))
             
             pygame.draw.circle(self.screen, (180, 180, 180), 
@@ -334,8 +456,9 @@ class KitchenRenderer:
             pygame.draw.circle(self.screen, (255, 255, 255), 
                                (plate_center_x - 8, plate_center_y - 8), 8)
             
-            for idx, ingredient in enumerate(game_state.prepared_ingredients):
-                angle = (idx * 2 * math.pi) / max(1, len(game_state.prepared_ingredients))
+            blits = []
+            for idx, ingredient in enumerate(self.state.prepared_ingredients):
+                angle = (idx * 2 * math.pi) / max(1, len(self.state.prepared_ingredients))
                 radius = 22
                 rotation = current_time * 0.5 + idx
                 
@@ -344,34 +467,19 @@ class KitchenRenderer:
                 
                 ing_config = self.ingredient_config.get(ingredient, {"color": (150, 150, 150)})
                 
-                glow_pulse = int(90 + 30 * math.sin(current_time * 4 + idx))
-                glow_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
-                glow_color = ing_config["color"]
-                pygame.draw.circle(glow_surf, (glow_color[0], glow_color[1], glow_color[2], glow_pulse), 
-                                   (30, 30), 28)
-                self.screen.blit(glow_surf, (ing_x - 30, ing_y - 30))
+                glow_surf = glow_cache.circle(ing_config["color"], 60, 28, 90, 30, current_time * 4 + idx)
+                blits.append((glow_surf, (ing_x - 30, ing_y - 30)))
                 
-                try:
-                    if asset_manager:
-                        img = asset_manager.get_ingredient_image(ingredient)
-                        if img:
-                            scaled_img = pygame.transform.scale(img, (40, 40))
-                            self.screen.blit(scaled_img, (ing_x - 20, ing_y - 20))
-                        else:
-                            pygame.draw.circle(self.screen, ing_config["color"], 
-                                               (int(ing_x), int(ing_y)), 18)
-                            pygame.draw.circle(self.screen, (255, 255, 255), 
-                                               (int(ing_x), int(ing_y)), 18, 3)
-                    else:
-                        pygame.draw.circle(self.screen, ing_config["color"], 
-                                           (int(ing_x), int(ing_y)), 18)
-                        pygame.draw.circle(self.screen, (255, 255, 255), 
-                                           (int(ing_x), int(ing_y)), 18, 3)
-                except:
+                sprite = self.get_ingredient_sprite(asset_manager, ingredient, 40)
+                if sprite:
+                    blits.append((sprite[0], (ing_x - 20, ing_y - 20), sprite[1]))
+                else:
+                    self.flush_blits(blits)
                     pygame.draw.circle(self.screen, ing_config["color"], 
                                        (int(ing_x), int(ing_y)), 18)
                     pygame.draw.circle(self.screen, (255, 255, 255), 
                                        (int(ing_x), int(ing_y)), 18, 3)
+            self.flush_blits(blits)
             
             for i in range(8):
                 star_angle = (i / 8) * 2 * math.pi + current_time * 2
@@ -386,61 +494,76 @@ class KitchenRenderer:
             draw_gradient_rect(self.screen, (250, 250, 250), (235, 235, 230), assembly_rect)
             pygame.draw.rect(self.screen, (180, 180, 180), assembly_rect, 2)
             
-            if game_state.prepared_ingredients:
-                ready_text = self.font_small.render("PRÊT", True, (100, 220, 100))
+            if self.state.prepared_ingredients:
+                ready_text = text_cache.render(self.font_small, "PRÊT", True, (100, 220, 100))
                 text_rect = ready_text.get_rect(center=(assembly_x + assembly_w//2, 
                                                        assembly_y + assembly_h//2))
                 
-                pulse = int(30 + 20 * math.sin(current_time * 5))
-                glow_surf = pygame.Surface((80, 40), pygame.SRCALPHA)
-                glow_surf.fill((100, 255, 100, pulse))
+                glow_surf = glow_cache.rect((100, 255, 100), (80, 40), 30, 20, current_time * 5)
                 self.screen.blit(glow_surf, (text_rect.x - 15, text_rect.y - 8))
                 
                 self.screen.blit(ready_text, text_rect)
         
         self.plating_position = (assembly_x + assembly_w//2, assembly_y + assembly_h//2)
 
-    def draw_service_station(self):
-        service_rect = pygame.Rect(self.service_area['x'], self.service_area['y'], 
-                                   self.service_area['w'], self.service_area['h'])
-        
-        shadow = pygame.Surface((self.service_area['w'] + 6, self.service_area['h'] + 6), pygame.SRCALPHA)
-        shadow.fill((0, 0, 0, 50))
-        self.screen.blit(shadow, (self.service_area['x'] + 3, self.service_area['y'] + 3))
-        
-        glow_intensity = int(25 + 15 * math.sin(time.time() * 2))
-        for i in range(4, 0, -1):
-            alpha = glow_intensity // i
-            glow_surf = pygame.Surface((self.service_area['w'] + i*6, 
-                                        self.service_area['h'] + i*6), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (255, 215, 0, alpha), 
-                             (0, 0, self.service_area['w'] + i*6, self.service_area['h'] + i*6))
-            self.screen.blit(glow_surf, (self.service_area['x'] - i*3, self.service_area['y'] - i*3))
-        
-        draw_gradient_rect(self.screen, (255, 210, 120), (230, 170, 80), service_rect)
-        pygame.draw.rect(self.screen, (200, 150, 50), service_rect, 3)
-        
-        title_bg = pygame.Rect(self.service_area['x'], self.service_area['y'] - 30, 
-                              self.service_area['w'], 25)
-        draw_gradient_rect(self.screen, (200, 150, 50), (180, 130, 30), title_bg)
-        title = self.font_small.render("SERVICE", True, (255, 255, 255))
-        self.screen.blit(title, (self.service_area['x'] + 10, self.service_area['y'] - 25))
+    def build_service_body(self):
+        """
+        Comptoir de service pré-rendu (bandeau titre, dégradé, plateaux)
+        Surface transparente : l'espace entre le bandeau et le comptoir laisse voir le halo
+        """
+        body = pygame.Surface((self.service_area['w'] + 1, self.service_area['h'] + 30), pygame.SRCALPHA)
+        service_rect = pygame.Rect(0, 30, self.service_area['w'], self.service_area['h'])
+        
+        draw_gradient_rect(body, (255, 210, 120), (230, 170, 80), service_rect)
+        pygame.draw.rect(body, (200, 150, 50), service_rect, 3)
+        
+        title_bg = pygame.Rect(0, 0, self.service_area['w'], 25)
+        draw_gradient_rect(body, (200, 150, 50), (180, 130, 30), title_bg)
+        title = text_cache.render(self.font_small, "SERVICE", True, (255, 255, 255))
+        body.blit(title, (10, 5))
         
         for i in range(2):
-            tray_y = self.service_area['y'] + 70 + i * 100
-            tray_x = self.service_area['x'] + self.service_area['w']//2
+            tray_y = 30 + 70 + i * 100
+            tray_x = self.service_area['w']//2
             
-            pygame.draw.circle(self.screen, (180, 180, 180), (tray_x + 2, tray_y + 2), 27)
-            pygame.draw.circle(self.screen, (255, 255, 255), (tray_x, tray_y), 27)
-            pygame.draw.circle(self.screen, (230, 230, 230), (tray_x, tray_y), 22)
-            pygame.draw.circle(self.screen, (180, 180, 180), (tray_x, tray_y), 27, 2)
+            pygame.draw.circle(body, (180, 180, 180), (tray_x + 2, tray_y + 2), 27)
+            pygame.draw.circle(body, (255, 255, 255), (tray_x, tray_y), 27)
+            pygame.draw.circle(body, (230, 230, 230), (tray_x, tray_y), 22)
+            pygame.draw.circle(body, (180, 180, 180), (tray_x, tray_y), 27, 2)
             
-            pygame.draw.circle(self.screen, (255, 255, 255), (tray_x - 8, tray_y - 8), 6)
-            pygame.draw.circle(self.screen, (240, 240, 240), (tray_x + 6, tray_y + 6), 4)
+            pygame.draw.circle(body, (255, 255, 255), (tray_x - 8, tray_y - 8), 6)
+            pygame.draw.circle(body, (240, 240, 240), (tray_x + 6, tray_y + 6), 4)
+        return body
+
+    def draw_service_station(self):
+        if self.service_body is None:
+            self.service_body = self.build_service_body()
+        
+        w, h = self.service_area['w'], self.service_area['h']
+        
+        def draw_halo(surface, glow_intensity):
+            # Quatre couches emboîtées composées une fois par phase
+            surface.fill((255, 215, 0, 0))
+            for i in range(4, 0, -1):
+                layer = pygame.Surface((w + i*6, h + i*6), pygame.SRCALPHA)
+                layer.fill((255, 215, 0, glow_intensity // i))
+                surface.blit(layer, (12 - i*3, 12 - i*3))
+        
+        halo = glow_cache.get(("service_halo", w, h), (w + 24, h + 24), 25, 15,
+                              self.state.clock.time() * 2, draw_halo)
+        self.screen.blit(halo, (self.service_area['x'] - 12, self.service_area['y'] - 12))
+        
+        self.screen.blit(self.service_body, (self.service_area['x'], self.service_area['y'] - 30))
+        
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("service_glow", (self.service_area['x'] - 12, self.service_area['y'] - 12,
+                                                      self.service_area['w'] + 24, self.service_area['h'] + 24),
+                                     animated=True)
 
     def draw_chef_enhanced(self, bot, asset_manager):
-        base_x, base_y = bot.x, bot.y
-        current_time = time.time()
+        # Position interpolée entre deux pas de simulation (rendu fluide à tout FPS)
+        base_x, base_y = bot.display_x, bot.display_y
+        current_time = self.state.clock.time()
         
         # 🔥 Ingrédient sur la planche - BIEN VISIBLE 🔥
         if bot.state == "cutting" and bot.preparing:
@@ -450,32 +573,19 @@ class KitchenRenderer:
             ing_config = self.ingredient_config.get(bot.preparing, {"color": (150, 150, 150)})
             
             # Ombre visible
-            shadow_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
-            shadow_surf.fill((0, 0, 0, 120))
+            shadow_surf = glow_cache.rect((0, 0, 0), (80, 80), 120)
             self.screen.blit(shadow_surf, (board_x - 38, board_y - 36))
             
             # Glow lumineux avec pulsation
-            glow_pulse = int(100 + 30 * math.sin(current_time * 3))
-            glow_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
             glow_color = ing_config["color"]
-            pygame.draw.circle(glow_surf, (glow_color[0], glow_color[1], glow_color[2], glow_pulse), 
-                               (50, 50), 45)
+            glow_surf = glow_cache.circle(glow_color, 100, 45, 100, 30, current_time * 3)
             self.screen.blit(glow_surf, (board_x - 50, board_y - 50))
             
             # 🌟 Ingrédient bien visible (60x60 pixels) 🌟
-            try:
-                if asset_manager:
-                    img = asset_manager.get_ingredient_image(bot.preparing)
-                    if img:
-                        scaled_img = pygame.transform.scale(img, (60, 60))
-                        self.screen.blit(scaled_img, (board_x - 30, board_y - 30))
-                    else:
-                        pygame.draw.circle(self.screen, ing_config["color"], (board_x, board_y), 28)
-                        pygame.draw.circle(self.screen, (255, 255, 255), (board_x, board_y), 28, 3)
-                else:
-                    pygame.draw.circle(self.screen, ing_config["color"], (board_x, board_y), 28)
-                    pygame.draw.circle(self.screen, (255, 255, 255), (board_x, board_y), 28, 3)
-            except:
+            sprite = self.get_ingredient_sprite(asset_manager, bot.preparing, 60)
+            if sprite:
+                self.screen.blit(sprite[0], (board_x - 30, board_y - 30), sprite[1])
+            else:
                 pygame.draw.circle(self.screen, ing_config["color"], (board_x, board_y), 28)
                 pygame.draw.circle(self.screen, (255, 255, 255), (board_x, board_y), 28, 3)
             
@@ -531,10 +641,7 @@ class KitchenRenderer:
             walk_cycle = math.sin(bot.animation_time * 8) * 3
             base_y -= abs(walk_cycle)
         
-        original_x, original_y = bot.x, bot.y
-        bot.x, bot.y = base_x, base_y
-        bot.draw_chef(self.screen)
-        bot.x, bot.y = original_x, original_y
+        name_rect = bot.draw_chef(self.screen, (base_x, base_y))
         
         # 🎯 Ingrédients portés - Bien visibles 🎯
         if bot.inv and bot.inv != "plated_dish":
@@ -544,31 +651,14 @@ class KitchenRenderer:
             float_offset = math.sin(current_time * 5) * 2
             
             # Glow avec pulsation
-            glow_pulse = int(70 + 30 * math.sin(current_time * 4))
-            glow_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-            glow_color = ing_config["color"]
-            pygame.draw.circle(glow_surf, (glow_color[0], glow_color[1], glow_color[2], glow_pulse), 
-                               (25, 25), 23)
+            glow_surf = glow_cache.circle(ing_config["color"], 50, 23, 70, 30, current_time * 4)
             self.screen.blit(glow_surf, (carry_x - 25, carry_y - 25 + float_offset))
             
             # 🌟 Ingrédient bien visible (36x36 pixels) 🌟
-            try:
-                if asset_manager:
-                    img = asset_manager.get_ingredient_image(bot.inv)
-                    if img:
-                        scaled_img = pygame.transform.scale(img, (36, 36))
-                        self.screen.blit(scaled_img, (carry_x - 18, carry_y - 18 + float_offset))
-                    else:
-                        pygame.draw.circle(self.screen, ing_config["color"], 
-                                           (carry_x, int(carry_y + float_offset)), 16)
-                        pygame.draw.circle(self.screen, (255, 255, 255), 
-                                           (carry_x, int(carry_y + float_offset)), 16, 3)
-                else:
-                    pygame.draw.circle(self.screen, ing_config["color"], 
-                                       (carry_x, int(carry_y + float_offset)), 16)
-                    pygame.draw.circle(self.screen, (255, 255, 255), 
-                                       (carry_x, int(carry_y + float_offset)), 16, 3)
-            except:
+            sprite = self.get_ingredient_sprite(asset_manager, bot.inv, 36)
+            if sprite:
+                self.screen.blit(sprite[0], (carry_x - 18, carry_y - 18 + float_offset), sprite[1])
+            else:
                 pygame.draw.circle(self.screen, ing_config["color"], 
                                    (carry_x, int(carry_y + float_offset)), 16)
                 pygame.draw.circle(self.screen, (255, 255, 255), 
@@ -584,16 +674,12 @@ class KitchenRenderer:
         
         # 🍽️ Plat dressé - Spectaculaire mais équilibré 🍽️
         elif bot.inv == "plated_dish":
-            import game_state
-            
             carry_x = base_x + 28
             carry_y = base_y - 45
             float_offset = math.sin(current_time * 3) * 2
             
             # Glow doré brillant avec animation
-            glow = math.sin(current_time * 5) * 25 + 50
-            glow_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (255, 255, 150, int(glow)), (50, 50), 48)
+            glow_surf = glow_cache.circle((255, 255, 150), 100, 48, 50, 25, current_time * 5)
             self.screen.blit(glow_surf, (carry_x - 50, int(carry_y + float_offset) - 50))
             
             # 🌟 Assiette bien visible (rayon 36 pixels) 🌟
@@ -611,9 +697,10 @@ class KitchenRenderer:
                                (carry_x - 10, int(carry_y + float_offset) - 10), 8)
             
             # 🍔 Ingrédients sur l'assiette 🍔
-            if hasattr(game_state, 'prepared_ingredients') and game_state.prepared_ingredients:
-                for idx, ingredient in enumerate(game_state.prepared_ingredients):
-                    angle = (idx * 2 * math.pi) / max(1, len(game_state.prepared_ingredients))
+            if hasattr(self.state, 'prepared_ingredients') and self.state.prepared_ingredients:
+                blits = []
+                for idx, ingredient in enumerate(self.state.prepared_ingredients):
+                    angle = (idx * 2 * math.pi) / max(1, len(self.state.prepared_ingredients))
                     radius = 20
                     rotation = current_time * 0.5
                     ing_x = carry_x + math.cos(angle + rotation) * radius
@@ -622,34 +709,20 @@ class KitchenRenderer:
                     ing_config = self.ingredient_config.get(ingredient, {"color": (150, 150, 150)})
                     
                     # Glow lumineux
-                    glow_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-                    glow_color = ing_config["color"]
-                    pygame.draw.circle(glow_surf, (glow_color[0], glow_color[1], glow_color[2], 100), 
-                                       (25, 25), 23)
-                    self.screen.blit(glow_surf, (ing_x - 25, ing_y - 25))
+                    glow_surf = glow_cache.circle(ing_config["color"], 50, 23, 100)
+                    blits.append((glow_surf, (ing_x - 25, ing_y - 25)))
                     
                     # 🌟 Ingrédient (32x32) 🌟
-                    try:
-                        if asset_manager:
-                            img = asset_manager.get_ingredient_image(ingredient)
-                            if img:
-                                scaled_img = pygame.transform.scale(img, (32, 32))
-                                self.screen.blit(scaled_img, (ing_x - 16, ing_y - 16))
-                            else:
-                                pygame.draw.circle(self.screen, ing_config["color"], 
-                                                   (int(ing_x), int(ing_y)), 14)
-                                pygame.draw.circle(self.screen, (255, 255, 255), 
-                                                   (int(ing_x), int(ing_y)), 14, 2)
-                        else:
-                            pygame.draw.circle(self.screen, ing_config["color"], 
-                                               (int(ing_x), int(ing_y)), 14)
-                            pygame.draw.circle(self.screen, (255, 255, 255), 
-                                               (int(ing_x), int(ing_y)), 14, 2)
-                    except:
+                    sprite = self.get_ingredient_sprite(asset_manager, ingredient, 32)
+                    if sprite:
+                        blits.append((sprite[0], (ing_x - 16, ing_y - 16), sprite[1]))
+                    else:
+                        self.flush_blits(blits)
                         pygame.draw.circle(self.screen, ing_config["color"], 
                                            (int(ing_x), int(ing_y)), 14)
                         pygame.draw.circle(self.screen, (255, 255, 255), 
                                            (int(ing_x), int(ing_y)), 14, 2)
+                self.flush_blits(blits)
             
             # Étoiles scintillantes
             for i in range(8):
@@ -666,13 +739,24 @@ class KitchenRenderer:
         pygame.draw.circle(self.screen, (255, 255, 255), (int(base_x), int(base_y - 55)), 6, 1)
         
         chef_info = f"{bot.chef_name}: {bot.get_state_text()}"
-        info_text = self.font_small.render(chef_info, True, (60, 60, 60))
+        info_text = text_cache.render(self.font_small, chef_info, True, (60, 60, 60))
         info_rect = info_text.get_rect(center=(int(base_x), int(base_y - 70)))
         
-        text_bg = pygame.Surface((info_rect.width + 8, info_rect.height + 4), pygame.SRCALPHA)
-        text_bg.fill((255, 255, 255, 200))
+        text_bg = glow_cache.rect((255, 255, 255), (info_rect.width + 8, info_rect.height + 4), 200)
         self.screen.blit(text_bg, (info_rect.x - 4, info_rect.y - 2))
         self.screen.blit(info_text, info_rect)
+        
+        if self.dirty_regions is not None:
+            # Silhouette, objet porté (plat + étoiles jusqu'à ~110 px au-dessus) et étiquettes
+            area = pygame.Rect(int(base_x) - 45, int(base_y) - 110, 135, 165)
+            area.union_ip(info_rect.inflate(10, 6))
+            if name_rect:
+                area.union_ip(name_rect)
+            if bot.state == "cutting" and bot.preparing:
+                area.union_ip(pygame.Rect(self.work_area['x'], self.work_area['y'], 110, 110))
+            elif bot.state == "plating" and hasattr(self, 'plating_position'):
+                area.union_ip(pygame.Rect(self.plating_position[0] - 20, self.plating_position[1] - 25, 40, 45))
+            self.dirty_regions.track(("chef", bot.bot_id), area, animated=True)
 
     def get_interaction_zones(self):
         return {
@@ -683,7 +767,7 @@ class KitchenRenderer:
         }
 
     def render_full_kitchen(self, bot, asset_manager, timer):
-        self.draw_floor()
+        self.draw_background()
         self.draw_individual_ingredient_stations(asset_manager)
         
         self.draw_work_station(asset_manager)
@@ -695,13 +779,10 @@ class KitchenRenderer:
         self.draw_chef_status(bot)
     
     def draw_chef_status(self, bot):
-        import game_state
-        
         status_y = HEIGHT - 60
         status_rect = pygame.Rect(10, status_y, WIDTH - 20, 50)
         
-        status_bg = pygame.Surface((status_rect.width, status_rect.height), pygame.SRCALPHA)
-        status_bg.fill((30, 30, 30, 220))
+        status_bg = glow_cache.rect((30, 30, 30), (status_rect.width, status_rect.height), 220)
         self.screen.blit(status_bg, status_rect)
         pygame.draw.rect(self.screen, (100, 150, 200), status_rect, 2)
         
@@ -710,12 +791,12 @@ class KitchenRenderer:
             f"📍 Position: ({int(bot.x)}, {int(bot.y)}) | Cible: ({int(bot.target_x)}, {int(bot.target_y)})",
         ]
         
-        if game_state.current_order_name:
-            order_info = f"🍽️ Commande: {game_state.current_order_name}"
-            if game_state.prepared_ingredients:
-                order_info += f" | Préparés: {', '.join(game_state.prepared_ingredients)}"
-            if hasattr(game_state, 'plated_dish') and game_state.plated_dish:
-                order_info += f" | Plat dressé: {game_state.plated_dish}"
+        if self.state.current_order_name:
+            order_info = f"🍽️ Commande: {self.state.current_order_name}"
+            if self.state.prepared_ingredients:
+                order_info += f" | Préparés: {', '.join(self.state.prepared_ingredients)}"
+            if hasattr(self.state, 'plated_dish') and self.state.plated_dish:
+                order_info += f" | Plat dressé: {self.state.plated_dish}"
             info_lines.append(order_info)
         
         if bot.inv:
@@ -725,14 +806,17 @@ class KitchenRenderer:
                 info_lines.append(f"🥕 Transporte: {bot.inv}")
         
         if bot.preparing:
-            prep_time_left = bot.prep_times.get(bot.preparing, 1.5) - (time.time() - bot.prep_time)
+            prep_time_left = bot.prep_times.get(bot.preparing, 1.5) - (self.state.clock.time() - bot.prep_time)
             info_lines.append(f"🔪 Prépare: {bot.preparing} (encore {prep_time_left:.1f}s)")
         
         if bot.plating:
-            plate_time_left = bot.PLATING_TIME - (time.time() - bot.plate_time)
+            plate_time_left = bot.PLATING_TIME - (self.state.clock.time() - bot.plate_time)
             info_lines.append(f"🍽️ Assemble le plat (encore {plate_time_left:.1f}s)")
         
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("chef_status", status_rect, tuple(info_lines[:3]))
+        
         for i, line in enumerate(info_lines):
             if i < 3:
-                text = self.font_small.render(line, True, (255, 255, 255))
+                text = text_cache.render(self.font_small, line, True, (255, 255, 255))
                 self.screen.blit(text, (status_rect.x + 10, status_rect.y + 5 + i * 15))
\ No newline at end of file
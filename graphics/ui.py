@@ -3,16 +3,20 @@ UI Renderer - Interface utilisateur simplifiée
 """
 import pygame
 from config import COLORS
+from utils.text_cache import text_cache
+from utils.fonts import fonts
 
 class UIRenderer:
-    def __init__(self, screen):
+    def __init__(self, screen, dirty_regions=None):
         self.screen = screen
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_tiny = pygame.font.Font(None, 18)
+        self.dirty_regions = dirty_regions
+        self.font_large = fonts.get(48)
+        self.font_medium = fonts.get(32)
+        self.font_small = fonts.get(24)
+        self.font_tiny = fonts.get(18)
 
-    def render_full_ui(self, score, timer, combo, bot, user_input, current_order_name, prepared_ingredients):
+    def render_full_ui(self, score, timer, combo, bot, user_input, current_order_name, prepared_ingredients,
+                       asset_manager=None, plated_dish=None):
         """Affiche l'interface complète"""
         width = self.screen.get_width()
         height = self.screen.get_height()
@@ -33,6 +37,10 @@ class UIRenderer:
         """Panneau principal avec infos de jeu"""
         panel_height = 80
         
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("main_panel", (0, 0, width, panel_height),
+                                     (score, f"{timer:.1f}", combo, current_order_name))
+        
         # Fond
         overlay = pygame.Surface((width, panel_height), pygame.SRCALPHA)
         overlay.fill((240, 240, 245, 220))
@@ -40,22 +48,22 @@ class UIRenderer:
         pygame.draw.rect(self.screen, COLORS['gold'], (0, 0, width, panel_height), 3)
         
         # Score
-        score_text = self.font_large.render(f"💰 {score}", True, (0, 0, 0))
+        score_text = text_cache.render(self.font_large, f"💰 {score}", True, (0, 0, 0))
         self.screen.blit(score_text, (20, 15))
         
         # Timer
         timer_color = COLORS['red'] if timer < 30 else (0, 0, 0)
-        timer_text = self.font_medium.render(f"⏱️ {timer:.1f}s", True, timer_color)
+        timer_text = text_cache.render(self.font_medium, f"⏱️ {timer:.1f}s", True, timer_color)
         self.screen.blit(timer_text, (200, 20))
         
         # Combo
         combo_color = COLORS['gold'] if combo > 0 else (0, 0, 0)
-        combo_text = self.font_medium.render(f"🔥 x{combo}", True, combo_color)
+        combo_text = text_cache.render(self.font_medium, f"🔥 x{combo}", True, combo_color)
         self.screen.blit(combo_text, (380, 20))
         
         # Commande actuelle
         if current_order_name:
-            order_text = self.font_medium.render(f"📋 {current_order_name}", True, COLORS['orange'])
+            order_text = text_cache.render(self.font_medium, f"📋 {current_order_name}", True, COLORS['orange'])
             self.screen.blit(order_text, (580, 25))
 
     def draw_prepared_ingredients_panel(self, prepared_ingredients):
@@ -63,6 +71,10 @@ class UIRenderer:
         panel_x, panel_y = 10, 90
         panel_width, panel_height = 180, 200
         
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("prepared_panel", (panel_x, panel_y, panel_width, panel_height),
+                                     tuple(prepared_ingredients or ()))
+        
         # Fond
         panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         panel_surf.fill((230, 245, 230, 200))
@@ -71,7 +83,7 @@ class UIRenderer:
                         (panel_x, panel_y, panel_width, panel_height), 2)
         
         # Titre
-        title = self.font_small.render("🥗 INGRÉDIENTS", True, COLORS['green'])
+        title = text_cache.render(self.font_small, "🥗 INGRÉDIENTS", True, COLORS['green'])
         self.screen.blit(title, (panel_x + 10, panel_y + 10))
         
         # Liste
@@ -82,10 +94,10 @@ class UIRenderer:
                 pygame.draw.circle(self.screen, COLORS['green'], 
                                  (panel_x + 20, y_pos + 10), 6)
                 # Nom
-                ing_text = self.font_tiny.render(ing_type[:15], True, (0, 0, 0))
+                ing_text = text_cache.render(self.font_tiny, ing_type[:15], True, (0, 0, 0))
                 self.screen.blit(ing_text, (panel_x + 35, y_pos + 2))
         else:
-            empty = self.font_tiny.render("Aucun", True, (150, 150, 150))
+            empty = text_cache.render(self.font_tiny, "Aucun", True, (150, 150, 150))
             self.screen.blit(empty, (panel_x + 20, panel_y + 50))
 
     def draw_bot_status_panel(self, bot):
@@ -94,6 +106,10 @@ class UIRenderer:
         panel_x = self.screen.get_width() - panel_width - 10
         panel_y = 90
         
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("bot_panel", (panel_x, panel_y, panel_width, panel_height),
+                                     (bot.get_state_text(), bot.get_state_color(), bot.inv, bot.preparing))
+        
         # Fond
         panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         panel_surf.fill((235, 235, 250, 200))
@@ -104,21 +120,21 @@ class UIRenderer:
                         (panel_x, panel_y, panel_width, panel_height), 3)
         
         # Titre
-        title = self.font_small.render("🤖 BOT", True, state_color)
+        title = text_cache.render(self.font_small, "🤖 BOT", True, state_color)
         self.screen.blit(title, (panel_x + 10, panel_y + 10))
         
         # État
-        state = self.font_tiny.render(bot.get_state_text(), True, (0, 0, 0))
+        state = text_cache.render(self.font_tiny, bot.get_state_text(), True, (0, 0, 0))
         self.screen.blit(state, (panel_x + 10, panel_y + 40))
         
         # Inventaire
         if bot.inv:
-            inv = self.font_tiny.render(f"Porte: {bot.inv}", True, COLORS['gold'])
+            inv = text_cache.render(self.font_tiny, f"Porte: {bot.inv}", True, COLORS['gold'])
             self.screen.blit(inv, (panel_x + 10, panel_y + 60))
         
         # En préparation
         if bot.preparing:
-            prep = self.font_tiny.render(f"Prépare: {bot.preparing}", True, COLORS['orange'])
+            prep = text_cache.render(self.font_tiny, f"Prépare: {bot.preparing}", True, COLORS['orange'])
             self.screen.blit(prep, (panel_x + 10, panel_y + 80))
 
     def draw_input_area(self, user_input, width, height):
@@ -128,15 +144,19 @@ class UIRenderer:
         
         # Fond
         input_rect = pygame.Rect(10, input_y, width - 20, input_height)
+        cursor_visible = int(pygame.time.get_ticks() / 500) % 2
+        
+        if self.dirty_regions is not None:
+            self.dirty_regions.track("input_area", input_rect, (user_input, cursor_visible))
         pygame.draw.rect(self.screen, (245, 245, 250), input_rect)
         pygame.draw.rect(self.screen, COLORS['white'], input_rect, 2)
         
         # Texte saisi
-        input_text = self.font_medium.render(user_input, True, (0, 0, 0))
+        input_text = text_cache.render(self.font_medium, user_input, True, (0, 0, 0))
         self.screen.blit(input_text, (input_rect.x + 10, input_rect.y + 8))
         
         # Curseur clignotant
-        if int(pygame.time.get_ticks() / 500) % 2:
+        if cursor_visible:
             cursor_x = input_rect.x + 10 + input_text.get_width()
             pygame.draw.line(self.screen, (0, 0, 0), 
                            (cursor_x, input_rect.y + 5), 
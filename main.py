@@ -4,12 +4,14 @@ Point d'entrée principal pour Mini Overcooked avec VRAIE COMPÉTITION MULTI-AGE
 ✅ Travail simultané - PAS D'ATTENTE
 ✅ Utilise OrderManager pour gérer les commandes multiples
 ✅ RENDU CORRIGÉ - Ingrédients bien visibles
+✅ pygame n'est importé qu'au lancement du jeu graphique (pas à l'import de main)
 """
 import sys
 import os
-import pygame
 import time
 
+STARTUP_TIME = time.perf_counter()  # début du rapport de démarrage
+
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 def main():
@@ -19,14 +21,23 @@ def main():
     print("Initialisation de l'interface graphique...")
     
     try:
+        import pygame
         import game_state
         from game.logic import GameLogic
         from graphics.kitchen import KitchenRenderer
         from graphics import ui, assets
+        from graphics.dirty import DirtyRegions
         from entities.bot import Bot, BotManager
         from entities.order_manager import OrderManager
+        from utils.clock import ManualClock
+        from utils.fonts import fonts
+        from utils.startup import StartupReport
+        from game.runner import SimulationRunner, SimulationProcess
+        from game.simulation import DEFAULT_CHEFS
         import config
         
+        startup = StartupReport(STARTUP_TIME)
+        startup.mark("imports")
         print("✓ Tous les modules chargés")
         
         # Initialiser pygame
@@ -34,17 +45,29 @@ def main():
         screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
         pygame.display.set_caption("Mini Overcooked - Vraie Compétition Multi-Agents")
         clock = pygame.time.Clock()
+        startup.mark("SDL")
+        
+        # Charger toutes les polices une fois pour toutes (pas pendant les frames)
+        font_count = fonts.warm_up()
         
         print("✓ Interface graphique initialisée")
         print(f"✓ Résolution: {config.WIDTH}x{config.HEIGHT}")
+        print(f"✓ Polices chargées: {font_count}")
+        
+        # Horloge de simulation : avance d'un pas fixe (1 / TICK_RATE) à chaque tick
+        game_clock = game_state.set_clock(ManualClock())
         
         # Initialiser le jeu
         game_state.initialize_ingredients()
         game_logic = GameLogic()
         
+        # Régions modifiées : seules celles-ci sont envoyées à l'écran (F8)
+        dirty_regions = DirtyRegions()
+        dirty_rendering = config.DIRTY_RECT_RENDERING
+        
         # Initialiser le renderer
         try:
-            kitchen_renderer = KitchenRenderer(screen)
+            kitchen_renderer = KitchenRenderer(screen, dirty_regions)
             print("✓ Renderer de cuisine initialisé")
         except Exception as e:
             print(f"❌ Erreur renderer: {e}")
@@ -57,13 +80,7 @@ def main():
         game_state.order_manager = order_manager
         
         # Recettes disponibles
-        game_state.available_ingredients = {
-            "salade": ["laitue", "tomate"],
-            "burger": ["pain", "steak", "laitue", "tomate"],
-            "sandwich": ["pain", "fromage", "tomate"],
-            "salade_complete": ["laitue", "tomate", "fromage"],
-            "burger_deluxe": ["pain", "steak", "laitue", "tomate", "fromage"]
-        }
+        game_state.available_ingredients = dict(config.competition_recipes)
         
         game_state.user_input = ""
         game_state.score = 0
@@ -115,7 +132,7 @@ def main():
         
         # Initialiser l'UI
         try:
-            ui_renderer = ui.UIRenderer(screen)
+            ui_renderer = ui.UIRenderer(screen, dirty_regions)
             print("✓ Interface utilisateur prête")
         except Exception as e:
             print(f"⚠ Erreur UI: {e}")
@@ -136,21 +153,38 @@ def main():
         print("  F4 - Debug: Info détaillée sur les chefs")
         print("  F5 - Debug: Classement des chefs")
         print("  F6 - Debug: Afficher le système de commandes")
+        print(f"  F7 - Vitesse du jeu ({' / '.join(f'x{s}' for s in config.TIME_SCALES)})")
+        print("  F8 - Rendu par régions modifiées (on/off)")
         print("  ESC - Quitter")
         
         running = True
         frame_count = 0
         last_debug_time = 0
         
+        # ⭐ La simulation avance seule (thread ou processus) ; la boucle ci-dessous ne fait
+        # que dessiner le dernier snapshot publié et transmettre les actions du joueur
+        if config.SIMULATION_MODE == "process":
+            # Mêmes chefs, simulés dans un autre processus (les managers locaux ne servent plus)
+            runner = SimulationProcess({"chefs": DEFAULT_CHEFS}, time_scale=config.TIME_SCALES[0])
+            runner.start()
+            print("✓ Simulation dans son propre processus (mémoire partagée)")
+        else:
+            runner = SimulationRunner(bot_manager, order_manager, game_logic, game_clock,
+                                      time_scale=config.TIME_SCALES[0])  # F7 pour accélérer la partie
+            if config.SIMULATION_MODE == "thread":
+                runner.start()
+                print("✓ Simulation dans son propre thread")
+        startup.mark("init")
+        
         # Liste des recettes pour F1 (test rapide)
         recipe_names = list(game_state.available_ingredients.keys())
         
-        while running and game_logic.is_running():
-            dt = clock.tick(60) / 1000.0
+        while running:
+            # Temps réel écoulé depuis la frame précédente
+            dt = clock.tick(config.RENDER_FPS) / 1000.0
             frame_count += 1
-            current_time = time.time()
             
-            # Gestion des événements
+            # Gestion des événements : les changements d'état sont exécutés par la simulation
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -166,7 +200,7 @@ def main():
                         
                         if order_name in game_state.available_ingredients:
                             ingredients = game_state.available_ingredients[order_name]
-                            order_manager.add_order(order_name, ingredients)
+                            runner.submit("add_order", order_name, ingredients)
                             print(f"✅ Commande '{order_name}' ajoutée à la file")
                         else:
                             print(f"❌ Recette inconnue: {order_name}")
@@ -180,150 +214,112 @@ def main():
                         for i in range(5):
                             recipe = random.choice(recipe_names)
                             ingredients = game_state.available_ingredients[recipe]
-                            order_manager.add_order(recipe, ingredients)
+                            runner.submit("add_order", recipe, ingredients)
                             print(f"  {i+1}. {recipe}")
                         print("✅ 5 commandes ajoutées - Les chefs vont s'affronter!")
                     
                     elif event.key == pygame.K_F2:
                         # Réinitialiser tout
-                        order_manager.reset()
-                        for bot in bot_manager.bots:
-                            bot.state = "idle"
-                            bot.inv = None
-                            bot.preparing = None
-                            bot.plating = False
-                        print("🔧 DEBUG: Système complètement réinialisé")
+                        runner.submit("reset_competition")
                     
                     elif event.key == pygame.K_F3:
                         # Afficher les zones
-                        print("\n🗺️ ZONES D'INTERACTION:")
-                        if bot_manager.bots:
-                            for name, coords in bot_manager.bots[0].interaction_zones.items():
-                                print(f"   - {name}: {coords}")
+                        runner.submit("print_interaction_zones")
                     
                     elif event.key == pygame.K_F4:
                         # Info détaillée des chefs
-                        print("\n👨‍🍳 INFO DÉTAILLÉE DES CHEFS:")
-                        for i, bot in enumerate(bot_manager.bots, 1):
-                            info = bot.get_debug_info()
-                            print(f"\nChef {i} - {info['name']}:")
-                            print(f"  Position: {info['position']}")
-                            print(f"  État: {bot.get_state_text()}")
-                            print(f"  Inventaire: {info['inventory']}")
-                            print(f"  En préparation: {info['preparing']}")
-                            print(f"  A une commande: {info['has_order']}")
-                            print(f"  Motivation: {info['motivation']}")
-                            
-                            progress = order_manager.get_chef_progress(bot.bot_id)
-                            if progress:
-                                print(f"  🍽️ Commande actuelle: {progress['order_name']}")
-                                print(f"     Progression: {progress['prepared']}/{progress['required']}")
-                                print(f"     Manquants: {progress['ingredients_needed']}")
+                        runner.submit("print_chef_details")
                     
                     elif event.key == pygame.K_F5:
                         # Classement
-                        print("\n🏆 CLASSEMENT DES CHEFS:")
-                        leaderboard = bot_manager.get_leaderboard()
-                        for i, entry in enumerate(leaderboard, 1):
-                            print(f"{i}. {entry['name']}: {entry['score']} points")
-                            print(f"   - Plats livrés: {entry['stats']['dishes_delivered']}")
+                        runner.submit("print_leaderboard")
                     
                     elif event.key == pygame.K_F6:
                         # Afficher le système de commandes
-                        print("\n📋 SYSTÈME DE COMMANDES:")
-                        status = order_manager.get_status_summary()
-                        print(f"  Disponibles: {status['available_orders']}")
-                        print(f"  Actives: {status['active_orders']}")
-                        print(f"  Complétées: {status['completed_orders']}")
-                        
-                        if status['chefs_working']:
-                            print("\n  👨‍🍳 Chefs en action:")
-                            for chef_info in status['chefs_working']:
-                                print(f"    - {chef_info['chef']}: {chef_info['order']} ({chef_info['progress']})")
-                        
-                        if order_manager.available_orders:
-                            print("\n  📋 File d'attente:")
-                            for i, order in enumerate(order_manager.available_orders[:5], 1):
-                                print(f"    {i}. {order['name']}")
+                        runner.submit("print_order_system")
+                    
+                    elif event.key == pygame.K_F7:
+                        # Changer la vitesse du jeu
+                        scales = config.TIME_SCALES
+                        time_scale = runner.time_scale
+                        next_index = (scales.index(time_scale) + 1) % len(scales) if time_scale in scales else 0
+                        runner.set_time_scale(scales[next_index])
+                        print(f"⏩ Vitesse du jeu: x{runner.time_scale}")
+                    
+                    elif event.key == pygame.K_F8:
+                        # Basculer entre display.update(rects) et flip() complet
+                        dirty_rendering = not dirty_rendering
+                        dirty_regions.invalidate()
+                        print(f"🖼️ Rendu par régions modifiées: {'activé' if dirty_rendering else 'désactivé'}")
                     
                     else:
                         # Ajouter le caractère
                         if event.unicode.isprintable():
                             game_state.user_input += event.unicode
 
-            # Logique du jeu
-            game_logic.update_timer()
-            game_logic.reduce_combo_over_time()
-            
             # ⭐ MISE À JOUR DU SYSTÈME MULTI-AGENTS ⭐
             try:
-                bot_manager.update()
-                
-                # Debug périodique (toutes les 5 secondes)
-                if current_time - last_debug_time >= 5.0:
-                    status = order_manager.get_status_summary()
-                    print(f"\n🤖 ÉTAT COMPÉTITION (temps: {game_state.timer:.1f}s):")
-                    print(f"  📋 Disponibles: {status['available_orders']} | Actives: {status['active_orders']} | Complétées: {status['completed_orders']}")
-                    
-                    for chef_info in status['chefs_working']:
-                        print(f"  ✅ {chef_info['chef']}: {chef_info['order']} ({chef_info['progress']})")
-                    
-                    for bot in bot_manager.bots:
-                        if not order_manager.get_chef_order(bot.bot_id):
-                            print(f"  ⏳ {bot.chef_name}: Cherche une commande...")
-                    
-                    last_debug_time = current_time
-                    
+                if config.SIMULATION_MODE == "loop":
+                    # Même pas fixe, exécuté dans la boucle de rendu
+                    runner.advance(dt)
             except Exception as e:
                 print(f"⚠ Erreur mise à jour multi-agents: {e}")
                 import traceback
                 traceback.print_exc()
+            
+            # Dernier état publié, chefs placés entre le tick précédent et le tick courant
+            snapshot = runner.render_snapshot()
+            running = running and snapshot.running
+            current_time = snapshot.clock.time()
+            
+            # Debug périodique (toutes les 5 secondes)
+            if current_time - last_debug_time >= 5.0:
+                print_competition_status(snapshot)
+                last_debug_time = current_time
 
             # 🎨 RENDU CORRIGÉ - Ingrédients bien visibles 🎨
-            screen.fill((40, 40, 40))
-            
             try:
                 if kitchen_renderer:
-                    # 1️⃣ Dessiner la cuisine UNE SEULE FOIS
-                    kitchen_renderer.draw_floor()
+                    kitchen_renderer.set_snapshot(snapshot)
+                    
+                    # 1️⃣ Fond statique pré-rendu (un seul blit, couvre tout l'écran)
+                    kitchen_renderer.draw_background()
                     kitchen_renderer.draw_individual_ingredient_stations(asset_manager)
                     kitchen_renderer.draw_work_station(asset_manager)
                     kitchen_renderer.draw_plating_station(asset_manager)
                     kitchen_renderer.draw_service_station()
                     
-                    # 2️⃣ Mettre à jour les zones pour tous les bots
-                    zones = kitchen_renderer.get_interaction_zones()
-                    for bot in bot_manager.bots:
-                        bot.update_interaction_zones(zones)
+                    # 2️⃣ Dessiner TOUS les chefs avec leurs ingrédients (PAR-DESSUS)
+                    for chef in snapshot.chefs:
+                        kitchen_renderer.draw_chef_enhanced(chef, asset_manager)
                     
-                    # 3️⃣ Dessiner TOUS les chefs avec leurs ingrédients (PAR-DESSUS)
-                    for bot in bot_manager.bots:
-                        kitchen_renderer.draw_chef_enhanced(bot, asset_manager)
-                    
-                    # 4️⃣ Afficher le statut du premier chef seulement
-                    if bot_manager.bots:
-                        kitchen_renderer.draw_chef_status(bot_manager.bots[0])
+                    # 3️⃣ Afficher le statut du premier chef seulement
+                    if snapshot.chefs:
+                        kitchen_renderer.draw_chef_status(snapshot.chefs[0])
                 else:
+                    screen.fill((40, 40, 40))
                     draw_basic_kitchen(screen)
-                    for bot in bot_manager.bots:
-                        bot.draw_chef(screen)
+                    for chef in snapshot.chefs:
+                        chef.draw_chef(screen)
+                    dirty_regions.invalidate()
             except Exception as e:
                 print(f"⚠ Erreur rendu cuisine: {e}")
                 import traceback
                 traceback.print_exc()
+                dirty_regions.invalidate()
                 draw_basic_kitchen(screen)
-                for bot in bot_manager.bots:
-                    bot.draw_chef(screen)
+                for chef in snapshot.chefs:
+                    chef.draw_chef(screen)
             
             # Rendu de l'UI
             try:
                 if ui_renderer:
-                    primary_bot = bot_manager.bots[0] if bot_manager.bots else None
+                    primary_chef = snapshot.chefs[0] if snapshot.chefs else None
                     ui_renderer.render_full_ui(
-                        game_state.score,
-                        game_state.timer,
-                        getattr(game_state, 'combo', 0),
-                        primary_bot,
+                        snapshot.score,
+                        snapshot.timer,
+                        snapshot.combo,
+                        primary_chef,
                         game_state.user_input,
                         None,  # Plus de current_order_name unique
                         [],    # Plus de prepared_ingredients unique
@@ -332,89 +328,27 @@ def main():
                     )
                     
                     # ⭐ Afficher le système de compétition à l'écran
-                    font = pygame.font.Font(None, 20)
-                    y_offset = 50
-                    
-                    # Classement
-                    leaderboard = bot_manager.get_leaderboard()
-                    for i, entry in enumerate(leaderboard):
-                        color = (255, 215, 0) if i == 0 else (200, 200, 200)
-                        medal = "🥇" if i == 0 else "🥈"
-                        text = f"{medal} {entry['name']}: {entry['score']}"
-                        score_surf = font.render(text, True, color)
-                        screen.blit(score_surf, (config.WIDTH - 220, y_offset + i * 25))
-                    
-                    # Système de commandes
-                    y_offset = 150
-                    status = order_manager.get_status_summary()
-                    
-                    queue_title = font.render("📋 SYSTÈME:", True, (255, 255, 255))
-                    screen.blit(queue_title, (config.WIDTH - 220, y_offset))
-                    y_offset += 25
-                    
-                    stats_text = f"Dispo: {status['available_orders']} | Actives: {status['active_orders']}"
-                    stats_surf = font.render(stats_text, True, (200, 200, 200))
-                    screen.blit(stats_surf, (config.WIDTH - 220, y_offset))
-                    y_offset += 25
-                    
-                    completed_text = f"Complétées: {status['completed_orders']}"
-                    completed_surf = font.render(completed_text, True, (150, 255, 150))
-                    screen.blit(completed_surf, (config.WIDTH - 220, y_offset))
-                    y_offset += 30
-                    
-                    # Commandes actives
-                    if status['chefs_working']:
-                        active_title = font.render("⚙️ EN COURS:", True, (255, 255, 100))
-                        screen.blit(active_title, (config.WIDTH - 220, y_offset))
-                        y_offset += 20
-                        
-                        for chef_info in status['chefs_working']:
-                            chef_text = f"• {chef_info['chef'][:8]}:"
-                            chef_surf = font.render(chef_text, True, (200, 200, 200))
-                            screen.blit(chef_surf, (config.WIDTH - 215, y_offset))
-                            y_offset += 18
-                            
-                            order_text = f"  {chef_info['order']} {chef_info['progress']}"
-                            order_surf = font.render(order_text, True, (150, 255, 150))
-                            screen.blit(order_surf, (config.WIDTH - 210, y_offset))
-                            y_offset += 22
-                    
-                    y_offset += 10
-                    
-                    # File d'attente
-                    if order_manager.available_orders:
-                        queue_title2 = font.render("⏳ FILE:", True, (255, 200, 100))
-                        screen.blit(queue_title2, (config.WIDTH - 220, y_offset))
-                        y_offset += 20
-                        
-                        for i, order in enumerate(order_manager.available_orders[:3], 1):
-                            order_text = f"{i}. {order['name']}"
-                            order_surf = font.render(order_text, True, (200, 200, 150))
-                            screen.blit(order_surf, (config.WIDTH - 210, y_offset))
-                            y_offset += 18
-                        
-                        if len(order_manager.available_orders) > 3:
-                            more_text = f"... +{len(order_manager.available_orders) - 3}"
-                            more_surf = font.render(more_text, True, (150, 150, 150))
-                            screen.blit(more_surf, (config.WIDTH - 210, y_offset))
+                    draw_competition_hud(screen, snapshot, dirty_regions)
                     
                 else:
-                    draw_basic_ui(screen, game_state.score, game_state.timer)
+                    draw_basic_ui(screen, snapshot.score, snapshot.timer)
+                    dirty_regions.invalidate()
             except Exception as e:
                 print(f"⚠ Erreur rendu UI: {e}")
-                draw_basic_ui(screen, game_state.score, game_state.timer)
+                draw_basic_ui(screen, snapshot.score, snapshot.timer)
+                dirty_regions.invalidate()
             
-            pygame.display.flip()
-        
-        # Fin de partie
-        game_logic.stop()
-        stats = game_logic.calculate_final_stats()
+            dirty_regions.present(screen, dirty_rendering)
+            
+            if frame_count == 1:
+                startup.mark("1re frame")
+                print(f"⏱ Démarrage: {startup.format()}")
         
-        # Ajouter stats multi-agents
-        stats['total_chefs'] = len(bot_manager.bots)
-        stats['leaderboard'] = bot_manager.get_leaderboard()
+        # Fin de partie : la simulation s'arrête avant de lire l'état final
+        # (stats + classement multi-agents, calculés là où tourne la simulation)
+        stats = runner.final_stats()
         
-        show_game_over_screen(screen, stats, bot_manager)
+        show_game_over_screen(screen, stats)
         time.sleep(3)
     
     except ImportError as e:
@@ -427,14 +361,18 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        pygame.quit()
+        if "pygame" in sys.modules:
+            sys.modules["pygame"].quit()
         print("Au revoir !")
 
 
 def draw_basic_kitchen(screen):
     """Rendu basique si le renderer échoue"""
     try:
+        import pygame
         import config
+        from utils.text_cache import text_cache
+        from utils.fonts import fonts
         
         screen.fill((120, 140, 120))
         
@@ -450,7 +388,7 @@ def draw_basic_kitchen(screen):
         pygame.draw.rect(screen, (255, 200, 100), (700, 120, 120, 300))
         pygame.draw.rect(screen, (200, 150, 50), (700, 120, 120, 300), 3)
         
-        font = pygame.font.Font(None, 24)
+        font = fonts.get(24)
         
         labels = [
             ("STOCKAGE", (150, 100)),
@@ -460,7 +398,7 @@ def draw_basic_kitchen(screen):
         ]
         
         for text, pos in labels:
-            label = font.render(text, True, (255, 255, 255))
+            label = text_cache.render(font, text, True, (255, 255, 255))
             screen.blit(label, pos)
             
     except Exception as e:
@@ -468,58 +406,159 @@ def draw_basic_kitchen(screen):
         print(f"Erreur draw_basic_kitchen: {e}")
 
 
+def print_competition_status(snapshot):
+    """Debug périodique : état de la compétition au dernier tick"""
+    status = snapshot.order_status
+    print(f"\n🤖 ÉTAT COMPÉTITION (temps: {snapshot.timer:.1f}s):")
+    print(f"  📋 Disponibles: {status['available_orders']} | Actives: {status['active_orders']} | Complétées: {status['completed_orders']} | Expirées: {status['expired_orders']}")
+    
+    for chef_info in status['chefs_working']:
+        print(f"  ✅ {chef_info['chef']}: {chef_info['order']} ({chef_info['progress']})")
+    
+    for chef in snapshot.chefs:
+        if not chef.has_order:
+            print(f"  ⏳ {chef.chef_name}: Cherche une commande...")
+
+
+def draw_competition_hud(screen, snapshot, dirty_regions=None):
+    """Affiche le classement et le système de commandes à l'écran (depuis un KitchenSnapshot)"""
+    import config
+    from utils.text_cache import text_cache
+    from utils.fonts import fonts
+    
+    font = fonts.get(20)
+    y_offset = 50
+    
+    # Classement
+    leaderboard = snapshot.leaderboard
+    for i, entry in enumerate(leaderboard):
+        color = (255, 215, 0) if i == 0 else (200, 200, 200)
+        medal = "🥇" if i == 0 else "🥈"
+        text = f"{medal} {entry['name']}: {entry['score']}"
+        score_surf = text_cache.render(font, text, True, color)
+        screen.blit(score_surf, (config.WIDTH - 220, y_offset + i * 25))
+    
+    # Système de commandes
+    y_offset = 150
+    status = snapshot.order_status
+    
+    queue_title = text_cache.render(font, "📋 SYSTÈME:", True, (255, 255, 255))
+    screen.blit(queue_title, (config.WIDTH - 220, y_offset))
+    y_offset += 25
+    
+    stats_text = f"Dispo: {status['available_orders']} | Actives: {status['active_orders']}"
+    stats_surf = text_cache.render(font, stats_text, True, (200, 200, 200))
+    screen.blit(stats_surf, (config.WIDTH - 220, y_offset))
+    y_offset += 25
+    
+    completed_text = f"Complétées: {status['completed_orders']}"
+    completed_surf = text_cache.render(font, completed_text, True, (150, 255, 150))
+    screen.blit(completed_surf, (config.WIDTH - 220, y_offset))
+    y_offset += 30
+    
+    # Commandes actives
+    if status['chefs_working']:
+        active_title = text_cache.render(font, "⚙️ EN COURS:", True, (255, 255, 100))
+        screen.blit(active_title, (config.WIDTH - 220, y_offset))
+        y_offset += 20
+    
+        for chef_info in status['chefs_working']:
+            chef_text = f"• {chef_info['chef'][:8]}:"
+            chef_surf = text_cache.render(font, chef_text, True, (200, 200, 200))
+            screen.blit(chef_surf, (config.WIDTH - 215, y_offset))
+            y_offset += 18
+    
+            order_text = f"  {chef_info['order']} {chef_info['progress']}"
+            order_surf = text_cache.render(font, order_text, True, (150, 255, 150))
+            screen.blit(order_surf, (config.WIDTH - 210, y_offset))
+            y_offset += 22
+    
+    y_offset += 10
+    
+    # File d'attente (les QUEUE_HEAD premières commandes sont dans le snapshot)
+    queued = status['available_orders']
+    if queued:
+        queue_title2 = text_cache.render(font, "⏳ FILE:", True, (255, 200, 100))
+        screen.blit(queue_title2, (config.WIDTH - 220, y_offset))
+        y_offset += 20
+    
+        for i, order_name in enumerate(snapshot.queue_head, 1):
+            order_text = f"{i}. {order_name}"
+            order_surf = text_cache.render(font, order_text, True, (200, 200, 150))
+            screen.blit(order_surf, (config.WIDTH - 210, y_offset))
+            y_offset += 18
+    
+        if queued > len(snapshot.queue_head):
+            more_text = f"... +{queued - len(snapshot.queue_head)}"
+            more_surf = text_cache.render(font, more_text, True, (150, 150, 150))
+            screen.blit(more_surf, (config.WIDTH - 210, y_offset))
+    
+    if dirty_regions is not None:
+        hud_state = (
+            tuple((entry['name'], entry['score']) for entry in leaderboard),
+            status['available_orders'], status['active_orders'], status['completed_orders'],
+            tuple((info['chef'], info['order'], info['progress']) for info in status['chefs_working']),
+            snapshot.queue_head
+        )
+        dirty_regions.track("competition_hud", (config.WIDTH - 220, 50, 220, y_offset + 20 - 50), hud_state)
+
+
 def draw_basic_ui(screen, score, timer):
     """Interface basique si l'UI échoue"""
     try:
         import config
-        font = pygame.font.Font(None, 36)
+        from utils.text_cache import text_cache
+        from utils.fonts import fonts
+        font = fonts.get(36)
         
-        score_text = font.render(f"Score: {score}", True, (255, 255, 255))
+        score_text = text_cache.render(font, f"Score: {score}", True, (255, 255, 255))
         screen.blit(score_text, (10, 10))
         
-        timer_text = font.render(f"Temps: {timer:.1f}s", True, (255, 255, 255))
+        timer_text = text_cache.render(font, f"Temps: {timer:.1f}s", True, (255, 255, 255))
         screen.blit(timer_text, (10, 50))
         
         import game_state
         if hasattr(game_state, 'user_input'):
-            input_text = font.render(f"Tapez: {game_state.user_input}_", True, (200, 200, 200))
+            input_text = text_cache.render(font, f"Tapez: {game_state.user_input}_", True, (200, 200, 200))
             screen.blit(input_text, (10, config.HEIGHT - 40))
             
     except Exception as e:
         print(f"Erreur draw_basic_ui: {e}")
 
 
-def show_game_over_screen(screen, stats, bot_manager):
+def show_game_over_screen(screen, stats):
     """Écran de fin de partie avec classement compétitif"""
     try:
-        import game_state
+        import pygame
         import config
+        from utils.text_cache import text_cache
+        from utils.fonts import fonts
         
         overlay = pygame.Surface((config.WIDTH, config.HEIGHT))
         overlay.set_alpha(180)
         overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
         
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
+        font_large = fonts.get(48)
+        font_medium = fonts.get(32)
+        font_small = fonts.get(24)
         
-        title = font_large.render("PARTIE TERMINÉE!", True, (255, 215, 0))
+        title = text_cache.render(font_large, "PARTIE TERMINÉE!", True, (255, 215, 0))
         screen.blit(title, title.get_rect(center=(config.WIDTH//2, 100)))
         
         y_offset = 160
-        score_text = f"Score Total: {game_state.score}"
-        rendered = font_medium.render(score_text, True, (255, 255, 255))
+        score_text = f"Score Total: {stats['score']}"
+        rendered = text_cache.render(font_medium, score_text, True, (255, 255, 255))
         screen.blit(rendered, rendered.get_rect(center=(config.WIDTH//2, y_offset)))
         y_offset += 40
         
         # Classement compétitif
         y_offset += 20
-        winner_title = font_large.render("🏆 CLASSEMENT FINAL 🏆", True, (255, 215, 0))
+        winner_title = text_cache.render(font_large, "🏆 CLASSEMENT FINAL 🏆", True, (255, 215, 0))
         screen.blit(winner_title, winner_title.get_rect(center=(config.WIDTH//2, y_offset)))
         y_offset += 50
         
-        leaderboard = bot_manager.get_leaderboard()
+        leaderboard = stats['leaderboard']
         for i, entry in enumerate(leaderboard):
             if i == 0:
                 medal = "🥇"
@@ -535,16 +574,16 @@ def show_game_over_screen(screen, stats, bot_manager):
                 prefix = ""
             
             chef_text = f"{medal} {prefix}{entry['name']}: {entry['score']} points"
-            chef_surf = font_medium.render(chef_text, True, color)
+            chef_surf = text_cache.render(font_medium, chef_text, True, color)
             screen.blit(chef_surf, chef_surf.get_rect(center=(config.WIDTH//2, y_offset)))
             y_offset += 35
             
             stats_text = f"Plats livrés: {entry['stats']['dishes_delivered']}"
-            stats_surf = font_small.render(stats_text, True, (200, 200, 200))
+            stats_surf = text_cache.render(font_small, stats_text, True, (200, 200, 200))
             screen.blit(stats_surf, stats_surf.get_rect(center=(config.WIDTH//2, y_offset)))
             y_offset += 30
         
-        special_msg = font_medium.render("Système Multi-Agents Compétitif!", True, (100, 255, 100))
+        special_msg = text_cache.render(font_medium, "Système Multi-Agents Compétitif!", True, (100, 255, 100))
         screen.blit(special_msg, special_msg.get_rect(center=(config.WIDTH//2, y_offset + 20)))
         
         pygame.display.flip()
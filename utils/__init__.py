@@ -3,5 +3,10 @@ Utils module - Fonctions utilitaires
 """
 
 from .helpers import distance, print_startup_message
+from .clock import WallClock, ManualClock, ScaledClock
+from .text_cache import TextCache, text_cache
+from .fonts import FontRegistry, fonts
+from .startup import StartupReport
 
-__all__ = ['distance', 'print_startup_message']
\ No newline at end of file
+__all__ = ['distance', 'print_startup_message', 'WallClock', 'ManualClock', 'ScaledClock',
+           'TextCache', 'text_cache', 'FontRegistry', 'fonts', 'StartupReport']
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Horloges de simulation - Source de temps unique pour la logique du jeu
+"""
+import time
+
+
+class WallClock:
+    """Horloge murale : temps réel (équivalent à time.time())"""
+
+    def time(self):
+        """Retourne le temps courant en secondes"""
+        return time.time()
+
+
+class ManualClock:
+    """Horloge manuelle : le temps n'avance que via advance()"""
+
+    def __init__(self, start=0.0):
+        self.current = start
+
+    def time(self):
+        """Retourne le temps simulé courant en secondes"""
+        return self.current
+
+    def advance(self, dt):
+        """Avance le temps simulé de dt secondes"""
+        self.current += dt
+        return self.current
+
+
+class ScaledClock:
+    """
+    Horloge dilatée : le temps avance scale fois plus vite que la source
+    Changer d'échelle ne provoque aucun saut dans le temps
+    """
+
+    def __init__(self, scale=1.0, source=None):
+        self.source = source or WallClock()
+        self.scale = scale
+        self.anchor_source = self.source.time()
+        self.anchor_time = self.anchor_source
+
+    def time(self):
+        """Retourne le temps dilaté courant en secondes"""
+        return self.anchor_time + (self.source.time() - self.anchor_source) * self.scale
+
+    def set_scale(self, scale):
+        """Change le facteur de dilatation sans discontinuité"""
+        self.anchor_time = self.time()
+        self.anchor_source = self.source.time()
+        self.scale = scale
+        return self.scale
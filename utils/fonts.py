@@ -0,0 +1,43 @@
+"""
+Registre de polices - Chaque (police, taille) n'est chargée qu'une fois
+"""
+from config import FONT_SIZES
+
+
+class FontRegistry:
+    """
+    Polices partagées par tous les renderers
+
+    pygame.font.Font relit et analyse le fichier de police à chaque
+    construction : le registre garde un seul objet par (police, taille).
+    Partager les objets permet aussi au cache de texte de les reconnaître.
+    """
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, size, face=None):
+        """Retourne la police (face, size) ; face=None pour la police par défaut"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            import pygame
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        return font
+
+    def warm_up(self, sizes=FONT_SIZES, face=None):
+        """Charge d'avance les tailles utilisées (au démarrage, hors boucle de jeu)"""
+        for size in sizes:
+            self.get(size, face)
+        return len(self.fonts)
+
+    def clear(self):
+        """Oublie toutes les polices (à appeler après pygame.quit())"""
+        self.fonts.clear()
+
+
+# Registre partagé par tous les renderers
+fonts = FontRegistry()
@@ -0,0 +1,33 @@
+"""
+Rapport de démarrage - Durée de chaque étape jusqu'à la première frame
+"""
+import time
+
+
+class StartupReport:
+    """
+    Chronomètre les étapes du démarrage (imports, SDL, init, première frame)
+
+    Chaque mark() enregistre le temps écoulé depuis l'étape précédente.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.steps = []
+
+    def mark(self, name):
+        """Termine l'étape name"""
+        now = time.perf_counter()
+        self.steps.append((name, (now - self.last) * 1000))
+        self.last = now
+
+    def total_ms(self):
+        """Durée totale depuis le début du chronomètre"""
+        return (self.last - self.start) * 1000
+
+    def format(self):
+        """Une ligne : 'imports 120 ms | SDL 80 ms | ... | total 230 ms'"""
+        parts = [f"{name} {ms:.0f} ms" for name, ms in self.steps]
+        parts.append(f"total {self.total_ms():.0f} ms")
+        return " | ".join(parts)
@@ -0,0 +1,59 @@
+"""
+Cache de texte - Surfaces de texte rendues partagées par tous les renderers
+"""
+from collections import OrderedDict
+
+from config import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Cache LRU borné des surfaces produites par font.render()
+
+    Clé : (police, texte, couleur, antialias). Un texte inchangé d'une frame
+    à l'autre ("Dispo: 3 | Actives: 2", noms des chefs, score) n'est plus
+    rastérisé qu'une seule fois. Les surfaces retournées sont partagées :
+    ne pas les modifier.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Équivalent à font.render(text, antialias, color), avec cache"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def get_stats(self):
+        """Compteurs du cache"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.surfaces),
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Cache partagé par tous les renderers
+text_cache = TextCache()